@@ -0,0 +1,366 @@
+# Integrate the biochemical model of all the stimulated spines as one system.
+
+"""
+The reaction network is read once from the eml (see emlNetwork) and all
+the spines are integrated together as an (n_spines x n_species) array with a
+stiff solver, using the block diagonal sparsity of the jacobian.
+
+The values are kept as number of molecules and the processes follow the
+E-Cell definitions, so the results are comparable with the EcellManager
+ones. Every spine gets a BatchedSpineManager, which exposes the same
+attributes of the EcellManager used by the Runner (ca_in, ca_leak, ca_pump,
+ampar_P, loggers, ses.run, ...).
+
+To keep the spines in sync, all the fluxes have to be set before advancing
+any of them: the first spine asking to advance integrates the whole batch,
+the others find it already there.
+"""
+
+import numpy
+import scipy.sparse
+from scipy.integrate import solve_ivp
+
+import logging
+logger = logging.getLogger(__name__)
+
+from emlNetwork import EmlNetwork, get_name, N_A
+
+
+class BatchedEcellManager(object):
+    """Integrate n_spines copies of the network in one go"""
+
+    def __init__(self, filename, n_spines, rtol=1e-6, atol=1e-6,
+                 method='BDF'):
+        self.network = EmlNetwork(filename)
+        self.n_spines = n_spines
+        self.rtol = rtol
+        self.atol = atol
+        self.method = method
+        self.time = 0.0
+        network = self.network
+
+        # Values
+        self.var_index = dict([(var, i) for i, var in enumerate(network.variables)])
+        initial = numpy.array([network.values[var] for var in network.variables])
+        self.values = numpy.tile(initial, (n_spines, 1))
+        self.size_n_a = numpy.array([network.get_size_n_a(var)
+                                     for var in network.variables])
+        self.states = numpy.array([self.var_index[var]
+                                   for var in network.get_state_variables()])
+
+        # Properties of the processes, one column each
+        self.prop_index = {}
+        props = []
+        for process in network.fluxes:
+            for name, value in sorted(process.properties.items()):
+                self.prop_index[(process.id, name)] = len(props)
+                props.append(value)
+        self.params = numpy.tile(numpy.array(props), (n_spines, 1))
+
+        self._build_stoichiometry()
+        self._build_mass_action()
+        self._build_expressions()
+        self._build_jac_sparsity()
+        self._assign(self.values, self.params)
+
+        self.tracked = []
+        self.log_times = []
+        self.log_values = []
+
+    def _build_stoichiometry(self):
+        """Sparse matrix n_processes x n_variables"""
+        rows, cols, coefs = [], [], []
+        for i, process in enumerate(self.network.fluxes):
+            for var, coef in process.get_stoichiometry():
+                rows.append(i)
+                cols.append(self.var_index[var])
+                coefs.append(coef)
+        shape = (len(self.network.fluxes), len(self.network.variables))
+        self.stoichiometry = scipy.sparse.csr_matrix((coefs, (rows, cols)),
+                                                     shape=shape)
+
+    def _build_mass_action(self):
+        """Gather the substrates of the mass action processes in an index
+        array, padded with a column of ones."""
+        mass = [(i, p) for i, p in enumerate(self.network.fluxes)
+                if p.klass == 'MassActionFluxProcess']
+        substrates = []
+        for i, process in mass:
+            subs = []
+            for var, coef in process.references.values():
+                subs.extend([self.var_index[var]] * -min(coef, 0))
+            substrates.append(subs)
+        order = max([len(s) for s in substrates] + [1])
+        ones = len(self.network.variables)
+        self.mass_index = numpy.array([i for i, p in mass], dtype=int)
+        self.mass_k = numpy.array([self.prop_index[(p.id, 'k')] for i, p in mass],
+                                  dtype=int)
+        self.mass_size_n_a = numpy.array([self.network.sizes[p.system_path] * N_A
+                                          for i, p in mass])
+        self.mass_substrates = numpy.array([s + [ones] * (order - len(s))
+                                            for s in substrates], dtype=int)
+
+    def _build_expressions(self):
+        """Generate the python code of the assignments and of the other
+        fluxes, vectorized on the spines."""
+        network = self.network
+        variable_value = lambda var: "V[:, %d]" %self.var_index[var]
+        property_value = lambda p, name: "P[:, %d]" %self.prop_index[(p.id, name)]
+
+        lines = ["def assign(V, P):"]
+        for process in network.assignments:
+            target = self.var_index[network.get_assignment_target(process)]
+            expression = network.translate(process,
+                                           network.get_assignment_expression(process),
+                                           variable_value, property_value)
+            lines.append("    V[:, %d] = %s" %(target, expression))
+        lines.append("    return V")
+
+        lines.append("def fluxes(V, P, velocity):")
+        for i, process in enumerate(network.fluxes):
+            if process.klass == 'MassActionFluxProcess':
+                continue
+            expression = network.get_flux_expression(process, variable_value,
+                                                     property_value)
+            lines.append("    velocity[:, %d] = %s" %(i, expression))
+        lines.append("    return velocity")
+
+        namespace = {'pow' : numpy.power}
+        code = compile("\n".join(lines), '<%s>' %network.filename, 'exec')
+        exec code in namespace
+        self._assign = namespace['assign']
+        self._fluxes = namespace['fluxes']
+
+    def _build_jac_sparsity(self):
+        """Block diagonal sparsity: the spines are independent"""
+        network = self.network
+        state_pos = dict([(network.variables[col], i)
+                          for i, col in enumerate(self.states)])
+        n_states = len(self.states)
+        block = numpy.zeros((n_states, n_states), dtype=bool)
+        for process in network.fluxes:
+            deps = [state_pos[v] for v in network.get_dependencies(process)
+                    if v in state_pos]
+            for var, coef in process.get_stoichiometry():
+                if var in state_pos:
+                    block[state_pos[var], deps] = True
+        block[numpy.arange(n_states), numpy.arange(n_states)] = True
+        self.jac_sparsity = scipy.sparse.kron(scipy.sparse.identity(self.n_spines),
+                                              scipy.sparse.csr_matrix(block),
+                                              format='csr')
+
+    def velocities(self, values):
+        """Velocity of all the processes [molecules/s], n_spines x n_processes"""
+        velocity = numpy.empty((self.n_spines, len(self.network.fluxes)))
+        conc = numpy.hstack((values / self.size_n_a,
+                             numpy.ones((self.n_spines, 1))))
+        velocity[:, self.mass_index] = (self.params[:, self.mass_k] *
+                                        self.mass_size_n_a *
+                                        conc[:, self.mass_substrates].prod(axis=2))
+        return self._fluxes(values, self.params, velocity)
+
+    def _rhs(self, t, y):
+        values = self._work
+        values[:, self.states] = y.reshape(self.n_spines, -1)
+        self._assign(values, self.params)
+        velocity = self.velocities(values)
+        derivative = self.stoichiometry.T.dot(velocity.T).T
+        return derivative[:, self.states].ravel()
+
+    def run(self, delta_t):
+        """Advance all the spines of delta_t [s]"""
+        if delta_t <= 0:
+            return
+        self._work = self.values.copy()
+        y0 = self.values[:, self.states].ravel()
+        sol = solve_ivp(self._rhs, (self.time, self.time + delta_t), y0,
+                        method=self.method, rtol=self.rtol, atol=self.atol,
+                        jac_sparsity=self.jac_sparsity)
+        if not sol.success:
+            raise RuntimeError("Batched integration failed at %s: %s" %(self.time,
+                                                                       sol.message))
+        self.values[:, self.states] = sol.y[:, -1].reshape(self.n_spines, -1)
+        self._assign(self.values, self.params)
+        self.time += delta_t
+        logger.debug("Batched biochemical time: %s, rhs evaluations: %s" %(self.time,
+                                                                            sol.nfev))
+        self.log()
+
+    def advance_to(self, time):
+        """Advance the batch to time [s], if not already there."""
+        # The time is accumulated in the same way by all the spines, so
+        # a tolerance on the float sum is enough.
+        if time > self.time + 1e-12:
+            self.run(time - self.time)
+
+    def track(self, variables):
+        """Log the variables (names) after each run"""
+        self.tracked = [self.var_index['Variable:/Spine:' + v] for v in variables]
+        self.log_times = []
+        self.log_values = []
+        self.log()
+
+    def set_time(self, time):
+        """Move the batch to time [s] without integrating, after setting 
+        the values of an equilibrium in the spines"""
+        self.time = time
+        self.log()
+
+    def log(self):
+        if self.tracked:
+            if self.log_times and self.log_times[-1] == self.time:
+                # Values set at the same time (set_time)
+                self.log_values[-1] = self.values[:, self.tracked].copy()
+                return
+            self.log_times.append(self.time)
+            self.log_values.append(self.values[:, self.tracked].copy())
+
+    def get_logged(self, spine_index, variable, molar_conc=False):
+        """Return the time course of the variable in the spine as an
+        array n x 2 (time, value), like the E-Cell loggers."""
+        col = self.tracked.index(self.var_index['Variable:/Spine:' + variable])
+        values = numpy.array(self.log_values)[:, spine_index, col]
+        if molar_conc:
+            values = values / self.size_n_a[self.tracked[col]]
+        return numpy.column_stack((self.log_times, values))
+
+    def spine_manager(self, spine_index):
+        """Return the object to use as ecellMan in the spine"""
+        return BatchedSpineManager(self, spine_index)
+
+
+class EntityStub(object):
+    """Get and set the properties of one entity in one spine of the batch,
+    with the E-Cell stub syntax: stub['Value'] = 10"""
+
+    def __init__(self, batch, spine_index, full_id):
+        self.batch = batch
+        self.spine_index = spine_index
+        self.full_id = full_id
+        self.id = get_name(full_id)
+
+    def __getitem__(self, name):
+        return self.getProperty(name)
+
+    def __setitem__(self, name, value):
+        self.setProperty(name, value)
+
+    def getProperty(self, name):
+        batch = self.batch
+        if self.full_id.startswith('Variable'):
+            col = batch.var_index[self.full_id]
+            value = batch.values[self.spine_index, col]
+            if name == 'MolarConc':
+                value = value / batch.size_n_a[col]
+            return value
+        return batch.params[self.spine_index, batch.prop_index[(self.id, name)]]
+
+    def setProperty(self, name, value):
+        batch = self.batch
+        if self.full_id.startswith('Variable'):
+            col = batch.var_index[self.full_id]
+            if name == 'MolarConc':
+                value = value * batch.size_n_a[col]
+            batch.values[self.spine_index, col] = value
+        else:
+            batch.params[self.spine_index, batch.prop_index[(self.id, name)]] = value
+
+
+class LoggerStub(object):
+    """Read the batch log of one variable in one spine"""
+
+    def __init__(self, batch, spine_index, variable, molar_conc=False):
+        self.batch = batch
+        self.spine_index = spine_index
+        self.variable = variable
+        self.molar_conc = molar_conc
+
+    def getData(self):
+        return self.batch.get_logged(self.spine_index, self.variable,
+                                     self.molar_conc)
+
+
+class BatchedSession(object):
+    """The part of the E-Cell Session used by the Runner"""
+
+    def __init__(self, batch, spine_index):
+        self.batch = batch
+        self.spine_index = spine_index
+        self.time = batch.time
+
+    def run(self, delta_t):
+        self.time += delta_t
+        self.batch.advance_to(self.time)
+
+    def getCurrentTime(self):
+        return self.time
+
+    def createEntityStub(self, full_id):
+        return EntityStub(self.batch, self.spine_index, full_id)
+
+    def getVariableValues(self):
+        """Dictionary full id -> Value of the variables of the spine"""
+        batch = self.batch
+        return dict([(var, batch.values[self.spine_index, i])
+                     for i, var in enumerate(batch.network.variables)])
+
+    def setVariableValues(self, values):
+        """Set the Values of a dictionary full id -> Value, as returned by
+        getVariableValues. The ids not in the model (the SIZE of the
+        E-Cell systems) are skipped."""
+        batch = self.batch
+        for full_id, value in values.items():
+            if batch.var_index.has_key(full_id):
+                batch.values[self.spine_index, batch.var_index[full_id]] = value
+
+
+class BatchedSpineManager(object):
+    """Drop-in replacement of the EcellManager for one spine of the batch"""
+
+    def __init__(self, batch, spine_index):
+        self.batch = batch
+        self.ses = BatchedSession(batch, spine_index)
+        self.molToTrack = ('ca',
+                           'moles_bound_ca_per_moles_cam',
+                           'Rbar',
+                           'PP2Bbar',
+                           'CaMKIIbar',
+                           'PP1abar', # Active PP1/Total PP1
+                           'AMPAR', #
+                           'AMPAR_P',
+                           'D',
+                           'totDp',
+                           'Dpbar'
+                           )
+        self.ca = self.ses.createEntityStub('Variable:/Spine:ca')
+        self.CaMKIIbar = self.ses.createEntityStub('Variable:/Spine:CaMKIIbar')
+        self.ampar_P = self.ses.createEntityStub('Variable:/Spine:AMPAR_P')
+        self.ca_in = self.ses.createEntityStub('Process:/Spine:ca_in')
+        self.ca_leak = self.ses.createEntityStub('Process:/Spine:ca_leak')
+        self.ca_pump = self.ses.createEntityStub('Process:/Spine:ca_pump')
+
+    def createLoggers(self):
+        """Log the same species of the EcellManager"""
+        if not self.batch.tracked:
+            self.batch.track(self.molToTrack)
+        spine_index = self.ses.spine_index
+        loggers = {}
+        for mol in self.molToTrack:
+            loggers[mol] = LoggerStub(self.batch, spine_index, mol)
+        loggers['ca_conc'] = LoggerStub(self.batch, spine_index, 'ca',
+                                        molar_conc=True)
+        self.loggers = loggers
+
+    def set_equilibrium(self, values, time):
+        """Set the values of an equilibrium reached at `time` [s], without 
+        integrating. The whole batch moves to `time`, so all the spines 
+        have to be set."""
+        self.ses.setVariableValues(values)
+        self.ses.time = time
+        self.batch.set_time(time)
+
+    def converToTimeCourses(self):
+        timeCourses = {}
+        for key in self.loggers:
+            timeCourses[key] = self.loggers[key].getData()
+        self.timeCourses = timeCourses
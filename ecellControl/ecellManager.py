@@ -6,6 +6,7 @@
 
 try:
     from mySession import Session
+    import ecell.eml as eml
     import ecell.ecs
     import ecell.config
     import ecell.emc
@@ -14,8 +15,28 @@ except ImportError, e:
     
 import os
 import numpy
+from loggerReader import LoggerReader
 from sumatra.external.NeuroTools import parameters
 
+# Parsed models: (realpath, mtime) -> eml.Eml
+_eml_cache = {}
+
+def load_eml(filename):
+    """Return the parsed eml of the file. The file is parsed only the first 
+    time, the following calls get the same Eml instance until the file 
+    changes on disk. The Session only reads the Eml, so it can be shared."""
+    path = os.path.realpath(filename)
+    key = (path, os.path.getmtime(path))
+    if not _eml_cache.has_key(key):
+        for old_key in [k for k in _eml_cache if k[0] == path]:
+            del _eml_cache[old_key] # the file has changed
+        f = open(path)
+        try:
+            _eml_cache[key] = eml.Eml(f)
+        finally:
+            f.close()
+    return _eml_cache[key]
+
 class EcellManager():
     """Control and instatiate the ecell simulator embedding it in an handy python object"""
     
@@ -27,8 +48,10 @@ class EcellManager():
         else:
             self.ses = Session(self.sim)
         
-        # Load the model
-        self.ses.loadModel(filename)
+        # Load the model, parsed once for all the spines
+        self.ses.loadModel(load_eml(filename))
+        # Simulation time [s] at the time 0 of the session (see set_equilibrium)
+        self.time_offset = 0.
         self.molToTrack = ('ca',
                            'moles_bound_ca_per_moles_cam',
                            'Rbar',
@@ -55,13 +78,15 @@ class EcellManager():
         #log = ecell.LoggerStub()
         
         for mol in self.molToTrack:
-            loggers[mol]  = self.ses.createLoggerStub( "Variable:/Spine:" + mol 
-                                                       + ":Value" )
-            loggers[mol].create() # This creat the Logger Object in the backend
+            loggerStub = self.ses.createLoggerStub( "Variable:/Spine:" + mol 
+                                                    + ":Value" )
+            loggerStub.create() # This creat the Logger Object in the backend
+            loggers[mol] = LoggerReader(loggerStub) # Only the new rows are copied
             if mol == 'ca':
-                loggers['ca_conc']  = self.ses.createLoggerStub( "Variable:/Spine:" + mol 
-                                                       + ":MolarConc" )
-                loggers['ca_conc'].create() # This creat the Logger Object in the backend
+                loggerStub = self.ses.createLoggerStub( "Variable:/Spine:" + mol 
+                                                        + ":MolarConc" )
+                loggerStub.create() # This creat the Logger Object in the backend
+                loggers['ca_conc'] = LoggerReader(loggerStub)
         
         self.loggers = loggers
         
@@ -111,10 +136,22 @@ class EcellManager():
                          )
             self.ses.run(interval)
         
+    def set_equilibrium(self, values, time):
+        """Set the variable values (as returned by getVariableValues) of 
+        an equilibrium reached at `time` [s], without integrating the 
+        session. E-Cell can't move the time of a session, so the time 
+        courses are shifted by the difference."""
+        self.ses.setVariableValues(values)
+        self.time_offset = time - self.ses.getCurrentTime()
+    
     def converToTimeCourses(self):
         timeCourses = {}
         for key in self.loggers:
-            timeCourses[key] = self.loggers[key].getData()
+            data = self.loggers[key].getData()
+            if self.time_offset:
+                data = numpy.array(data)
+                data[:, 0] += self.time_offset
+            timeCourses[key] = data
         
         self.timeCourses = timeCourses
         
@@ -0,0 +1,260 @@
+# Read the reaction network of an E-Cell model (eml) without E-Cell.
+
+"""
+The eml is parsed with the standard library only, so the network can be
+used to generate other representations of the same model (the batched numpy
+integrator, the NMODL mechanism) also on machines without E-Cell.
+
+Only the process classes used in the biochemical_circuits models are
+supported: MassActionFluxProcess, ConstantFluxProcess, ExpressionFluxProcess,
+PythonFluxProcess and the passive PythonProcess used to compute the
+assignments (totals and ratios).
+"""
+
+import re
+from xml.dom import minidom
+
+N_A = 6.0221367e23 # Avogadro's number as used by E-Cell
+
+FLUX_CLASSES = ('MassActionFluxProcess',
+                'ConstantFluxProcess',
+                'ExpressionFluxProcess',
+                'PythonFluxProcess')
+ASSIGNMENT_CLASSES = ('PythonProcess',)
+
+# Numbers first, so the exponent of 1e-6 is not taken as a name.
+TOKEN = re.compile(r"self\.getSuperSystem\(\)\.SizeN_A"
+                   r"|\d+\.?\d*(?:[eE][-+]?\d+)?|\.\d+(?:[eE][-+]?\d+)?"
+                   r"|[A-Za-z_]\w*\.(?:MolarConc|Value)"
+                   r"|[A-Za-z_]\w*")
+
+
+class Process(object):
+    """A process of the network.
+
+    references is a dictionary name -> (variable full id, coefficient)"""
+    def __init__(self, klass, id, system_path, properties, references,
+                 expression=None):
+        self.klass = klass
+        self.id = id
+        self.system_path = system_path
+        self.properties = properties
+        self.references = references
+        self.expression = expression
+
+    def get_full_id(self):
+        return 'Process:' + self.system_path + ':' + self.id
+
+    def get_stoichiometry(self):
+        """Return the list of (variable full id, coefficient) with a non zero
+        coefficient"""
+        return [(var, coef) for var, coef in self.references.values() if coef != 0]
+
+
+class EmlNetwork(object):
+    """The variables and the processes of an eml model"""
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.variables = [] # full ids, in file order
+        self.values = {} # full id -> initial Value (number of molecules)
+        self.sizes = {} # system path -> size [l]
+        self.fluxes = []
+        self.assignments = []
+
+        dom = minidom.parse(filename)
+        for system in dom.getElementsByTagName('system'):
+            self._read_system(system)
+        dom.unlink()
+        self.assignments = self._sort_assignments(self.assignments)
+
+    def _read_system(self, system):
+        system_path = system.getAttribute('id')
+        for node in system.childNodes:
+            if node.nodeType != node.ELEMENT_NODE:
+                continue
+            if node.tagName == 'variable':
+                id = node.getAttribute('id')
+                properties = self._read_properties(node)
+                if id == 'SIZE':
+                    self.sizes[system_path] = float(properties['Value'])
+                else:
+                    full_id = 'Variable:' + system_path + ':' + id
+                    self.variables.append(full_id)
+                    self.values[full_id] = float(properties.get('Value', 0))
+            elif node.tagName == 'process':
+                self._read_process(node, system_path)
+
+    def _read_process(self, node, system_path):
+        klass = node.getAttribute('class')
+        id = node.getAttribute('id')
+        properties = self._read_properties(node)
+        reference_list = properties.pop('VariableReferenceList')
+        if not isinstance(reference_list[0], list):
+            # One reference only, the external list is not in the eml
+            reference_list = [reference_list]
+        references = {}
+        for name, full_id, coef in reference_list:
+            references[name] = (self._absolute_id(full_id, system_path),
+                                int(coef))
+        properties.pop('StepperID', None)
+        if klass in FLUX_CLASSES:
+            expression = properties.pop('Expression', None)
+            numeric = dict([(k, float(v)) for k, v in properties.iteritems()])
+            process = Process(klass, id, system_path, numeric, references,
+                              expression)
+            self.fluxes.append(process)
+        elif klass in ASSIGNMENT_CLASSES:
+            expression = properties.pop('FireMethod')
+            process = Process(klass, id, system_path, {}, references,
+                              expression)
+            self.assignments.append(process)
+        else:
+            raise NotImplementedError("Process class %s not supported" %klass)
+
+    def _read_properties(self, node):
+        properties = {}
+        for prop in node.childNodes:
+            if prop.nodeType != prop.ELEMENT_NODE or prop.tagName != 'property':
+                continue
+            properties[prop.getAttribute('name')] = self._read_value(prop)
+        return properties
+
+    def _read_value(self, node):
+        """A value is either a text or a list of values"""
+        values = [child for child in node.childNodes
+                  if child.nodeType == child.ELEMENT_NODE]
+        if not values:
+            return "".join([child.data for child in node.childNodes]).strip()
+        if len(values) == 1 and node.tagName == 'property':
+            return self._read_value(values[0])
+        return [self._read_value(value) for value in values]
+
+    def _absolute_id(self, full_id, system_path):
+        """Resolve the references relative to the process system (:.:)"""
+        entity_type, path, id = full_id.split(':')
+        if path in ('', '.'):
+            path = system_path
+        return entity_type + ':' + path + ':' + id
+
+    def _sort_assignments(self, assignments):
+        """Order the assignments so each one comes after the assignments
+        of the variables it reads."""
+        targets = {}
+        for process in assignments:
+            targets[self.get_assignment_target(process)] = process
+        ordered = []
+        visited = set()
+        def visit(process):
+            if process.id in visited:
+                return
+            visited.add(process.id)
+            for var, coef in process.references.values():
+                if coef == 0 and var in targets:
+                    visit(targets[var])
+            ordered.append(process)
+        for process in assignments:
+            visit(process)
+        return ordered
+
+    def get_assignment_target(self, process):
+        """Return the full id of the variable written by the assignment"""
+        target = process.expression.split('=')[0].strip().split('.')[0]
+        return process.references[target][0]
+
+    def get_assignment_expression(self, process):
+        """Return the right side of the assignment"""
+        return process.expression.split('=', 1)[1].strip()
+
+    def get_assigned_variables(self):
+        return [self.get_assignment_target(p) for p in self.assignments]
+
+    def get_state_variables(self):
+        """The variables changed by a flux, which are not assignments.
+        File order is kept."""
+        assigned = set(self.get_assigned_variables())
+        changed = set()
+        for process in self.fluxes:
+            for var, coef in process.get_stoichiometry():
+                changed.add(var)
+        return [var for var in self.variables
+                if var in changed and var not in assigned]
+
+    def get_size_n_a(self, full_id):
+        """Size of the system of the entity multiplied by N_A"""
+        system_path = full_id.split(':')[1]
+        return self.sizes[system_path] * N_A
+
+    def get_dependencies(self, process):
+        """Return the state variables the process depends on, following the
+        assignments down to the state variables."""
+        targets = {}
+        for assignment in self.assignments:
+            targets[self.get_assignment_target(assignment)] = assignment
+        dependencies = set()
+        to_visit = [var for var, coef in process.references.values()
+                    if coef < 0 or process.klass != 'MassActionFluxProcess']
+        while to_visit:
+            var = to_visit.pop()
+            if var in targets:
+                to_visit.extend([v for v, c in targets[var].references.values()
+                                 if c == 0 and v not in dependencies])
+            dependencies.add(var)
+        return dependencies
+
+    def translate(self, process, expression, variable_value, property_value,
+                  size_n_a=None):
+        """Translate the expression of a process.
+
+        :param
+            variable_value - function(full_id) returning the code for the
+            Value of the variable
+            property_value - function(process, name) returning the code for
+            the property of the process
+            size_n_a - code for the SizeN_A of the process system. If None
+            the number is used.
+
+        MolarConc is expressed as Value / SizeN_A of the variable's system.
+        """
+        if size_n_a is None:
+            size_n_a = repr(self.sizes[process.system_path] * N_A)
+        def replace(match):
+            token = match.group(0)
+            if token.startswith('self.'):
+                return size_n_a
+            if '.' in token and not token[0].isdigit():
+                name, attribute = token.split('.')
+                if name in process.references:
+                    full_id = process.references[name][0]
+                    if attribute == 'Value':
+                        return variable_value(full_id)
+                    return "(%s / %r)" %(variable_value(full_id),
+                                         self.get_size_n_a(full_id))
+            if token in process.properties:
+                return property_value(process, token)
+            return token
+        return TOKEN.sub(replace, expression)
+
+    def get_flux_expression(self, process, variable_value, property_value,
+                            size_n_a=None):
+        """Return the velocity of the process [molecules/s] as an
+        expression. MassAction and ConstantFlux are written out as the
+        equivalent expression."""
+        if process.klass == 'ConstantFluxProcess':
+            return property_value(process, 'k')
+        if process.klass == 'MassActionFluxProcess':
+            if size_n_a is None:
+                size_n_a = repr(self.sizes[process.system_path] * N_A)
+            factors = [property_value(process, 'k'), size_n_a]
+            for var, coef in process.references.values():
+                for i in range(-coef):
+                    factors.append("(%s / %r)" %(variable_value(var),
+                                                 self.get_size_n_a(var)))
+            return " * ".join(factors)
+        return self.translate(process, process.expression, variable_value,
+                              property_value, size_n_a)
+
+
+def get_name(full_id):
+    """Return the id of the entity from the full id"""
+    return full_id.split(':')[-1]
@@ -0,0 +1,73 @@
+# Read the E-Cell loggers incrementally.
+
+"""
+getData on an E-Cell logger copies the whole history, which grows during
+the run. The LoggerReader keeps a cursor on the last logged time: each read
+fetches only the rows logged after it (getData with start and end) and
+appends them to a numpy buffer, which doubles its size when full. getData
+returns the rows read so far, with the columns of the E-Cell data.
+"""
+
+import numpy
+
+
+class LoggerReader(object):
+    """Incremental reader of an E-Cell LoggerStub, used in its place"""
+
+    def __init__(self, loggerStub, initial_size=1024):
+        self.loggerStub = loggerStub
+        self.initial_size = initial_size
+        self.buffer = None
+        self.size = 0
+
+    def __len__(self):
+        """Rows read so far"""
+        return self.size
+
+    def read(self):
+        """Append the rows logged since the last read and return them"""
+        if self.loggerStub.getSize() == 0:
+            return self.get_rows(0)
+        if self.size == 0:
+            rows = numpy.asarray(self.loggerStub.getData())
+        else:
+            last_time = self.buffer[self.size - 1, 0]
+            end_time = self.loggerStub.getEndTime()
+            if end_time <= last_time:
+                return self.get_rows(self.size)
+            rows = numpy.asarray(self.loggerStub.getData(last_time, end_time))
+            # The row on last_time is already in the buffer
+            rows = rows[rows[:, 0] > last_time]
+        start = self.size
+        self.append(rows)
+        return self.get_rows(start)
+
+    def append(self, rows):
+        if len(rows) == 0:
+            return
+        if self.buffer is None:
+            self.buffer = numpy.empty((max(self.initial_size, len(rows)),
+                                       rows.shape[1]))
+        elif self.size + len(rows) > len(self.buffer):
+            new_length = max(2 * len(self.buffer), self.size + len(rows))
+            buffer = numpy.empty((new_length, self.buffer.shape[1]))
+            buffer[:self.size] = self.buffer[:self.size]
+            self.buffer = buffer
+        self.buffer[self.size:self.size + len(rows)] = rows
+        self.size += len(rows)
+
+    def get_rows(self, start):
+        if self.buffer is None:
+            return numpy.empty((0, 2))
+        return self.buffer[start:self.size]
+
+    def getData(self, start=None, end=None):
+        """Rows logged between start and end [s] (all by default), with the
+        columns of the E-Cell getData. The new rows are read first."""
+        self.read()
+        data = self.get_rows(0)
+        if start is not None:
+            data = data[data[:, 0] >= start]
+        if end is not None:
+            data = data[data[:, 0] <= end]
+        return data
@@ -217,6 +217,31 @@ class Session:
     def createEntityStub( self, fullid ):
         return EntityStub( self.theSimulator, fullid )
 
+    #
+    # State methods
+    #
+
+    def getVariableValues( self, aSystemPath='' ):
+        # return -> a dictionary FullID -> Value of the Variables in the
+        # system and in all its subsystems.
+        # the default of aSystemPath is empty to start with the root system
+        aValueDict = {}
+        for aVariable in self.getEntityList( 'Variable', aSystemPath ):
+            aFullID = 'Variable:' + aSystemPath + ':' + aVariable
+            aValueDict[ aFullID ] = \
+                self.theSimulator.getEntityProperty( aFullID + ':Value' )
+
+        for aSystem in self.getEntityList( 'System', aSystemPath ):
+            aSubSystemPath = joinSystemPath( aSystemPath, aSystem )
+            aValueDict.update( self.getVariableValues( aSubSystemPath ) )
+        return aValueDict
+
+    def setVariableValues( self, aValueDict ):
+        # aValueDict : a dictionary FullID -> Value, as returned by
+        # getVariableValues() of a session with the same model
+        for aFullID, aValue in aValueDict.items():
+            self.theSimulator.setEntityProperty( aFullID + ':Value', aValue )
+
     #
     # Logger methods
     #
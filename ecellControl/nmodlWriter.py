@@ -0,0 +1,309 @@
+# Write the reaction network of an eml as a NEURON density mechanism.
+
+"""
+The mechanism holds the whole network per segment (RANGE states), so it can
+be inserted in every spine head and integrated by NEURON together with the
+electrical model, without E-Cell.
+
+The states are kept as number of molecules, like in E-Cell, and the rates
+are converted from 1/s to 1/ms. The reactions linear in their substrates
+are written as KINETIC reactions, so they are integrated implicitly (the
+CaM transitions are very fast); the others as fluxes.
+
+The coupling with the electrical model is the one of the Runner:
+ - when `coupled` is 1 the calcium of the head (cai + cali) enters the
+   network through the ca_in process and ca_leak and ca_pump are switched
+   off.
+ - `ampa_weight` is AMPAR_P / ampar_P_baseline, to be read by the AMPA
+   synapse as POINTER.
+
+Usage (from the top directory)::
+
+    python -m ecellControl.nmodlWriter biochemical_circuits/biomd183_loop.eml mod/biomd183.mod
+"""
+
+import random
+import re
+import sys
+
+from emlNetwork import EmlNetwork, get_name, N_A
+
+SUFFIX = 'biomd183'
+WEIGHT_VARIABLE = 'AMPAR_P'
+MS = 1e-3 # s to ms
+# mM/ms * um3 -> molecules/s
+MILLIMOLAR_UM3_TO_MOLECULES = 1e-15 * N_A
+
+MAX_LINE = 200
+BREAK = re.compile(r"(?<![eE])[+*]|, ")
+
+# Properties driven by the coupling, exposed as RANGE.
+COUPLING = {('ca_in', 'k') : '(ca_in_k + coupled * ca_input)',
+            ('ca_leak', 'vmax') : '((1 - coupled) * ca_leak_vmax)',
+            ('ca_pump', 'vmax') : '((1 - coupled) * ca_pump_vmax)'
+            }
+
+
+class NmodlWriter(object):
+    """Write the eml network as NMODL"""
+
+    def __init__(self, network, suffix=SUFFIX):
+        self.network = network
+        self.suffix = suffix
+        self.states = network.get_state_variables()
+        self.assigned = network.get_assigned_variables()
+        self.constants = [v for v in network.variables
+                          if v not in self.states and v not in self.assigned]
+        self.random = random.Random(0) # same file every time
+
+    def variable_value(self, full_id):
+        return get_name(full_id)
+
+    def property_value(self, process, name):
+        if COUPLING.has_key((process.id, name)):
+            return COUPLING[(process.id, name)]
+        return repr(process.properties[name])
+
+    def is_linear(self, process, substrate):
+        """Check numerically if the velocity of the process is linear in the
+        substrate."""
+        values = dict([(var, self.random.uniform(1, 1e4))
+                       for var in self.network.variables])
+        code = self.network.get_flux_expression(process,
+                                                lambda var: "V[%r]" %var,
+                                                lambda p, name: repr(p.properties[name]))
+        code = code.replace('^', '**')
+        velocities = []
+        for scale in (1, 2):
+            V = dict(values)
+            V[substrate] = values[substrate] * scale
+            velocities.append(eval(code, {'pow' : pow, 'V' : V}))
+        if velocities[0] == 0:
+            return False
+        return abs(velocities[1] / velocities[0] - 2) < 1e-9
+
+    def get_mass_action_rate(self, process):
+        """Rate constant [1/ms] of the mass action on the number of molecules"""
+        network = self.network
+        rate = MS * process.properties['k'] * network.sizes[process.system_path] * N_A
+        for var, coef in process.get_stoichiometry():
+            if coef < 0:
+                rate = rate / network.get_size_n_a(var) ** -coef
+        return rate
+
+    def get_reverse_pairs(self):
+        """Pair each mass action process with its reverse, if there is one:
+        the two are written as one reversible reaction, which halves the
+        size of the generated code. Return process id -> reverse process
+        (or None if the process is the reverse of a previous one)"""
+        by_stoichiometry = {}
+        pairs = {}
+        for process in self.network.fluxes:
+            if process.klass != 'MassActionFluxProcess':
+                continue
+            key = frozenset(process.get_stoichiometry())
+            reverse = frozenset([(var, -coef) for var, coef in key])
+            if by_stoichiometry.has_key(reverse):
+                forward = by_stoichiometry.pop(reverse)
+                pairs[forward.id] = process
+                pairs[process.id] = None
+            else:
+                by_stoichiometry[key] = process
+        return pairs
+
+    def get_reaction(self, process, reverse=None):
+        """Return the KINETIC statements of the process, with its reverse
+        process if given"""
+        stoichiometry = process.get_stoichiometry()
+        substrates = [(var, -coef) for var, coef in stoichiometry if coef < 0]
+        products = [(var, coef) for var, coef in stoichiometry if coef > 0]
+        side = lambda terms: " + ".join([(coef > 1 and "%d " %coef or "") +
+                                         self.variable_value(var)
+                                         for var, coef in terms])
+        network = self.network
+        if substrates and products:
+            if process.klass == 'MassActionFluxProcess':
+                backward = 0
+                if reverse is not None:
+                    backward = self.get_mass_action_rate(reverse)
+                return ["~ %s <-> %s (%r, %r)" %(side(substrates), side(products),
+                                                 self.get_mass_action_rate(process),
+                                                 backward)]
+            if (len(substrates) == 1 and substrates[0][1] == 1 and
+                self.is_linear(process, substrates[0][0])):
+                # The velocity divided by the substrate
+                substrate = substrates[0][0]
+                variable_value = lambda var: (var == substrate and "1" or
+                                              self.variable_value(var))
+                rate = network.get_flux_expression(process, variable_value,
+                                                   self.property_value)
+                return ["%s = %r * (%s)" %(self.get_local(process), MS,
+                                           self.get_code(rate)),
+                        "~ %s <-> %s (%s, 0)" %(side(substrates), side(products),
+                                                self.get_local(process))]
+        # nocmodl can't take long expressions in the reactions, the
+        # velocity is computed in a LOCAL
+        velocity = network.get_flux_expression(process, self.variable_value,
+                                               self.property_value)
+        lines = ["%s = %r * (%s)" %(self.get_local(process), MS,
+                                    self.get_code(velocity))]
+        for var, coef in stoichiometry:
+            lines.append("~ %s << (%d * %s)" %(self.variable_value(var), coef,
+                                                self.get_local(process)))
+        return lines
+
+    def get_local(self, process):
+        """Name of the LOCAL holding the rate or the velocity of the process"""
+        return "v_" + process.id
+
+    def get_code(self, expression):
+        """Python to NMODL operators"""
+        return expression.replace('**', '^')
+
+    def wrap(self, line, indent="    ", width=MAX_LINE):
+        """nocmodl has a limit on the line length: the long statements are
+        split after a + , a * (not the ones of the exponents) or a comma"""
+        chunks = []
+        while len(line) > width:
+            breaks = [m.end() for m in BREAK.finditer(line, 0, width)]
+            if not breaks:
+                break
+            chunks.append(line[:breaks[-1]].rstrip())
+            line = indent * 2 + line[breaks[-1]:].lstrip()
+        chunks.append(line)
+        return chunks
+
+    def get_assignments(self):
+        network = self.network
+        lines = []
+        for process in network.assignments:
+            target = network.get_assignment_target(process)
+            expression = network.translate(process,
+                                           network.get_assignment_expression(process),
+                                           self.variable_value, self.property_value)
+            lines.append("%s = %s" %(self.variable_value(target),
+                                     self.get_code(expression)))
+        return lines
+
+    def write(self, filename):
+        network = self.network
+        names = lambda variables: [self.variable_value(v) for v in variables]
+        coupling = sorted(["%s_%s" %key for key in COUPLING])
+        lines = []
+        add = lines.append
+        add("TITLE %s" %self.suffix)
+        add("")
+        add("COMMENT")
+        add("Generated by ecellControl/nmodlWriter.py from %s." %network.filename)
+        add("Do not edit: change the eml and generate it again.")
+        add("States are number of molecules, time is in ms.")
+        add("ENDCOMMENT")
+        add("")
+        add("NEURON {")
+        add("    THREADSAFE")
+        add("    SUFFIX %s" %self.suffix)
+        add("    USEION ca READ cai")
+        add("    USEION cal READ cali VALENCE 2")
+        add("    RANGE coupled, head_vol, ca_input, ampa_weight, ampar_P_baseline")
+        add("    RANGE %s" %", ".join(coupling))
+        for name in names(self.assigned):
+            add("    RANGE %s" %name)
+        add("}")
+        add("")
+        add("UNITS {")
+        add("    (mM) = (milli/liter)")
+        add("}")
+        add("")
+        add("PARAMETER {")
+        add("    coupled = 0")
+        add("    head_vol = 1 : um3")
+        add("    ampar_P_baseline = 0")
+        for name in coupling:
+            process_id, property = name.rsplit('_', 1)
+            process = [p for p in network.fluxes if p.id == process_id][0]
+            add("    %s = %r" %(name, process.properties[property]))
+        for var in self.constants:
+            add("    %s = %r" %(self.variable_value(var), network.values[var]))
+        for var in self.states:
+            add("    %s0 = %r" %(self.variable_value(var), network.values[var]))
+        add("}")
+        add("")
+        add("ASSIGNED {")
+        add("    cai (mM)")
+        add("    cali (mM)")
+        add("    ca_total_prev (mM)")
+        add("    ca_input : molecules/s")
+        add("    ampa_weight")
+        for name in names(self.assigned):
+            add("    %s" %name)
+        add("}")
+        add("")
+        add("STATE {")
+        for name in names(self.states):
+            add("    %s" %name)
+        add("}")
+        add("")
+        add("BREAKPOINT {")
+        add("    SOLVE scheme METHOD sparse")
+        add("}")
+        add("")
+        add("INITIAL {")
+        add("    ca_total_prev = cai + cali")
+        add("    ca_input = 0")
+        add("    assign()")
+        add("    update_weight()")
+        add("}")
+        add("")
+        add("BEFORE STEP {")
+        add("    : Calcium entered in the head in the last step")
+        add("    ca_input = (cai + cali - ca_total_prev) / dt * head_vol * %r"
+            %MILLIMOLAR_UM3_TO_MOLECULES)
+        add("    ca_total_prev = cai + cali")
+        add("    assign()")
+        add("    update_weight()")
+        add("}")
+        add("")
+        add("PROCEDURE assign() {")
+        for line in self.get_assignments():
+            lines.extend(self.wrap("    " + line))
+        add("}")
+        add("")
+        add("PROCEDURE update_weight() {")
+        add("    if (ampar_P_baseline > 0) {")
+        add("        ampa_weight = %s / ampar_P_baseline" %WEIGHT_VARIABLE)
+        add("    } else {")
+        add("        ampa_weight = 1")
+        add("    }")
+        add("}")
+        add("")
+        reactions = []
+        pairs = self.get_reverse_pairs()
+        for process in network.fluxes:
+            reverse = pairs.get(process.id)
+            if pairs.has_key(process.id) and reverse is None:
+                continue # written with the forward one
+            if reverse is None:
+                reactions.append("    : %s" %process.id)
+            else:
+                reactions.append("    : %s, %s" %(process.id, reverse.id))
+            for line in self.get_reaction(process, reverse):
+                reactions.extend(self.wrap("    " + line))
+        locals = [self.get_local(p) for p in network.fluxes
+                  if p.klass != 'MassActionFluxProcess']
+        add("KINETIC scheme {")
+        lines.extend(self.wrap("    LOCAL " + ", ".join(locals)))
+        add("    assign()")
+        lines.extend(reactions)
+        add("}")
+        add("")
+        f = open(filename, 'w')
+        f.write("\n".join(lines))
+        f.close()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3:
+        writer = NmodlWriter(EmlNetwork(sys.argv[1]))
+        writer.write(sys.argv[2])
+    else:
+        print __doc__
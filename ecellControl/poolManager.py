@@ -0,0 +1,339 @@
+# Host the E-Cell sessions of the stimulated spines in worker processes.
+
+"""
+The spines have no biochemical coupling, so their E-Cell sessions can
+advance in parallel. The PoolEcellManager starts a pool of persistent
+workers (one per core by default) and pins the spines to them: spine i
+lives in worker i % n_workers, which creates its EcellManager.
+
+The properties set by the Runner (the calcium flux, the leak and the pump)
+go to the workers, and the values read by the Runner (AMPAR_P, ca,
+CaMKIIbar) come back, through arrays in shared memory. The pipe of each
+worker only carries the time to reach, so the wall time of an advance is the
+one of the slowest worker, not the sum over the spines. The time courses are
+sent through the pipe only when they are asked, at the end of the run.
+
+As with the batched backend, all the fluxes have to be set before advancing
+any spine: the first spine asking to advance moves all the workers, the
+others find them already there. Every spine gets a PoolSpineManager, which
+exposes the attributes of the EcellManager used by the Runner.
+
+start_run lets the workers advance in background while the parent does
+something else (the pipelined sync_mode integrates NEURON meanwhile). Reading
+an output or setting an input waits for the run in progress.
+
+The variable values of a spine (getVariableValues) and the equilibrium set
+in it (set_equilibrium, for the equilibrium cache and the steady state) also
+go through the pipe, once per spine.
+"""
+
+import multiprocessing
+import traceback
+from multiprocessing.sharedctypes import RawArray
+
+import numpy
+
+import logging
+logger = logging.getLogger(__name__)
+
+# Properties written by the Runner and read by the workers before each run
+INPUTS = (('Process:/Spine:ca_in', 'k'),
+          ('Process:/Spine:ca_leak', 'vmax'),
+          ('Process:/Spine:ca_pump', 'vmax'))
+# Properties written by the workers after each run
+OUTPUTS = (('Variable:/Spine:ca', 'Value'),
+           ('Variable:/Spine:CaMKIIbar', 'Value'),
+           ('Variable:/Spine:AMPAR_P', 'Value'))
+
+
+def shared_array(n_rows, n_cols):
+    """numpy view of a RawArray, inherited by the forked workers"""
+    raw = RawArray('d', n_rows * n_cols)
+    return numpy.frombuffer(raw, dtype=numpy.float64).reshape(n_rows, n_cols)
+
+def worker_loop(filename, spine_indexes, inputs, outputs, conn):
+    """Body of a worker: create the EcellManagers of the pinned spines and
+    serve the requests of the PoolEcellManager until 'stop'."""
+    try:
+        from ecellManager import EcellManager
+        managers = {}
+        for i in spine_indexes:
+            ecellMan = EcellManager(filename)
+            ecellMan.createLoggers()
+            managers[i] = ecellMan
+            simulator = ecellMan.ses.theSimulator
+            for col, (full_id, name) in enumerate(INPUTS):
+                inputs[i, col] = simulator.getEntityProperty(full_id + ':' + name)
+        write_outputs(managers, outputs)
+        conn.send(('ready', None))
+    except:
+        conn.send(('error', traceback.format_exc()))
+        return
+    while True:
+        request, arg = conn.recv()
+        try:
+            if request == 'run':
+                for i, ecellMan in managers.iteritems():
+                    ses = ecellMan.ses
+                    for col, (full_id, name) in enumerate(INPUTS):
+                        ses.theSimulator.setEntityProperty(full_id + ':' + name,
+                                                           inputs[i, col])
+                    delta_t = arg - ecellMan.time_offset - ses.getCurrentTime()
+                    if delta_t > 0:
+                        ses.run(delta_t)
+                write_outputs(managers, outputs)
+                conn.send(('done', None))
+            elif request == 'values':
+                conn.send(('done', managers[arg].ses.getVariableValues()))
+            elif request == 'equilibrium':
+                spine_index, values, time = arg
+                managers[spine_index].set_equilibrium(values, time)
+                write_outputs(managers, outputs)
+                conn.send(('done', None))
+            elif request == 'timecourses':
+                ecellMan = managers[arg]
+                ecellMan.converToTimeCourses()
+                conn.send(('done', ecellMan.timeCourses))
+            elif request == 'stop':
+                conn.send(('done', None))
+                return
+        except:
+            conn.send(('error', traceback.format_exc()))
+
+def write_outputs(managers, outputs):
+    for i, ecellMan in managers.iteritems():
+        simulator = ecellMan.ses.theSimulator
+        for col, (full_id, name) in enumerate(OUTPUTS):
+            outputs[i, col] = simulator.getEntityProperty(full_id + ':' + name)
+
+
+class PoolEcellManager(object):
+    """Pool of workers hosting the E-Cell sessions of n_spines spines
+
+    :param
+        n_workers - number of worker processes, by default the number of
+        cores (never more than the spines)
+    """
+
+    def __init__(self, filename, n_spines, n_workers=None):
+        if n_workers is None:
+            n_workers = multiprocessing.cpu_count()
+        n_workers = max(1, min(n_workers, n_spines))
+        self.n_spines = n_spines
+        self.time = 0.0
+        self.inputs = shared_array(n_spines, len(INPUTS))
+        self.outputs = shared_array(n_spines, len(OUTPUTS))
+        self.pending = None # target time of the run in progress
+        self.sessions = []
+        self.conns = []
+        self.workers = []
+        self.spine_worker = {}
+        for w in range(n_workers):
+            spine_indexes = range(w, n_spines, n_workers)
+            for i in spine_indexes:
+                self.spine_worker[i] = w
+            parent_conn, child_conn = multiprocessing.Pipe()
+            worker = multiprocessing.Process(target=worker_loop,
+                                             args=(filename, spine_indexes,
+                                                   self.inputs, self.outputs,
+                                                   child_conn))
+            worker.daemon = True
+            worker.start()
+            self.conns.append(parent_conn)
+            self.workers.append(worker)
+        for conn in self.conns:
+            self.receive(conn)
+        logger.info("E-Cell sessions of %d spines hosted in %d workers" %(n_spines,
+                                                                         n_workers))
+
+    def receive(self, conn):
+        status, result = conn.recv()
+        if status == 'error':
+            raise RuntimeError("E-Cell worker failed:\n%s" %result)
+        return result
+
+    def run(self, delta_t):
+        """Advance all the spines of delta_t [s], the workers in parallel"""
+        self.send_run(delta_t)
+        self.wait()
+
+    def send_run(self, delta_t):
+        """Ask the workers to advance of delta_t [s]"""
+        self.wait()
+        if delta_t <= 0:
+            return
+        target = self.time + delta_t
+        for conn in self.conns:
+            conn.send(('run', target))
+        self.pending = target
+
+    def start_run(self, delta_t):
+        """Start to advance all the spines of delta_t [s] and return without
+        waiting for the workers. The sessions of the spines are moved to
+        the end of the run; the shared inputs must not change until wait."""
+        self.send_run(delta_t)
+        for ses in self.sessions:
+            ses.time = max(ses.time, self.pending or self.time)
+
+    def wait(self):
+        """Wait for the run in progress, if any"""
+        if self.pending is None:
+            return
+        for conn in self.conns:
+            self.receive(conn)
+        self.time = self.pending
+        self.pending = None
+
+    def advance_to(self, time):
+        """Advance the pool to time [s], if not already there."""
+        self.wait()
+        # Same tolerance of the BatchedEcellManager
+        if time > self.time + 1e-12:
+            self.run(time - self.time)
+
+    def get_variable_values(self, spine_index):
+        """Variable values of the spine, from its worker"""
+        self.wait()
+        conn = self.conns[self.spine_worker[spine_index]]
+        conn.send(('values', spine_index))
+        return self.receive(conn)
+
+    def set_equilibrium(self, spine_index, values, time):
+        """Set the values of an equilibrium reached at time [s] in the 
+        spine, without integrating. The pool moves to time, so all the 
+        spines have to be set."""
+        self.wait()
+        conn = self.conns[self.spine_worker[spine_index]]
+        conn.send(('equilibrium', (spine_index, values, time)))
+        self.receive(conn)
+        self.time = time
+
+    def get_time_courses(self, spine_index):
+        """Time courses of the loggers of the spine, from its worker"""
+        self.wait()
+        conn = self.conns[self.spine_worker[spine_index]]
+        conn.send(('timecourses', spine_index))
+        return self.receive(conn)
+
+    def stop(self):
+        """Stop the workers"""
+        self.wait()
+        for conn in self.conns:
+            conn.send(('stop', None))
+            self.receive(conn)
+        for worker in self.workers:
+            worker.join()
+
+    def spine_manager(self, spine_index):
+        """Return the object to use as ecellMan in the spine"""
+        return PoolSpineManager(self, spine_index)
+
+
+class EntityStub(object):
+    """Get and set the shared properties of one entity in one spine of the
+    pool, with the E-Cell stub syntax: stub['Value']"""
+
+    def __init__(self, pool, spine_index, full_id):
+        self.pool = pool
+        self.spine_index = spine_index
+        self.full_id = full_id
+
+    def __getitem__(self, name):
+        return self.getProperty(name)
+
+    def __setitem__(self, name, value):
+        self.setProperty(name, value)
+
+    def getProperty(self, name):
+        key = (self.full_id, name)
+        if key in INPUTS:
+            return self.pool.inputs[self.spine_index, INPUTS.index(key)]
+        if key in OUTPUTS:
+            self.pool.wait()
+            return self.pool.outputs[self.spine_index, OUTPUTS.index(key)]
+        raise KeyError("%s:%s is not shared with the workers" %key)
+
+    def setProperty(self, name, value):
+        key = (self.full_id, name)
+        if key not in INPUTS:
+            raise KeyError("%s:%s can't be set in the workers" %key)
+        self.pool.wait()
+        self.pool.inputs[self.spine_index, INPUTS.index(key)] = value
+
+
+class LoggerStub(object):
+    """Read the logger of one variable in one spine from its worker"""
+
+    def __init__(self, pool, spine_index, key):
+        self.pool = pool
+        self.spine_index = spine_index
+        self.key = key
+
+    def getData(self):
+        return self.pool.get_time_courses(self.spine_index)[self.key]
+
+
+class PoolSession(object):
+    """The part of the E-Cell Session used by the Runner"""
+
+    def __init__(self, pool, spine_index):
+        self.pool = pool
+        self.spine_index = spine_index
+        self.time = pool.time
+
+    def run(self, delta_t):
+        self.time += delta_t
+        self.pool.advance_to(self.time)
+
+    def getCurrentTime(self):
+        return self.time
+
+    def createEntityStub(self, full_id):
+        return EntityStub(self.pool, self.spine_index, full_id)
+
+    def getVariableValues(self):
+        return self.pool.get_variable_values(self.spine_index)
+
+
+class PoolSpineManager(object):
+    """Drop-in replacement of the EcellManager for one spine of the pool"""
+
+    def __init__(self, pool, spine_index):
+        self.pool = pool
+        self.ses = PoolSession(pool, spine_index)
+        pool.sessions.append(self.ses)
+        self.molToTrack = ('ca',
+                           'moles_bound_ca_per_moles_cam',
+                           'Rbar',
+                           'PP2Bbar',
+                           'CaMKIIbar',
+                           'PP1abar', # Active PP1/Total PP1
+                           'AMPAR', #
+                           'AMPAR_P',
+                           'D',
+                           'totDp',
+                           'Dpbar'
+                           )
+        self.ca = self.ses.createEntityStub('Variable:/Spine:ca')
+        self.CaMKIIbar = self.ses.createEntityStub('Variable:/Spine:CaMKIIbar')
+        self.ampar_P = self.ses.createEntityStub('Variable:/Spine:AMPAR_P')
+        self.ca_in = self.ses.createEntityStub('Process:/Spine:ca_in')
+        self.ca_leak = self.ses.createEntityStub('Process:/Spine:ca_leak')
+        self.ca_pump = self.ses.createEntityStub('Process:/Spine:ca_pump')
+
+    def createLoggers(self):
+        """The worker creates the loggers of the EcellManager"""
+        spine_index = self.ses.spine_index
+        loggers = {}
+        for key in self.molToTrack + ('ca_conc',):
+            loggers[key] = LoggerStub(self.pool, spine_index, key)
+        self.loggers = loggers
+
+    def set_equilibrium(self, values, time):
+        """Set the values of an equilibrium reached at `time` [s] in the 
+        session of the worker, without integrating"""
+        self.pool.set_equilibrium(self.ses.spine_index, values, time)
+        self.ses.time = time
+
+    def converToTimeCourses(self):
+        self.timeCourses = self.pool.get_time_courses(self.ses.spine_index)
@@ -0,0 +1,235 @@
+# Solve the resting steady state of the biochemical model.
+
+"""
+The steady state of the reaction network is found directly, instead of
+integrating the model at rest for t_equilibrium_ecell seconds. The rate
+equations are the ones of the batched engine (see batchedManager), so the
+values follow the E-Cell definitions and can be set in the E-Cell sessions.
+
+The solution goes in two phases:
+
+1. pseudo-transient continuation: implicit Euler steps from the initial
+   values of the eml, the step doubling at each accepted step. The steps
+   keep the conservation laws and bring the state in the basin of the
+   steady state, also across the slow modes which make the integration
+   long;
+2. Newton on the rate equations together with the conservation laws (the
+   totals fixed by the initial values). The jacobian of the rates is
+   singular, so the step is the least squares one.
+
+The reactions switched off in the model (k = 0) are left out of the
+conservation laws: a species with only those reactions is a law by itself
+and keeps its initial value.
+
+The stability is checked on the eigenvalues of the jacobian restricted to
+the conserved subspace and with a short integration from the solution.
+"""
+
+import numpy
+
+import logging
+logger = logging.getLogger(__name__)
+
+from batchedManager import BatchedEcellManager
+
+
+def get_conservation_laws(stoichiometry, rcond=1e-10):
+    """Rows of the left null space of the stoichiometry (n_species x
+    n_processes): each row l satisfies l . dy/dt = 0."""
+    u, s, vt = numpy.linalg.svd(stoichiometry)
+    rank = (s > rcond * s[0]).sum()
+    return u[:, rank:].T
+
+
+def get_column_groups(sparsity):
+    """Group the columns of the jacobian without rows in common, so they
+    can be perturbed together (Curtis, Powell and Reid). Return the list
+    of (columns, rows of each column)."""
+    sparsity = sparsity.astype(bool)
+    groups = []
+    for column in range(sparsity.shape[1]):
+        rows = numpy.flatnonzero(sparsity[:, column])
+        for columns, used, column_rows in groups:
+            if not used[rows].any():
+                break
+        else:
+            columns, used, column_rows = [], numpy.zeros(len(sparsity), dtype=bool), []
+            groups.append((columns, used, column_rows))
+        columns.append(column)
+        used[rows] = True
+        column_rows.append(rows)
+    return [(numpy.array(columns), column_rows)
+            for columns, used, column_rows in groups]
+
+
+class SteadyStateSolver(object):
+    """Steady state of one copy of the network, from the initial values of
+    the eml"""
+
+    def __init__(self, filename, tol=1e-9, max_iter=500):
+        """
+        :param
+            tol - largest relative velocity of the species at the steady
+            state [1/s], the velocity over max(value, 1 molecule)
+        """
+        self.batch = BatchedEcellManager(filename, 1)
+        self.tol = tol
+        self.max_iter = max_iter
+        batch = self.batch
+        batch._work = batch.values.copy()
+        active = [i for i, process in enumerate(batch.network.fluxes)
+                  if process.properties.get('k') != 0]
+        stoichiometry = batch.stoichiometry.toarray()[active][:, batch.states].T
+        self.conservation = get_conservation_laws(stoichiometry)
+        y0 = batch.values[0, batch.states]
+        self.totals = self.conservation.dot(y0)
+        self.groups = get_column_groups(batch.jac_sparsity.toarray())
+        self.n_residuals = 0
+
+    def residual(self, y):
+        """Rate of change of the state species [molecules/s]"""
+        self.n_residuals += 1
+        return self.batch._rhs(0, y)
+
+    def jacobian(self, y, f=None):
+        """Jacobian of the residual by finite differences, perturbing
+        together the columns of a group"""
+        if f is None:
+            f = self.residual(y)
+        jac = numpy.zeros((len(y), len(y)))
+        delta = 1e-7 * numpy.maximum(numpy.abs(y), 1.)
+        for columns, rows in self.groups:
+            y_delta = y.copy()
+            y_delta[columns] += delta[columns]
+            df = self.residual(y_delta) - f
+            for column, column_rows in zip(columns, rows):
+                jac[column_rows, column] = df[column_rows] / delta[column]
+        return jac
+
+    def error(self, y, f):
+        return numpy.abs(f / numpy.maximum(numpy.abs(y), 1.)).max()
+
+    def continuation(self, y, switch, dt=1e-3, dt_max=1e8, jac_age=3):
+        """Implicit Euler steps [s] until the relative velocity is below
+        switch. A step is rejected, and the next one is four times
+        shorter, if a species goes negative by more than a tenth of its
+        value (one molecule at least) or the velocity grows tenfold. The
+        smaller negative values, from the linearization, are set to zero.
+        The jacobian is computed again every jac_age accepted steps."""
+        f = self.residual(y)
+        error = self.error(y, f)
+        identity = numpy.identity(len(y))
+        jac = None
+        for i in range(self.max_iter):
+            if error < switch:
+                break
+            if jac is None:
+                jac = self.jacobian(y, f)
+                n_steps = 0
+            y_new = y + numpy.linalg.solve(identity / dt - jac, f)
+            if (not numpy.isfinite(y_new).all() or
+                (y_new < -0.1 * numpy.maximum(y, 1.)).any()):
+                dt /= 4.
+                continue
+            y_new = numpy.maximum(y_new, 0.)
+            f_new = self.residual(y_new)
+            error_new = self.error(y_new, f_new)
+            if error_new > 10 * error:
+                dt /= 4.
+                continue
+            dt = min(2 * dt, dt_max)
+            y, f, error = y_new, f_new, error_new
+            n_steps += 1
+            if n_steps == jac_age:
+                jac = None
+        return y
+
+    def newton(self, y):
+        """Newton on the rate equations with the conservation laws. Return
+        the solution or None if Newton does not converge."""
+        for i in range(50):
+            f = self.residual(y)
+            if self.error(y, f) < self.tol:
+                return y
+            system = numpy.vstack((self.jacobian(y, f), self.conservation))
+            rhs = numpy.concatenate((-f, self.totals - self.conservation.dot(y)))
+            y = y + numpy.linalg.lstsq(system, rhs, rcond=None)[0]
+            if not numpy.isfinite(y).all():
+                return None
+        return None
+
+    def solve(self):
+        """Find the steady state and set it in the batch. Return the
+        values of the state species."""
+        batch = self.batch
+        y = batch.values[0, batch.states].copy()
+        for switch in (1e-3, 1e-6, 0.):
+            y = self.continuation(y, switch)
+            y_newton = self.newton(y)
+            if y_newton is not None:
+                y = y_newton
+                break
+        else:
+            raise RuntimeError("Steady state not found, relative velocity %s"
+                               %self.error(y, self.residual(y)))
+        batch.values[0, batch.states] = y
+        batch._assign(batch.values, batch.params)
+        logger.info("Steady state found with %d evaluations of the rates"
+                    %self.n_residuals)
+        return y
+
+    def max_eigenvalue(self, y):
+        """Largest real part of the eigenvalues of the jacobian on the
+        subspace which keeps the conservation laws [1/s]. Negative if the
+        steady state is stable."""
+        jac = self.jacobian(y)
+        if len(self.conservation):
+            u, s, vt = numpy.linalg.svd(self.conservation)
+            basis = vt[len(self.conservation):].T
+        else:
+            basis = numpy.identity(len(y))
+        reduced = basis.T.dot(jac).dot(basis)
+        return numpy.linalg.eigvals(reduced).real.max()
+
+    def verify(self, t_verify):
+        """Integrate the steady state for t_verify [s] and return the
+        largest relative change of the species. The batch is left at the
+        solution."""
+        batch = self.batch
+        values = batch.values.copy()
+        time = batch.time
+        batch.run(t_verify)
+        y = values[0, batch.states]
+        drift = numpy.abs(batch.values[0, batch.states] - y)
+        batch.values = values
+        batch.time = time
+        return (drift / numpy.maximum(numpy.abs(y), 1.)).max()
+
+    def get_variable_values(self):
+        """Dictionary full id -> Value of the variables, as returned by
+        the getVariableValues of the E-Cell session"""
+        batch = self.batch
+        return dict([(var, batch.values[0, i])
+                     for i, var in enumerate(batch.network.variables)])
+
+
+def solve_steady_state(filename, t_verify=10., max_drift=1e-3,
+                       max_eigenvalue=1e-6):
+    """Return the variable values (full id -> Value) of the steady state of
+    the model, or None if it is not found or not stable: an eigenvalue
+    above max_eigenvalue [1/s] (zero up to the numerical error) or a
+    relative change of a species over t_verify [s] above max_drift."""
+    solver = SteadyStateSolver(filename)
+    try:
+        y = solver.solve()
+    except RuntimeError, e:
+        logger.warning("%s, integrating the equilibrium" %e)
+        return None
+    eigenvalue = solver.max_eigenvalue(y)
+    drift = solver.verify(t_verify)
+    logger.info("Steady state: largest eigenvalue %s 1/s, relative change in %s s: %s"
+                %(eigenvalue, t_verify, drift))
+    if eigenvalue > max_eigenvalue or drift > max_drift:
+        logger.warning("The steady state is not stable, integrating the equilibrium")
+        return None
+    return solver.get_variable_values()
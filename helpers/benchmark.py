@@ -0,0 +1,82 @@
+"""
+Helpers to benchmark different configurations of the model.
+
+NEURON can't instantiate the model twice in the same process, so every
+configuration is run in a fresh python process, started with::
+
+    python -m helpers.<benchmark_module> --child param_file overrides_json out_json
+
+The parent collects the json written by each child and prints the report.
+All the benchmarks have to be launched from the top directory of the package.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+
+def load_param(param_file, overrides=None):
+    """Load the param file and apply the overrides (dict)"""
+    from sumatra.external.NeuroTools import parameters
+    param = parameters.ParameterSet(param_file)
+    if overrides:
+        for key, value in overrides.iteritems():
+            param[key] = value
+    return param
+
+def run_child(module, param_file, overrides):
+    """Run `module` as a child with the overrides and return the dictionary
+    of results dumped by the child. The wall time of the whole process is
+    added as `process_time`."""
+    fd, out_json = tempfile.mkstemp(suffix='.json')
+    os.close(fd)
+    cmd = [sys.executable, '-m', module, '--child', param_file,
+           json.dumps(overrides), out_json]
+    start = time.time()
+    subprocess.check_call(cmd)
+    process_time = time.time() - start
+    f = open(out_json)
+    results = json.load(f)
+    f.close()
+    os.remove(out_json)
+    results['process_time'] = process_time
+    return results
+
+def child_main(argv, run_function):
+    """Entry point of the child. `run_function(param)` runs the model and
+    returns a dictionary of results, which is dumped as json."""
+    param_file, overrides, out_json = argv[2], json.loads(argv[3]), argv[4]
+    param = load_param(param_file, overrides)
+    start = time.time()
+    results = run_function(param)
+    results['wall_time'] = time.time() - start
+    f = open(out_json, 'w')
+    json.dump(results, f)
+    f.close()
+
+def run_runner(param):
+    """Run the full multiscale model with the given param"""
+    from spineIntegration import Runner
+    runner = Runner(param)
+    runner.main()
+    return runner
+
+def print_report(title, rows, columns):
+    """Print the results as a simple table. `rows` is a list of
+    (label, results_dict)"""
+    print "\n%s" %title
+    print "-" * len(title)
+    header = "%-30s" %"configuration" + "".join(["%18s" %c for c in columns])
+    print header
+    for label, results in rows:
+        line = "%-30s" %label
+        for c in columns:
+            value = results.get(c, float('nan'))
+            if isinstance(value, float):
+                line += "%18.3f" %value
+            else:
+                line += "%18s" %value
+        print line
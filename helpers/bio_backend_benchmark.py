@@ -0,0 +1,93 @@
+"""
+Benchmark the biochemical backends ('ecell', 'batched', 'nrn', 'pool') and compare
+their time courses with the E-Cell ones.
+
+Usage (from the top directory)::
+
+    python -m helpers.bio_backend_benchmark param/default.param [tStop] [backend ...]
+
+If tStop [ms] is given it overrides the one in the param file. If the param
+file has no stimulated spines (like default.param) the spines with a list
+of stims are stimulated.
+
+The error is the maximum absolute difference from the E-Cell time course,
+after the equilibrium, relative to the maximum of the E-Cell one.
+"""
+
+import sys
+
+import numpy
+
+from helpers.benchmark import (load_param, run_child, child_main, run_runner,
+                               print_report)
+
+BIO_BACKENDS = ['ecell', 'batched', 'nrn', 'pool']
+VARIABLES = ['AMPAR_P', 'CaMKIIbar', 'ca_conc']
+
+
+def run(param):
+    runner = run_runner(param)
+    time_courses = {}
+    for spine_id in param['stimulated_spines']:
+        spine = runner.nrnManager.spines[spine_id]
+        time_courses[spine_id] = {}
+        for var in VARIABLES:
+            tc = spine.ecellMan.timeCourses[var]
+            time_courses[spine_id][var] = [tc[:,0].tolist(), tc[:,1].tolist()]
+    return {'bio_backend' : param.get('bio_backend', 'ecell'),
+            'time_courses' : time_courses}
+
+def get_stimulated_spines(param):
+    """Spines with a list of stims in the param"""
+    return sorted([key for key, value in param.items()
+                   if key.startswith('spine') and isinstance(value, list)])
+
+def relative_error(reference, time_course, t_start):
+    """Max difference of time_course from the reference after t_start,
+    relative to the max of the reference"""
+    t_ref, v_ref = numpy.array(reference[0]), numpy.array(reference[1])
+    mask = t_ref >= t_start
+    values = numpy.interp(t_ref[mask], time_course[0], time_course[1])
+    scale = numpy.abs(v_ref[mask]).max()
+    return numpy.abs(values - v_ref[mask]).max() / scale
+
+def compare_bio_backends(param_file, tStop=None, bio_backends=BIO_BACKENDS):
+    param = load_param(param_file)
+    overrides = {}
+    if tStop is not None:
+        overrides['tStop'] = tStop
+    if not param['stimulated_spines']:
+        overrides['stimulated_spines'] = get_stimulated_spines(param)
+    rows = []
+    for bio_backend in bio_backends:
+        overrides['bio_backend'] = bio_backend
+        results = run_child('helpers.bio_backend_benchmark', param_file,
+                            overrides)
+        rows.append((bio_backend, results))
+    columns = ['wall_time', 'process_time']
+    reference = dict(rows)[bio_backends[0]]['time_courses']
+    for var in VARIABLES:
+        column = 'err_' + var
+        columns.append(column)
+        for label, results in rows:
+            errors = [relative_error(reference[spine_id][var],
+                                     results['time_courses'][spine_id][var],
+                                     param['t_equilibrium_ecell'])
+                      for spine_id in reference]
+            results[column] = max(errors)
+    print_report("Bio backends benchmark: %s (reference %s)" %(param_file,
+                                                                 bio_backends[0]),
+                 rows, columns)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == '--child':
+        child_main(sys.argv, run)
+    elif len(sys.argv) > 1:
+        tStop = None
+        if len(sys.argv) > 2:
+            tStop = float(sys.argv[2])
+        bio_backends = sys.argv[3:] or BIO_BACKENDS
+        compare_bio_backends(sys.argv[1], tStop, bio_backends)
+    else:
+        print __doc__
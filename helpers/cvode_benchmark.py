@@ -0,0 +1,84 @@
+"""
+Benchmark the variable step integrator (CVode, global and local step)
+against the fixed step, on a long_tstop param file.
+
+Usage (from the top directory)::
+
+    python -m helpers.cvode_benchmark param/long_tstop_allspines_1_spine_4Hz.param [tStop]
+
+All the configurations sync with the 'events' sync_mode and without
+multisplit (lvardt does not support it). If tStop [ms] is given it
+overrides the one in the param file. If the param file has no stimulated
+spines the spines with a list of stims are stimulated.
+
+steps is the number of steps of NEURON, from a vector recording t at every
+step. max_dw is the maximum absolute difference of the AMPA weights from
+the fixed step run.
+"""
+
+import sys
+
+from helpers.benchmark import load_param, run_child, child_main, print_report
+from helpers.bio_backend_benchmark import get_stimulated_spines
+from helpers.pipeline_benchmark import max_weight_difference
+
+CONFIGURATIONS = [
+    ('fixed', {'integrator' : 'fixed'}),
+    ('cvode', {'integrator' : 'cvode'}),
+    ('cvode local_dt', {'integrator' : 'cvode', 'cvode_local_dt' : True}),
+]
+
+
+def run(param):
+    from neuron import h
+    from spineIntegration import Runner
+
+    class StepRunner(Runner):
+        """Runner recording the time of every step of NEURON"""
+        def record_vectors(self, nrnManager):
+            Runner.record_vectors(self, nrnManager)
+            self.steps = h.Vector()
+            self.steps.record(h._ref_t)
+
+    runner = StepRunner(param)
+    runner.main()
+    weights = {}
+    for spine_id in param['stimulated_spines']:
+        spine = runner.nrnManager.spines[spine_id]
+        for syn in spine.synapses:
+            if syn.chan_type == 'ampa':
+                weights[spine_id] = [list(syn.weight[0]), list(syn.weight[1])]
+    return {'steps' : len(runner.steps),
+            'weights' : weights}
+
+def compare_integrators(param_file, tStop=None):
+    param = load_param(param_file)
+    rows = []
+    for label, overrides in CONFIGURATIONS:
+        overrides['sync_mode'] = 'events'
+        overrides['multisplit'] = False
+        if tStop is not None:
+            overrides['tStop'] = tStop
+        if not param['stimulated_spines']:
+            overrides['stimulated_spines'] = get_stimulated_spines(param)
+        results = run_child('helpers.cvode_benchmark', param_file, overrides)
+        rows.append((label, results))
+    reference = rows[0][1]
+    for label, results in rows:
+        results['speedup'] = reference['wall_time'] / results['wall_time']
+        results['max_dw'] = max_weight_difference(reference['weights'],
+                                                  results['weights'])
+    print_report("CVode benchmark: %s" %param_file, rows,
+                 ['steps', 'wall_time', 'speedup', 'max_dw'])
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == '--child':
+        child_main(sys.argv, run)
+    elif len(sys.argv) in (2, 3):
+        tStop = None
+        if len(sys.argv) == 3:
+            tStop = float(sys.argv[2])
+        compare_integrators(sys.argv[1], tStop)
+    else:
+        print __doc__
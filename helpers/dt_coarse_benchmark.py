@@ -0,0 +1,85 @@
+"""
+Benchmark the dual rate fixed step (`dt_coarse` between the inputs,
+dtNeuron around them) against dtNeuron everywhere, on a long_tstop param
+file.
+
+Usage (from the top directory)::
+
+    python -m helpers.dt_coarse_benchmark param/long_tstop_allspines_1_spine_4Hz.param [tStop] [dt_coarse ...]
+
+The coarse dts are 0.1 and 0.25 ms by default; the recording interval is
+set to the largest one. If tStop [ms] is given it overrides the one in the
+param file. If the param file has no stimulated spines the spines with a
+list of stims are stimulated.
+
+coarse_fraction is the fraction of the simulated time run with the coarse
+dt. max_dw is the maximum absolute difference of the AMPA weights and
+max_dv_soma the one of the soma voltage [mV] from the run at dtNeuron.
+"""
+
+import sys
+
+from helpers.benchmark import (load_param, run_child, child_main, run_runner,
+                               print_report)
+from helpers.bio_backend_benchmark import get_stimulated_spines
+from helpers.pipeline_benchmark import max_weight_difference
+from helpers.reduction_benchmark import SOMA, max_voltage_difference
+
+DT_COARSE = [0.1, 0.25]
+
+
+def run(param):
+    runner = run_runner(param)
+    weights = {}
+    for spine_id in param['stimulated_spines']:
+        spine = runner.nrnManager.spines[spine_id]
+        for syn in spine.synapses:
+            if syn.chan_type == 'ampa':
+                weights[spine_id] = [list(syn.weight[0]), list(syn.weight[1])]
+    vecs = runner.build_vecs_to_plot('v', [SOMA], runner.manager.refs['VecRef'])
+    return {'coarse_fraction' : (runner.t_coarse /
+                                (runner.t_coarse + runner.t_fine)),
+            'weights' : weights,
+            'v' : {SOMA : list(vecs[SOMA + '_v'])}}
+
+def compare_dt(param_file, tStop=None, dts=DT_COARSE):
+    param = load_param(param_file)
+    configurations = [('dtNeuron', {'dt_coarse' : None})]
+    for dt_coarse in dts:
+        configurations.append(("dt_coarse %s ms" %dt_coarse,
+                               {'dt_coarse' : dt_coarse}))
+    rows = []
+    for label, overrides in configurations:
+        overrides['neuron_time_recording_interval'] = max(dts)
+        overrides['sec_to_rec'] = [SOMA]
+        overrides['var_to_plot'] = ['v']
+        if tStop is not None:
+            overrides['tStop'] = tStop
+        if not param['stimulated_spines']:
+            overrides['stimulated_spines'] = get_stimulated_spines(param)
+        results = run_child('helpers.dt_coarse_benchmark', param_file,
+                            overrides)
+        rows.append((label, results))
+    reference = rows[0][1]
+    for label, results in rows:
+        results['speedup'] = reference['wall_time'] / results['wall_time']
+        results['max_dw'] = max_weight_difference(reference['weights'],
+                                                  results['weights'])
+        results['max_dv_soma'] = max_voltage_difference(reference['v'],
+                                                        results['v'], [SOMA])
+    print_report("Dual rate dt benchmark: %s" %param_file, rows,
+                 ['coarse_fraction', 'wall_time', 'speedup', 'max_dw',
+                  'max_dv_soma'])
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == '--child':
+        child_main(sys.argv, run)
+    elif len(sys.argv) > 1:
+        tStop = None
+        if len(sys.argv) > 2:
+            tStop = float(sys.argv[2])
+        dts = [float(dt) for dt in sys.argv[3:]] or DT_COARSE
+        compare_dt(sys.argv[1], tStop, dts)
+    else:
+        print __doc__
@@ -0,0 +1,106 @@
+"""
+Cache on disk of the state of the simulators after the equilibrium.
+
+The NEURON state is saved with SaveState, the values of the E-Cell
+variables (the same for all the spines, which get no input during the
+equilibrium) with cPickle. The files are named after a hash of the
+parameters which change the equilibrium, so a param file which differs
+only for the stimulation protocol finds the state of a previous run.
+
+The stimulated spines and the bio backend are part of the key because
+SaveState can only be restored on the same set of synapses and mechanisms.
+"""
+
+import cPickle
+import hashlib
+import json
+import os
+
+from neuron import h
+
+import logging
+logger = logging.getLogger(__name__)
+
+KEY_PARAMS = ('dtNeuron',
+              'kir_gkbar',
+              'spines_dist',
+              'reduced_spines',
+              'reduced_spines_neighbours',
+              'd_lambda',
+              'd_lambda_freq',
+              'big_spine',
+              'biochemical_filename',
+              't_equilibrium_neuron',
+              't_equilibrium_ecell',
+              'equilibrium_mode',
+              'bio_backend',
+              'integrator',
+              'cvode_atol',
+              'cvode_local_dt'
+              )
+
+
+def get_key(param, stimulated_spines):
+    """Hash of the parameters defining the equilibrium and of the content
+    of the biochemical model"""
+    items = [(name, param.get(name)) for name in KEY_PARAMS]
+    items.append(('stimulated_spines', sorted(stimulated_spines)))
+    f = open(param['biochemical_filename'], 'rb')
+    items.append(('biochemical_model', hashlib.md5(f.read()).hexdigest()))
+    f.close()
+    return hashlib.md5(json.dumps(items, sort_keys=True)).hexdigest()
+
+
+def restore_state(ss, spines):
+    """Restore the SaveState ss after the finitialize, keeping the events of
+    the current stims, and rewind the vecStims of the spines, which the
+    restore points to the saved vectors."""
+    ss.restore(1)
+    for spine in spines:
+        spine.rewind_stims()
+
+
+class EquilibriumCache(object):
+    """Save and restore the state after the equilibrium in cache_dir"""
+
+    def __init__(self, cache_dir, param, stimulated_spines):
+        self.cache_dir = cache_dir
+        self.key = get_key(param, stimulated_spines)
+        self.nrn_file = os.path.join(cache_dir, self.key + '.dat')
+        self.bio_file = os.path.join(cache_dir, self.key + '.pickle')
+
+    def exists(self):
+        return os.path.exists(self.nrn_file) and os.path.exists(self.bio_file)
+
+    def save(self, bio_values):
+        """Save the current NEURON state and the biochemical values (a
+        dictionary of the E-Cell variables or None)"""
+        if not os.path.exists(self.cache_dir):
+            os.makedirs(self.cache_dir)
+        ss = h.SaveState()
+        ss.save()
+        f = h.File()
+        f.wopen(self.nrn_file)
+        ss.fwrite(f)
+        f.close()
+        f = open(self.bio_file, 'wb')
+        cPickle.dump(bio_values, f, cPickle.HIGHEST_PROTOCOL)
+        f.close()
+        logger.info("Equilibrium saved in the cache: %s" %self.key)
+
+    def restore(self, spines):
+        """Restore the NEURON state and return the biochemical values.
+
+        To be called after the finitialize: the event queue is not
+        restored, so the stims of the current protocol are kept."""
+        ss = h.SaveState()
+        f = h.File()
+        f.ropen(self.nrn_file)
+        ss.fread(f)
+        f.close()
+        restore_state(ss, spines)
+        f = open(self.bio_file, 'rb')
+        bio_values = cPickle.load(f)
+        f.close()
+        logger.info("Equilibrium restored from the cache: %s" %self.key)
+        return bio_values
@@ -0,0 +1,85 @@
+"""
+Benchmark the 'pipelined' sync mode, with pipeline_lag 0 and 1, against the
+synchronous 'events' one, all with the 'pool' bio backend.
+
+Usage (from the top directory)::
+
+    python -m helpers.pipeline_benchmark param/long_tstop_allbranch_cpm_two_branches_stims_20_Hz.param [tStop]
+
+If tStop [ms] is given it overrides the one in the param file. If the param
+file has no stimulated spines the spines with a list of stims are
+stimulated.
+
+max_dw is the maximum absolute difference of the AMPA weights from the
+synchronous run, over all the stimulated spines; the pipelined weights are
+interpolated on the times of the synchronous ones.
+"""
+
+import sys
+
+import numpy
+
+from helpers.benchmark import (load_param, run_child, child_main, run_runner,
+                               print_report)
+from helpers.bio_backend_benchmark import get_stimulated_spines
+
+# label, sync_mode, pipeline_lag
+SYNC_MODES = [('events', 'events', 1),
+              ('pipelined lag 0', 'pipelined', 0),
+              ('pipelined lag 1', 'pipelined', 1)]
+
+
+def run(param):
+    runner = run_runner(param)
+    weights = {}
+    for spine_id in param['stimulated_spines']:
+        spine = runner.nrnManager.spines[spine_id]
+        for syn in spine.synapses:
+            if syn.chan_type == 'ampa':
+                weights[spine_id] = [list(syn.weight[0]), list(syn.weight[1])]
+    return {'sync_mode' : param['sync_mode'],
+            'pipeline_lag' : param.get('pipeline_lag', 1),
+            'weights' : weights}
+
+def max_weight_difference(reference, weights):
+    differences = []
+    for spine_id in reference:
+        t_ref, w_ref = reference[spine_id]
+        t, w = weights[spine_id]
+        w_interp = numpy.interp(t_ref, t, w)
+        differences.append(numpy.abs(w_interp - numpy.array(w_ref)).max())
+    return max(differences)
+
+def compare_pipeline(param_file, tStop=None):
+    param = load_param(param_file)
+    overrides = {'bio_backend' : 'pool'}
+    if tStop is not None:
+        overrides['tStop'] = tStop
+    if not param['stimulated_spines']:
+        overrides['stimulated_spines'] = get_stimulated_spines(param)
+    rows = []
+    for label, sync_mode, lag in SYNC_MODES:
+        overrides['sync_mode'] = sync_mode
+        overrides['pipeline_lag'] = lag
+        results = run_child('helpers.pipeline_benchmark', param_file,
+                            overrides)
+        rows.append((label, results))
+    reference = rows[0][1]
+    for label, results in rows:
+        results['speedup'] = reference['wall_time'] / results['wall_time']
+        results['max_dw'] = max_weight_difference(reference['weights'],
+                                                  results['weights'])
+    print_report("Pipeline benchmark: %s" %param_file, rows,
+                 ['wall_time', 'process_time', 'speedup', 'max_dw'])
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == '--child':
+        child_main(sys.argv, run)
+    elif len(sys.argv) in (2, 3):
+        tStop = None
+        if len(sys.argv) == 3:
+            tStop = float(sys.argv[2])
+        compare_pipeline(sys.argv[1], tStop)
+    else:
+        print __doc__
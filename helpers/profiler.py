@@ -0,0 +1,137 @@
+"""
+Wall clock time and counters of the phases of the co-simulation.
+
+The Profiler replaces the methods of the phases with timed wrappers, on the
+instances only (the Runner and the NeuronManager): without the `profile`
+param nothing is wrapped and the loop runs the plain methods.
+
+A phase called inside another one (advance_ecell inside synch_simulators)
+counts in both: `time` is the total time of the calls, `self_time` the time
+not spent in the other phases. The calls of the per spine phases are also
+counted for each spine. `neuron_steps` is the number of fixed steps of
+NEURON, from the time integrated over dt.
+
+The profile is saved as json, next to storage.h5::
+
+    {"wall_time" : ...,
+     "phases" : {"advance_ecell" : {"calls" : ..., "time" : ...,
+                                    "self_time" : ...,
+                                    "per_spine" : {"spine1" : ...}}, ...},
+     "counters" : {"neuron_steps" : ..., "syncs" : {"spine1" : ...}}}
+"""
+
+import json
+import time
+
+from neuron import h
+
+import logging
+logger = logging.getLogger(__name__)
+
+# Methods of the Runner timed, and the ones called for each spine
+PHASES = ['build_model',
+          'equilibrium',
+          'run_simulation',
+          'advance_quickly',
+          'synch_simulators',
+          'save_results',
+          'plot_results']
+SPINE_PHASES = ['advance_ecell',
+                'update_synape_weight']
+
+
+class Profiler(object):
+    """Time the phases of a Runner and count the NEURON steps and the
+    syncs of each spine"""
+
+    def __init__(self, count_steps=True):
+        """
+        :param
+            count_steps - count the NEURON steps, only with the fixed step
+        """
+        self.count_steps = count_steps
+        self.start = time.time()
+        self.phases = {}
+        self.counters = {'neuron_steps' : 0, 'syncs' : {}}
+        self.stack = [] # time of the nested phases of the open calls
+
+    def instrument_runner(self, runner):
+        for name in PHASES:
+            self.wrap(runner, name)
+        for name in SPINE_PHASES:
+            self.wrap(runner, name, per_spine=True)
+        # The while sync_mode steps NEURON from python
+        self.wrap(runner, 'synch_simulators_while', steps=True)
+        # The flux is read once for each sync of the spine
+        self.wrap(runner, 'get_calcium_flux', per_spine=True,
+                  counter='syncs')
+
+    def instrument_neuron(self, nrnManager):
+        """Time the integration of NEURON (also called by run)"""
+        self.wrap(nrnManager, 'solve', 'neuron_solve', steps=True)
+
+    def instrument_recorder(self, recorder):
+        self.wrap(recorder, 'flush', 'recording_flush')
+
+    def wrap(self, obj, name, label=None, per_spine=False, steps=False,
+             counter=None):
+        """Replace the method name of obj with a timed one.
+
+        :param
+            per_spine - the first argument is a spine: count its calls
+            steps - count the NEURON steps of the call
+            counter - also count the calls for each spine in this counter
+        """
+        function = getattr(obj, name)
+        if label is None:
+            label = name
+        phase = self.phases.setdefault(label, {'calls' : 0, 'time' : 0.,
+                                               'self_time' : 0.})
+        if per_spine:
+            phase['per_spine'] = {}
+        def timed(*args, **kwargs):
+            if per_spine:
+                spine_id = args[0].id
+                phase['per_spine'][spine_id] = phase['per_spine'].get(spine_id, 0) + 1
+                if counter is not None:
+                    counts = self.counters[counter]
+                    counts[spine_id] = counts.get(spine_id, 0) + 1
+            if steps:
+                t_start = h.t
+            start = time.time()
+            self.stack.append(0.)
+            try:
+                return function(*args, **kwargs)
+            finally:
+                elapsed = time.time() - start
+                nested = self.stack.pop()
+                if self.stack:
+                    self.stack[-1] += elapsed
+                phase['calls'] += 1
+                phase['time'] += elapsed
+                phase['self_time'] += elapsed - nested
+                if steps and self.count_steps:
+                    self.counters['neuron_steps'] += int(round((h.t - t_start) /
+                                                               h.dt))
+        setattr(obj, name, timed)
+
+    def get_profile(self):
+        return {'wall_time' : time.time() - self.start,
+                'phases' : self.phases,
+                'counters' : self.counters}
+
+    def save(self, filename):
+        """Save the profile as json and log the phases"""
+        profile = self.get_profile()
+        f = open(filename, 'w')
+        json.dump(profile, f, indent=1, sort_keys=True)
+        f.close()
+        logger.info("Profile saved in %s. Wall time: %.2f s, NEURON steps: %d"
+                    %(filename, profile['wall_time'],
+                      self.counters['neuron_steps']))
+        for label, phase in sorted(self.phases.items(),
+                                   key=lambda item: -item[1]['time']):
+            if phase['calls']:
+                logger.info("%-25s calls: %8d time: %9.3f s self: %9.3f s"
+                            %(label, phase['calls'], phase['time'],
+                              phase['self_time']))
@@ -0,0 +1,90 @@
+"""
+Benchmark the reduced spines mode against the model with all the spines
+explicit.
+
+Usage (from the top directory)::
+
+    python -m helpers.reduction_benchmark param/long_tstop_allspines_1_spine_20Hz.param [tStop] [neighbours ...]
+
+The spines are distributed as in the param file. If tStop [ms] is given it
+overrides the one in the param file; neighbours [um] is
+reduced_spines_neighbours of each reduced run (0 and 5 by default).
+
+max_dv_soma and max_dv_heads are the maximum absolute differences [mV] of
+the voltage of the soma and of the heads of the stimulated spines from the
+full model.
+"""
+
+import sys
+
+import numpy
+
+from helpers.benchmark import (load_param, run_child, child_main, run_runner,
+                               print_report)
+
+SOMA = 'MSP_Cell[0].soma'
+NEIGHBOURS = [0, 5]
+
+
+def get_sections(param):
+    return [SOMA] + [spine_id + '_head' for spine_id in param['stimulated_spines']]
+
+def run(param):
+    runner = run_runner(param)
+    sections = get_sections(param)
+    vecs = runner.build_vecs_to_plot('v', sections,
+                                     runner.manager.refs['VecRef'])
+    return {'n_spines' : len(runner.nrnManager.spines),
+            'v' : dict([(sec_name, list(vecs[sec_name + '_v']))
+                        for sec_name in sections])}
+
+def max_voltage_difference(reference, v, sections):
+    differences = []
+    for sec_name in sections:
+        v_ref = numpy.array(reference[sec_name])
+        v_sec = numpy.array(v[sec_name])
+        n = min(len(v_ref), len(v_sec))
+        differences.append(numpy.abs(v_sec[:n] - v_ref[:n]).max())
+    return float(max(differences))
+
+def compare_reduction(param_file, tStop=None, neighbours=NEIGHBOURS):
+    param = load_param(param_file)
+    sections = get_sections(param)
+    configurations = [('full', {'reduced_spines' : False})]
+    for distance in neighbours:
+        configurations.append(("reduced, neighbours %s um" %distance,
+                               {'reduced_spines' : True,
+                                'reduced_spines_neighbours' : distance}))
+    rows = []
+    for label, overrides in configurations:
+        overrides['sec_to_rec'] = sections
+        overrides['var_to_plot'] = ['v']
+        if tStop is not None:
+            overrides['tStop'] = tStop
+        results = run_child('helpers.reduction_benchmark', param_file,
+                            overrides)
+        rows.append((label, results))
+    reference = rows[0][1]
+    for label, results in rows:
+        results['speedup'] = reference['wall_time'] / results['wall_time']
+        results['max_dv_soma'] = max_voltage_difference(reference['v'],
+                                                        results['v'], [SOMA])
+        results['max_dv_heads'] = max_voltage_difference(reference['v'],
+                                                         results['v'],
+                                                         sections[1:] or [SOMA])
+    print_report("Reduction benchmark: %s" %param_file, rows,
+                 ['n_spines', 'wall_time', 'process_time', 'speedup',
+                  'max_dv_soma', 'max_dv_heads'])
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == '--child':
+        child_main(sys.argv, run)
+    elif len(sys.argv) > 1:
+        tStop = None
+        if len(sys.argv) > 2:
+            tStop = float(sys.argv[2])
+        neighbours = [float(d) for d in sys.argv[3:]] or NEIGHBOURS
+        compare_reduction(sys.argv[1], tStop, neighbours)
+    else:
+        print __doc__
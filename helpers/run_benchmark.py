@@ -0,0 +1,90 @@
+"""
+Benchmark NeuronManager.run, which hands the interval to NEURON (psolve),
+against the python loop of fadvance it replaces.
+
+Usage (from the top directory)::
+
+    python -m helpers.run_benchmark param/default.param [tStop] [spines_dist ...]
+
+Only the electrical model is built, with the spines of each distribution
+('two' and 'onebranch' by default) and the threads of the param file, and
+run from the initialization to tStop [ms] (default 1000) in steps of
+`t_buffer`, as advance_quickly does. Both loops run in the same process,
+each after a finitialize.
+
+t_end is the last time reached: the python loop can go one dt past the
+requested time. max_dv is the maximum absolute difference [mV] of the soma
+voltage between the two.
+"""
+
+import sys
+import time
+
+import numpy
+
+from helpers.benchmark import run_child, child_main, print_report
+
+SPINES_DISTS = ['two', 'onebranch']
+
+
+def time_run(nrnManager, run, tStop, interval):
+    from neuron import h
+    v = h.Vector()
+    v.record(h.MSP_Cell[0].soma(0.5)._ref_v)
+    nrnManager.init()
+    start = time.time()
+    t = 0
+    while t < tStop:
+        t = min(t + interval, tStop)
+        run(t)
+    return time.time() - start, h.t, numpy.array(v)
+
+def run(param):
+    from neuronControl.nrnManager import NeuronManager
+    nrnManager = NeuronManager(param['biochemical_filename'],
+                               param['big_spine'],
+                               param['dtNeuron'],
+                               spines_dist=param['spines_dist'],
+                               mod_path='mod',
+                               hoc_path='hoc')
+    nrnManager.set_kir_gkbar(param['kir_gkbar'])
+    nrnManager.enable_threads(param['nthreads'],
+                              multisplit_on=param.get('multisplit', False))
+    results = {'spines_dist' : param['spines_dist'],
+               'n_spines' : len(nrnManager.spines)}
+    vs = []
+    for name, run_function in (('fadvance', nrnManager.fadvance_until),
+                               ('psolve', nrnManager.run)):
+        run_time, t_end, v = time_run(nrnManager, run_function, param['tStop'],
+                                      param['t_buffer'])
+        results[name + '_time'] = run_time
+        results[name + '_t_end'] = t_end
+        vs.append(v)
+    n = min(len(vs[0]), len(vs[1]))
+    results['max_dv'] = float(numpy.abs(vs[0][:n] - vs[1][:n]).max())
+    return results
+
+def compare_run(param_file, tStop=1000., spines_dists=SPINES_DISTS):
+    rows = []
+    for spines_dist in spines_dists:
+        overrides = {'spines_dist' : spines_dist,
+                     'tStop' : tStop}
+        results = run_child('helpers.run_benchmark', param_file, overrides)
+        results['speedup'] = results['fadvance_time'] / results['psolve_time']
+        rows.append((spines_dist, results))
+    print_report("Run benchmark: %s" %param_file, rows,
+                 ['n_spines', 'fadvance_time', 'psolve_time', 'speedup',
+                  'fadvance_t_end', 'psolve_t_end', 'max_dv'])
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == '--child':
+        child_main(sys.argv, run)
+    elif len(sys.argv) > 1:
+        tStop = 1000.
+        if len(sys.argv) > 2:
+            tStop = float(sys.argv[2])
+        spines_dists = sys.argv[3:] or SPINES_DISTS
+        compare_run(sys.argv[1], tStop, spines_dists)
+    else:
+        print __doc__
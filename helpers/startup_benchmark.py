@@ -0,0 +1,60 @@
+"""
+Benchmark the startup of the model: the time to load the MSN and to build
+the spines, for different spine distributions.
+
+Usage (from the top directory)::
+
+    python -m helpers.startup_benchmark param/default.param [spines_dist ...]
+
+The default distributions are 'zero', 'onebranch' and 'all' (big spines).
+per_spine is the time to build one spine [ms]: the startup time over the
+one without spines, divided by the number of spines. The model is only
+built, not initialized or run.
+"""
+
+import sys
+import time
+
+from helpers.benchmark import run_child, child_main, print_report
+
+SPINES_DISTS = ['zero', 'onebranch', 'all']
+
+
+def run(param):
+    from neuronControl.nrnManager import NeuronManager
+    start = time.time()
+    nrnManager = NeuronManager(param['biochemical_filename'],
+                               param['big_spine'],
+                               param['dtNeuron'],
+                               spines_dist=param['spines_dist'],
+                               mod_path='mod',
+                               hoc_path='hoc')
+    return {'spines_dist' : param['spines_dist'],
+            'n_spines' : len(nrnManager.spines),
+            'startup_time' : time.time() - start}
+
+def compare_startup(param_file, spines_dists=SPINES_DISTS):
+    rows = []
+    for spines_dist in spines_dists:
+        overrides = {'spines_dist' : spines_dist,
+                     'big_spine' : True}
+        results = run_child('helpers.startup_benchmark', param_file, overrides)
+        rows.append((spines_dist, results))
+    reference = rows[0][1]
+    for label, results in rows:
+        if results['n_spines'] > 0 and reference['n_spines'] == 0:
+            results['per_spine'] = ((results['startup_time'] -
+                                     reference['startup_time']) /
+                                    results['n_spines'] * 1e3)
+    print_report("Startup benchmark: %s" %param_file, rows,
+                 ['n_spines', 'startup_time', 'process_time', 'per_spine'])
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == '--child':
+        child_main(sys.argv, run)
+    elif len(sys.argv) > 1:
+        spines_dists = sys.argv[2:] or SPINES_DISTS
+        compare_startup(sys.argv[1], spines_dists)
+    else:
+        print __doc__
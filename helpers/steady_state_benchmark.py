@@ -0,0 +1,76 @@
+"""
+Benchmark the steady_state equilibrium_mode against the integration of the
+equilibrium ('each'), for the biochemical backends.
+
+Usage (from the top directory)::
+
+    python -m helpers.steady_state_benchmark param/default.param [bio_backend ...]
+
+The backends are 'ecell' and 'batched' by default, 'pool' can be given. Only the model and the
+equilibrium are run, without the equilibrium_cache. If the param file has
+no stimulated spines the spines with a list of stims are stimulated.
+
+equilibrium_time is the time of the whole Runner.equilibrium [s]: the
+NEURON run, the solve and the setting or integration of every session.
+time_saved is the one saved by the steady state on the same backend. dampa_percent is the
+maximum difference of ampa_equilibrium_conc from the integrated one, in
+percent of it.
+"""
+
+import sys
+import time
+
+from helpers.benchmark import load_param, run_child, child_main, print_report
+from helpers.bio_backend_benchmark import get_stimulated_spines
+
+BIO_BACKENDS = ['ecell', 'batched']
+EQUILIBRIUM_MODES = ['each', 'steady_state']
+
+
+def run(param):
+    from spineIntegration import Runner
+    runner = Runner(param)
+    nrnManager, timeline = runner.build_model()
+    start = time.time()
+    runner.equilibrium(nrnManager)
+    ampa = dict([(spine_id, nrnManager.spines[spine_id].ampa_equilibrium_conc)
+                 for spine_id in param['stimulated_spines']])
+    return {'equilibrium_time' : time.time() - start,
+            'ampa_equilibrium_conc' : ampa}
+
+def max_relative_difference(reference, values):
+    return max([abs(values[key] - reference[key]) / abs(reference[key])
+                for key in reference])
+
+def compare_steady_state(param_file, bio_backends=BIO_BACKENDS):
+    param = load_param(param_file)
+    rows = []
+    for bio_backend in bio_backends:
+        results_modes = []
+        for equilibrium_mode in EQUILIBRIUM_MODES:
+            overrides = {'bio_backend' : bio_backend,
+                         'equilibrium_mode' : equilibrium_mode,
+                         'equilibrium_cache' : None}
+            if not param['stimulated_spines']:
+                overrides['stimulated_spines'] = get_stimulated_spines(param)
+            results = run_child('helpers.steady_state_benchmark', param_file,
+                                overrides)
+            results_modes.append(results)
+            rows.append(("%s %s" %(bio_backend, equilibrium_mode), results))
+        reference, results = results_modes
+        results['time_saved'] = (reference['equilibrium_time'] -
+                                 results['equilibrium_time'])
+        results['dampa_percent'] = 100 * max_relative_difference(
+            reference['ampa_equilibrium_conc'], results['ampa_equilibrium_conc'])
+    print_report("Steady state benchmark: %s" %param_file, rows,
+                 ['equilibrium_time', 'time_saved', 'dampa_percent'])
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == '--child':
+        child_main(sys.argv, run)
+    elif len(sys.argv) > 1:
+        bio_backends = sys.argv[2:] or BIO_BACKENDS
+        compare_steady_state(sys.argv[1], bio_backends)
+    else:
+        print __doc__
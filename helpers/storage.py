@@ -0,0 +1,158 @@
+"""
+Typed and compressed storage of the results.
+
+storage.h5 keeps the layout written by neuronvisio's Manager.save_to_hdf
+(/results/<group>/x and /results/<group>/<section>/<variable>), so
+load_from_hdf and the scripts reading the nodes directly work as before.
+The options, from the param file, are:
+
+- `storage_float32`: the recorded variables are stored as float32. The
+  time axes and the spike times stay float64.
+- `storage_compression`: 'zlib' or 'blosc' stores the arrays chunked and
+  compressed (level 5, with shuffle).
+- `storage_shared_time`: a time axis equal to one already written (the x
+  of VecRef and SynVecRef, the E-Cell times of the batched spines, ...) is
+  stored as a hard link to it.
+
+To convert an old storage.h5 and compare the file size and the read time
+of the options::
+
+    python -m helpers.storage_benchmark Data/<date>/Sim_<n>/storage.h5
+"""
+
+import hashlib
+
+import numpy
+import tables
+
+COMPLEVEL = 5
+
+
+def is_event_record(var):
+    """The synapses record the spike times of the NetCon as 'stimul_<type>':
+    they are times, not sampled with the x of the group."""
+    return var.startswith('stimul_')
+
+def get_storage_options(param):
+    """The storage options in the param, as keyword arguments of the
+    StorageWriter"""
+    return {'float32' : param.get('storage_float32', False),
+            'complib' : param.get('storage_compression'),
+            'shared_time' : param.get('storage_shared_time', False)}
+
+def is_default(options):
+    """True if the options give the file of Manager.save_to_hdf"""
+    return not (options['float32'] or options['complib'] or
+                options['shared_time'])
+
+
+class StorageWriter(object):
+    """Write the arrays of the results in h5f with the storage options"""
+
+    def __init__(self, h5f, float32=False, complib=None, shared_time=False):
+        self.h5f = h5f
+        self.float32 = float32
+        self.shared_time = shared_time
+        self.filters = None
+        if complib:
+            self.filters = tables.Filters(complevel=COMPLEVEL, complib=complib,
+                                          shuffle=True)
+        self.time_nodes = {}
+
+    def get_atom(self, is_time):
+        if self.float32 and not is_time:
+            return tables.Float32Atom()
+        return tables.Float64Atom()
+
+    def time_key(self, values):
+        values = numpy.ascontiguousarray(values, dtype=numpy.float64)
+        return (len(values), hashlib.md5(values.tostring()).hexdigest())
+
+    def add_time_node(self, node):
+        """Share a time axis already in the file (e.g. streamed)"""
+        if self.shared_time:
+            self.time_nodes.setdefault(self.time_key(node.read()), node)
+
+    def write_time(self, where, name, values):
+        """Write a time axis, or link it to an equal one"""
+        values = numpy.asarray(values, dtype=numpy.float64)
+        if self.shared_time:
+            key = self.time_key(values)
+            if self.time_nodes.has_key(key):
+                return self.h5f.createHardLink(where, name, self.time_nodes[key])
+        node = self.write(where, name, values, '')
+        if self.shared_time:
+            self.time_nodes[key] = node
+        return node
+
+    def write_values(self, where, name, values, title='', is_time=False):
+        """Write a recorded variable, as float32 with the float32 option
+        unless it holds times"""
+        atom = self.get_atom(is_time)
+        values = numpy.asarray(values, dtype=atom.dtype)
+        return self.write(where, name, values, title)
+
+    def write(self, where, name, values, title):
+        if self.filters is None or len(values) == 0:
+            return self.h5f.createArray(where, name, values, title=title)
+        node = self.h5f.createCArray(where, name,
+                                     tables.Atom.from_dtype(values.dtype),
+                                     values.shape, title=title,
+                                     filters=self.filters)
+        node[:] = values
+        return node
+
+    def save_refs(self, manager, results, group, refs):
+        """Write a group of refs of the manager, as Manager._save_baseRef"""
+        group_node = self.h5f.createGroup(results, group)
+        self.write_time(group_node, 'x', numpy.array(manager.groups[group]))
+        sections = {}
+        for ref in refs:
+            section_name = manager.sanitized_sec(ref.sec_name)
+            if not sections.has_key(section_name):
+                sections[section_name] = self.h5f.createGroup(group_node,
+                                                              section_name)
+            detail = getattr(ref, 'detail', '')
+            for var, vec in ref.vecs.iteritems():
+                if len(vec) != 0:
+                    self.write_values(sections[section_name], var,
+                                      numpy.array(vec), title=detail,
+                                      is_time=is_event_record(var))
+
+
+def save_to_hdf(manager, filename, options):
+    """Manager.save_to_hdf with the storage options"""
+    h5f = tables.openFile(filename, 'w')
+    try:
+        manager._save_geom(h5f)
+        results = h5f.createGroup('/', manager.results_root)
+        writer = StorageWriter(h5f, **options)
+        for group, refs in manager.refs.iteritems():
+            writer.save_refs(manager, results, group, refs)
+    finally:
+        h5f.close()
+
+def convert(src_filename, dst_filename, options):
+    """Write the content of a storage.h5 in a new file with the options"""
+    src = tables.openFile(src_filename)
+    dst = tables.openFile(dst_filename, 'w')
+    try:
+        for node in src.root:
+            if node._v_name != 'results':
+                node._f_copy(dst.root, recursive=True)
+        writer = StorageWriter(dst, **options)
+        results = dst.createGroup('/', 'results')
+        for group in src.root.results:
+            group_node = dst.createGroup(results, group._v_name)
+            writer.write_time(group_node, 'x', group.x.read())
+            for section in group:
+                if section._v_name == 'x':
+                    continue
+                section_node = dst.createGroup(group_node, section._v_name)
+                for array in section:
+                    writer.write_values(section_node, array._v_name,
+                                        array.read(), title=array._v_title,
+                                        is_time=is_event_record(array._v_name))
+    finally:
+        dst.close()
+        src.close()
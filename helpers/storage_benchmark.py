@@ -0,0 +1,87 @@
+"""
+Benchmark the storage options on the storage.h5 of a run, e.g. a long_tstop
+one.
+
+Usage (from the top directory)::
+
+    python -m helpers.storage_benchmark Data/<date>/Sim_<n>/storage.h5
+
+The file is converted with each configuration of storage options in a
+temporary directory. For each configuration the report gives the size of
+the file [MB], the time to write it and to read back all the arrays [s]
+and max_error, the maximum absolute difference of the arrays from the
+original file.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import numpy
+import tables
+
+from helpers.benchmark import print_report
+from helpers.storage import convert
+
+CONFIGURATIONS = [
+    ('float64', {}),
+    ('shared_time', {'shared_time' : True}),
+    ('float32', {'float32' : True, 'shared_time' : True}),
+    ('float32+zlib', {'float32' : True, 'shared_time' : True,
+                      'complib' : 'zlib'}),
+    ('float32+blosc', {'float32' : True, 'shared_time' : True,
+                       'complib' : 'blosc'}),
+]
+
+
+def read_arrays(filename):
+    """Read all the arrays of the results, keyed by path"""
+    h5f = tables.openFile(filename)
+    try:
+        arrays = {}
+        for node in h5f.walkNodes('/results', classname='Array'):
+            arrays[node._v_pathname] = node.read()
+    finally:
+        h5f.close()
+    return arrays
+
+def max_error(reference, arrays):
+    error = 0.
+    for path, values in reference.iteritems():
+        if len(values) != 0:
+            difference = numpy.abs(numpy.asarray(arrays[path], dtype=float) - values)
+            error = max(error, difference.max())
+    return error
+
+def compare_storage(filename):
+    tmp_dir = tempfile.mkdtemp(prefix='storage_benchmark_')
+    try:
+        start = time.time()
+        reference = read_arrays(filename)
+        rows = [('original', {'size' : os.path.getsize(filename) / 1e6,
+                              'read_time' : time.time() - start})]
+        for label, options in CONFIGURATIONS:
+            dst_filename = os.path.join(tmp_dir, label + '.h5')
+            start = time.time()
+            convert(filename, dst_filename, options)
+            write_time = time.time() - start
+            start = time.time()
+            arrays = read_arrays(dst_filename)
+            read_time = time.time() - start
+            rows.append((label, {'size' : os.path.getsize(dst_filename) / 1e6,
+                                 'write_time' : write_time,
+                                 'read_time' : read_time,
+                                 'max_error' : max_error(reference, arrays)}))
+    finally:
+        shutil.rmtree(tmp_dir)
+    print_report("Storage benchmark: %s" %filename, rows,
+                 ['size', 'write_time', 'read_time', 'max_error'])
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 2:
+        compare_storage(sys.argv[1])
+    else:
+        print __doc__
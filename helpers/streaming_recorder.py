@@ -0,0 +1,165 @@
+"""
+Stream the NEURON recordings to the HDF5 file during the run.
+
+Without streaming all the recorded vectors stay in memory till
+save_results. The StreamingRecorder writes the VecRef and SynVecRef groups
+of the neuronvisio Manager into extendable (chunked) arrays of a temporary
+file: each flush appends the samples recorded so far and removes them from
+the vectors, but the last `keep`. The memory is then bounded by the flush
+interval.
+
+At the end the other groups (biochemical time series, weights, ...) and the
+geometry are added and the file is moved where save_results puts
+storage.h5. The layout is the one of save_to_hdf, so load_from_hdf reads
+it. The storage options (float32, compression, shared time axes) are the
+ones of helpers/storage.py.
+"""
+
+import os
+import shutil
+import tempfile
+
+import numpy
+import tables
+
+from helpers.storage import StorageWriter, is_event_record
+
+import logging
+logger = logging.getLogger(__name__)
+
+STREAMED_GROUPS = ('VecRef', 'SynVecRef')
+
+
+class StreamingRecorder(object):
+    """Stream the time sampled vectors of the manager to an HDF5 file
+
+    :param
+        manager - neuronvisio Manager with the vectors
+        keep - samples left in the vectors at each flush
+        expectedrows - expected length of the recordings, sets the chunks
+        tmp_dir - directory of the temporary file
+        storage_options - keyword arguments of the StorageWriter
+    """
+
+    def __init__(self, manager, keep, expectedrows, tmp_dir='Data',
+                 storage_options={}):
+        self.manager = manager
+        self.keep = keep
+        self.expectedrows = expectedrows
+        if not os.path.exists(tmp_dir):
+            os.makedirs(tmp_dir)
+        fd, self.tmp_filename = tempfile.mkstemp(prefix='storage_', suffix='.h5',
+                                                 dir=tmp_dir)
+        os.close(fd)
+        self.h5f = tables.openFile(self.tmp_filename, 'w')
+        self.results = self.h5f.createGroup('/', manager.results_root)
+        self.writer = StorageWriter(self.h5f, **storage_options)
+        self.streams = [] # [vector, [(node, name, title)], [earrays]]
+        self.events = [] # (vector, node, name, title)
+        self.nodes = {}
+        for group in STREAMED_GROUPS:
+            if manager.refs.has_key(group):
+                self.add_group(group)
+        self.filename = None
+
+    def get_node(self, parent, name):
+        key = (parent._v_pathname, name)
+        if not self.nodes.has_key(key):
+            self.nodes[key] = self.h5f.createGroup(parent, name)
+        return self.nodes[key]
+
+    def add_group(self, group):
+        """Add the x and the vectors of a group of refs, in the layout of
+        Manager.save_to_hdf"""
+        group_node = self.get_node(self.results, group)
+        self.add_stream(self.manager.groups[group], group_node, 'x', '')
+        for ref in self.manager.refs[group]:
+            section_name = self.manager.sanitized_sec(ref.sec_name)
+            section_node = self.get_node(group_node, section_name)
+            detail = getattr(ref, 'detail', '')
+            for var, vec in ref.vecs.iteritems():
+                if is_event_record(var):
+                    self.events.append((vec, section_node, var, detail))
+                else:
+                    self.add_stream(vec, section_node, var, detail)
+
+    def add_stream(self, vec, node, name, title):
+        """The same vector (the time) can go in more groups"""
+        for stream in self.streams:
+            if stream[0] is vec:
+                stream[1].append((node, name, title))
+                return
+        self.streams.append([vec, [(node, name, title)], []])
+
+    def flush(self, keep=None):
+        """Append the recorded samples, but the last `keep`, to the file and
+        remove them from the vectors"""
+        if keep is None:
+            keep = self.keep
+        for stream in self.streams:
+            vec, destinations, earrays = stream
+            n = len(vec) - keep
+            if n <= 0:
+                continue # Not recording (yet)
+            if not earrays:
+                earrays.extend(self.create_earrays(destinations))
+            samples = numpy.array(vec)[:n]
+            for earray in earrays:
+                earray.append(samples)
+            vec.remove(0, n - 1)
+        self.h5f.flush()
+
+    def create_earrays(self, destinations):
+        """One array for each destination, but the shared time axes which
+        are linked to the first"""
+        is_time = destinations[0][1] == 'x'
+        earrays = []
+        for node, name, title in destinations:
+            if earrays and is_time and self.writer.shared_time:
+                self.h5f.createHardLink(node, name, earrays[0])
+                continue
+            earrays.append(self.h5f.createEArray(node, name,
+                                                 self.writer.get_atom(is_time),
+                                                 (0,), title=title,
+                                                 filters=self.writer.filters,
+                                                 expectedrows=self.expectedrows))
+        return earrays
+
+    def close(self, filename):
+        """Write all the remaining data, the other groups of the manager and
+        the geometry and move the file to filename"""
+        self.flush(keep=0)
+        for vec, node, name, title in self.events:
+            if len(vec) != 0:
+                self.writer.write_values(node, name, numpy.array(vec),
+                                         title=title, is_time=True)
+        for vec, destinations, earrays in self.streams:
+            if earrays and destinations[0][1] == 'x':
+                self.writer.add_time_node(earrays[0])
+        for group, refs in self.manager.refs.iteritems():
+            if group not in STREAMED_GROUPS:
+                self.writer.save_refs(self.manager, self.results, group, refs)
+        self.manager._save_geom(self.h5f)
+        self.h5f.close()
+        shutil.move(self.tmp_filename, filename)
+        self.filename = filename
+        logger.info("Recordings streamed to %s" %filename)
+
+    def load(self, group, section_names, var):
+        """Read back from the closed file the variable of the sections and
+        the x of the group, keyed as Runner.build_vecs_to_plot does"""
+        h5f = tables.openFile(self.filename)
+        try:
+            group_path = '/%s/%s' %(self.manager.results_root, group)
+            x = h5f.getNode(group_path + '/x').read()
+            vecs = {}
+            for section_name in section_names:
+                path = '%s/%s/%s' %(group_path,
+                                    self.manager.sanitized_sec(section_name), var)
+                try:
+                    vecs[section_name + '_' + var] = h5f.getNode(path).read()
+                except tables.NoSuchNodeError:
+                    pass
+        finally:
+            h5f.close()
+        return vecs, x
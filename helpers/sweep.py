@@ -0,0 +1,169 @@
+"""
+Run several param files which differ only for the stimulation protocol,
+building the model and running the equilibrium once.
+
+Usage (from the top directory)::
+
+    python -m helpers.sweep [--jobs N] variant_1.param variant_2.param ...
+
+The first param file builds the model and brings it to equilibrium, then a
+child process is forked for each param file: the children share the model
+copy-on-write, set their own stims and run and save their simulation as
+spineIntegration.py does (each one in its own Data directory, with a copy
+of its param file).
+
+The number of children running together is limited by the cores and by the
+available memory, taking the size of the parent as the size of a child, or
+set with --jobs.
+
+The param files have to agree on the parameters defining the model and the
+equilibrium (see helpers.equilibrium_cache.KEY_PARAMS), on bio_on and on
+the stimulated spines. NEURON threads don't survive the fork, so the parent
+runs single threaded and each child starts its own `nthreads`. The NEURON
+recordings of the children start at the end of the equilibrium.
+"""
+
+import multiprocessing
+import os
+import shutil
+import sys
+import traceback
+
+from neuron import h
+
+from helpers.benchmark import load_param
+from helpers.equilibrium_cache import KEY_PARAMS, restore_state
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+def get_structure(param):
+    """The part of the param which has to be the same in all the variants"""
+    structure = dict([(name, param.get(name)) for name in KEY_PARAMS])
+    structure['bio_on'] = param['bio_on']
+    structure['stimulated_spines'] = list(param['stimulated_spines'])
+    structure['input_spines'] = [spine_id
+                                 for spine_id in param['stimulated_spines']
+                                 if spine_id in param.keys()]
+    return structure
+
+def check_variants(param_files, params):
+    """Raise a ValueError if a variant can't share the model of the first"""
+    reference = get_structure(params[0])
+    if not reference['bio_on']:
+        raise ValueError("The sweep runs the coupled simulation: bio_on is False in %s"
+                         %param_files[0])
+    if reference['bio_backend'] == 'pool':
+        raise ValueError("The children can't share the E-Cell workers of the pool backend")
+    for param_file, param in zip(param_files[1:], params[1:]):
+        structure = get_structure(param)
+        for key in sorted(reference.keys()):
+            if structure[key] != reference[key]:
+                raise ValueError("%s differs from %s in %s: %s != %s"
+                                 %(param_file, param_files[0], key,
+                                   structure[key], reference[key]))
+
+def read_kb(filename, field):
+    """Read a field in kB from /proc/meminfo or /proc/self/status"""
+    f = open(filename)
+    try:
+        for line in f:
+            if line.startswith(field + ':'):
+                return int(line.split()[1])
+    finally:
+        f.close()
+    raise KeyError(field)
+
+def get_max_jobs():
+    """Number of children which fit in the cores and in the memory"""
+    n_cpus = multiprocessing.cpu_count()
+    try:
+        available = read_kb('/proc/meminfo', 'MemAvailable')
+        rss = read_kb('/proc/self/status', 'VmRSS')
+    except (IOError, KeyError):
+        return n_cpus
+    return max(1, min(n_cpus, available // rss))
+
+def run_variant(runner, nrnManager, state, param_file, param, lock):
+    """Run in the child: set the stims of the variant, go back to the
+    equilibrium and run and save the simulation"""
+    runner.param = param
+    nrnManager.enable_threads(param['nthreads'],
+                              multisplit_on=param.get('multisplit', False))
+    timeline = runner.update_excitatory_inputs(nrnManager)
+    # The vecStims queue the new inputs in the finitialize
+    h.finitialize(h.v_init)
+    restore_state(state, runner.get_input_spines(nrnManager))
+    runner.run_simulation(nrnManager, timeline)
+    # Two children could pick the same directory
+    lock.acquire()
+    try:
+        saving_dir = runner.manager.create_new_dir(root='Data')
+        shutil.copy(param_file, saving_dir)
+    finally:
+        lock.release()
+    runner.save_results(nrnManager, saving_dir)
+    runner.plot_results(nrnManager, saving_dir)
+    logger.info("%s saved in %s" %(param_file, saving_dir))
+
+def wait_child(running, failed):
+    pid, status = os.wait()
+    param_file = running.pop(pid)
+    if status != 0:
+        logger.error("%s failed" %param_file)
+        failed.append(param_file)
+
+def sweep(param_files, max_jobs=None):
+    """Build and equilibrate the model once and run a forked child for each
+    param file. Return the param files of the failed children."""
+    from spineIntegration import Runner
+    params = [load_param(param_file) for param_file in param_files]
+    check_variants(param_files, params)
+    base = load_param(param_files[0], {'nthreads' : 1, 'multisplit' : False})
+    runner = Runner(base)
+    nrnManager, timeline = runner.build_model()
+    runner.equilibrium(nrnManager)
+    state = h.SaveState()
+    state.save()
+    if max_jobs is None:
+        max_jobs = get_max_jobs()
+    logger.info("Equilibrium done. Running %d variants, %d at the time"
+                %(len(param_files), max_jobs))
+    lock = multiprocessing.Lock()
+    running = {}
+    failed = []
+    for param_file, param in zip(param_files, params):
+        while len(running) >= max_jobs:
+            wait_child(running, failed)
+        sys.stdout.flush()
+        sys.stderr.flush()
+        pid = os.fork()
+        if pid == 0:
+            status = 1
+            try:
+                run_variant(runner, nrnManager, state, param_file, param, lock)
+                status = 0
+            except:
+                traceback.print_exc()
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os._exit(status)
+        running[pid] = param_file
+    while running:
+        wait_child(running, failed)
+    return failed
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    max_jobs = None
+    if len(args) > 1 and args[0] == '--jobs':
+        max_jobs = int(args[1])
+        args = args[2:]
+    if args:
+        failed = sweep(args, max_jobs)
+        if failed:
+            sys.exit(1)
+    else:
+        print __doc__
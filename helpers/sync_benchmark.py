@@ -0,0 +1,47 @@
+"""
+Benchmark the 'while' sync loop against the 'events' scheduler.
+
+Usage (from the top directory)::
+
+    python -m helpers.sync_benchmark param/long_tstop_allbranch_cpm_two_branches_stims_20_Hz.param [tStop]
+
+If tStop [ms] is given it overrides the one in the param file, to get an 
+estimate without waiting for the full run.
+"""
+
+import sys
+
+from helpers.benchmark import run_child, child_main, run_runner, print_report
+
+SYNC_MODES = ['while', 'events']
+
+
+def run(param):
+    run_runner(param)
+    return {'sync_mode' : param.get('sync_mode', 'while')}
+
+def compare_sync_modes(param_file, tStop=None):
+    rows = []
+    for sync_mode in SYNC_MODES:
+        overrides = {'sync_mode' : sync_mode}
+        if tStop is not None:
+            overrides['tStop'] = tStop
+        results = run_child('helpers.sync_benchmark', param_file, overrides)
+        rows.append((sync_mode, results))
+    print_report("Sync benchmark: %s" %param_file, rows, 
+                 ['wall_time', 'process_time'])
+    t_while = rows[0][1]['wall_time']
+    t_events = rows[1][1]['wall_time']
+    print "Speedup events vs while: %.2f" %(t_while / t_events)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == '--child':
+        child_main(sys.argv, run)
+    elif len(sys.argv) in (2, 3):
+        tStop = None
+        if len(sys.argv) == 3:
+            tStop = float(sys.argv[2])
+        compare_sync_modes(sys.argv[1], tStop)
+    else:
+        print __doc__
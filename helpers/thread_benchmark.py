@@ -0,0 +1,69 @@
+"""
+Benchmark the scaling of NEURON with the number of threads and check that
+the voltage of the soma is the same of the serial run.
+
+Usage (from the top directory)::
+
+    python -m helpers.thread_benchmark param/default.param [tStop] [nthreads ...]
+
+The spines are distributed on all the dendrites (spines_dist 'all') and,
+with more than one thread, the cell is split among the threads
+(multisplit). If tStop [ms] is given it overrides the one in the param file.
+The default numbers of threads are 1, 2, 4 and 8: the first one is the
+reference.
+
+max_dv is the maximum absolute difference [mV] of the soma voltage from the
+reference run.
+"""
+
+import sys
+
+import numpy
+
+from helpers.benchmark import run_child, child_main, run_runner, print_report
+
+N_THREADS = [1, 2, 4, 8]
+SOMA = 'MSP_Cell[0].soma'
+
+
+def run(param):
+    runner = run_runner(param)
+    vecs = runner.build_vecs_to_plot('v', [SOMA],
+                                     runner.manager.refs['VecRef'])
+    return {'nthreads' : param['nthreads'],
+            'v' : list(vecs[SOMA + '_v'])}
+
+def compare_threads(param_file, tStop=None, n_threads=N_THREADS):
+    rows = []
+    for n in n_threads:
+        overrides = {'nthreads' : n,
+                     'multisplit' : n > 1,
+                     'spines_dist' : 'all',
+                     'sec_to_rec' : [SOMA],
+                     'var_to_plot' : ['v']}
+        if tStop is not None:
+            overrides['tStop'] = tStop
+        results = run_child('helpers.thread_benchmark', param_file, overrides)
+        rows.append(("%d threads" %n, results))
+    reference = rows[0][1]
+    v_ref = numpy.array(reference['v'])
+    for label, results in rows:
+        v = numpy.array(results['v'])
+        n = min(len(v), len(v_ref))
+        results['max_dv'] = float(numpy.abs(v[:n] - v_ref[:n]).max())
+        results['speedup'] = reference['wall_time'] / results['wall_time']
+    print_report("Thread benchmark: %s" %param_file, rows,
+                 ['wall_time', 'process_time', 'speedup', 'max_dv'])
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == '--child':
+        child_main(sys.argv, run)
+    elif len(sys.argv) > 1:
+        tStop = None
+        if len(sys.argv) > 2:
+            tStop = float(sys.argv[2])
+        n_threads = [int(n) for n in sys.argv[3:]] or N_THREADS
+        compare_threads(sys.argv[1], tStop, n_threads)
+    else:
+        print __doc__
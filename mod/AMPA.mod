@@ -2,8 +2,11 @@ TITLE    AMPA synapse for nucleus accumbens model
 : see comments below
 
 NEURON {
+	THREADSAFE
 	POINT_PROCESS AMPA
 	RANGE gbar, tau_r, tau_d, scale, spkcnt, countflag, i, t1, ca_ratio, ical, itmp, qfact, g
+	RANGE bio_weight_on
+	POINTER bio_weight		: weight computed by the biochemical mechanism
 	NONSPECIFIC_CURRENT i
  	USEION cal WRITE ical VALENCE 2
 
@@ -30,6 +33,7 @@ PARAMETER {
                             : Burnashev/Sakmann J Phys 1995 485:403-418
 							: with Carter/Sabatini Neuron 2004 44:483-493
     g_factor                : factor used to scale the gbar of the AMPA
+	bio_weight_on = 0		: 1 if bio_weight is set
 
 }							
 	
@@ -49,6 +53,7 @@ ASSIGNED {
 	countflag		: start/stop counting spikes delivered
 	spkcnt			: counts number of events delivered to synapse
 	scale			: scale allows the current to be scaled by weight
+	bio_weight
 }					: so NetCon(...,2) gives 2*the current as NetCon(...,1)
 
 
@@ -100,7 +105,11 @@ NET_RECEIVE( weight, y1_loc (/ms) ) {
 
 	spkcnt = spkcnt + 1
 
-	scale = weight
+	if (bio_weight_on) {
+		scale = weight * bio_weight
+	} else {
+		scale = weight
+	}
 }
 
 
@@ -2,6 +2,7 @@ TITLE    GABA synapse for nucleus accumbens model
 : see comments below
 
 NEURON {
+  THREADSAFE
   POINT_PROCESS GABA
   RANGE gbar, tau_r, tau_d, scale, spkcnt, countflag, i, t1, Erev, qfact
   NONSPECIFIC_CURRENT i
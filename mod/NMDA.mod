@@ -2,8 +2,10 @@ TITLE   NMDA synapse for nucleus accumbens model
 : see comments below
 
 NEURON {
+	THREADSAFE
 	POINT_PROCESS NMDA
-	RANGE gbar, ca_ratio, tau_r, tau_d, scale, spkcnt, countflag, mg, i, ical, t1, itmp, qfact, g
+	RANGE gbar, ca_ratio, tau_r, tau_d, scale, spkcnt, countflag, i, ical, t1, itmp, qfact, g
+	GLOBAL mg	: the TABLE depends on it
 	NONSPECIFIC_CURRENT i
 	USEION cal WRITE ical VALENCE 2
 }
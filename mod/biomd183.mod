@@ -0,0 +1,1459 @@
+TITLE biomd183
+
+COMMENT
+Generated by ecellControl/nmodlWriter.py from ../biochemical_circuits/biomd183_loop.eml.
+Do not edit: change the eml and generate it again.
+States are number of molecules, time is in ms.
+ENDCOMMENT
+
+NEURON {
+    THREADSAFE
+    SUFFIX biomd183
+    USEION ca READ cai
+    USEION cal READ cali VALENCE 2
+    RANGE coupled, head_vol, ca_input, ampa_weight, ampar_P_baseline
+    RANGE ca_in_k, ca_leak_vmax, ca_pump_vmax
+    RANGE free_cam_ca4_total
+    RANGE camR_ca4_total
+    RANGE camR_ca4_ratio
+    RANGE cam_ca4_total
+    RANGE cam_ca4_totalRatio
+    RANGE free_camR_ca3_total
+    RANGE free_camT_ca3_total
+    RANGE free_cam_ca3_total
+    RANGE CaMKII_camR_ca3
+    RANGE PP2B_camR_ca3
+    RANGE camR_ca3_total
+    RANGE camR_ca3_ratio
+    RANGE cam_ca3_total
+    RANGE cam_ca3_totalRatio
+    RANGE free_camR_ca2_total
+    RANGE free_camT_ca2_total
+    RANGE free_cam_ca2_total
+    RANGE CaMKII_camR_ca2
+    RANGE PP2B_camR_ca2
+    RANGE camR_ca2_total
+    RANGE camR_ca2_ratio
+    RANGE cam_ca2_total
+    RANGE cam_ca2_totalRatio
+    RANGE free_camR_ca1_total
+    RANGE free_camT_ca1_total
+    RANGE free_cam_ca1_total
+    RANGE CaMKII_camR_ca1
+    RANGE PP2B_camR_ca1
+    RANGE camR_ca1_total
+    RANGE camR_ca1_ratio
+    RANGE cam_ca1_total
+    RANGE cam_ca1_totalRatio
+    RANGE free_cam_ca0_total
+    RANGE camR_ca0_total
+    RANGE camR_ca0_ratio
+    RANGE cam_ca0_total
+    RANGE cam_ca0_totalRatio
+    RANGE total_CaMKIIp
+    RANGE total_CaMKII_bound
+    RANGE totalCaMKII
+    RANGE CaMKIIpbar
+    RANGE total_CaMKII_active
+    RANGE CaMKIIbar
+    RANGE camCaMKIIbar
+    RANGE total_PP2B_bound
+    RANGE camPP2Bbar
+    RANGE totalPP2B
+    RANGE PP2Bbar
+    RANGE camR_unbound
+    RANGE totalcamR
+    RANGE totalcamT
+    RANGE Rbar
+    RANGE moles_bound_ca_per_moles_cam
+    RANGE epsilon
+    RANGE ybar
+    RANGE ybar_div__1_minus_ybar
+    RANGE totD
+    RANGE totDp
+    RANGE Dpbar
+    RANGE totPP1
+    RANGE totPP1a
+    RANGE PP1abar
+    RANGE CBPslowbar
+    RANGE CBPvslowbar
+    RANGE PKAinmodel
+    RANGE PKAbar
+}
+
+UNITS {
+    (mM) = (milli/liter)
+}
+
+PARAMETER {
+    coupled = 0
+    head_vol = 1 : um3
+    ampar_P_baseline = 0
+    ca_in_k = 0.0
+    ca_leak_vmax = 0.004
+    ca_pump_vmax = 0.004
+    CBPfast = 48160.0
+    CBPmedia = 48160.0
+    cam_total = 18060.0
+    totPKA = 722.4
+    CBPfasttotal = 0.0
+    CBPmediatotal = 0.0
+    CBPslowtotal = 12040.0
+    CBPvslowtotal = 12040.0
+    CBPfastca = 0.0
+    CBPmediaca = 0.0
+    PP1a_Dp_camR_PP2B = 0.0
+    PP1a_Dp_camR_ca1_A_PP2B = 0.0
+    PP1a_Dp_camR_ca1_B_PP2B = 0.0
+    PP1a_Dp_camR_ca1_C_PP2B = 0.0
+    PP1a_Dp_camR_ca1_D_PP2B = 0.0
+    PP1a_Dp_camR_ca2_AB_PP2B = 0.0
+    PP1a_Dp_camR_ca2_AC_PP2B = 0.0
+    PP1a_Dp_camR_ca2_AD_PP2B = 0.0
+    PP1a_Dp_camR_ca2_BC_PP2B = 0.0
+    PP1a_Dp_camR_ca2_BD_PP2B = 0.0
+    PP1a_Dp_camR_ca2_CD_PP2B = 0.0
+    PP1a_Dp_camR_ca3_ABC_PP2B = 0.0
+    PP1a_Dp_camR_ca3_ABD_PP2B = 0.0
+    PP1a_Dp_camR_ca3_ACD_PP2B = 0.0
+    PP1a_Dp_camR_ca3_BCD_PP2B = 0.0
+    PP1a_Dp_camR_ca4_ABCD_PP2B = 0.0
+    CBPfastbar = 0.0
+    CBPmediabar = 0.0
+    camR0 = 0.8729
+    camT0 = 18060.0
+    ca0 = 6.02
+    CaMKII0 = 42140.0
+    PP2B0 = 963.2
+    D0 = 1806.0
+    PKA0 = 7.224
+    PP1a0 = 1204.0
+    CBPslow0 = 12040.0
+    CBPvslow0 = 12040.0
+    CBPslowca0 = 0.0
+    CBPvslowca0 = 0.0
+    camR_ca1_A0 = 0.0
+    camR_ca1_B0 = 0.0
+    camR_ca1_C0 = 0.0
+    camR_ca1_D0 = 0.0
+    camR_ca2_AB0 = 0.0
+    camR_ca2_AC0 = 0.0
+    camR_ca2_AD0 = 0.0
+    camR_ca2_BC0 = 0.0
+    camR_ca2_BD0 = 0.0
+    camR_ca2_CD0 = 0.0
+    camR_ca3_ABC0 = 0.0
+    camR_ca3_ABD0 = 0.0
+    camR_ca3_ACD0 = 0.0
+    camR_ca3_BCD0 = 0.0
+    camR_ca4_ABCD0 = 0.0
+    camT_ca1_A0 = 0.0
+    camT_ca1_B0 = 0.0
+    camT_ca1_C0 = 0.0
+    camT_ca1_D0 = 0.0
+    camT_ca2_AB0 = 0.0
+    camT_ca2_AC0 = 0.0
+    camT_ca2_AD0 = 0.0
+    camT_ca2_BC0 = 0.0
+    camT_ca2_BD0 = 0.0
+    camT_ca2_CD0 = 0.0
+    camT_ca3_ABC0 = 0.0
+    camT_ca3_ABD0 = 0.0
+    camT_ca3_ACD0 = 0.0
+    camT_ca3_BCD0 = 0.0
+    camT_ca4_ABCD0 = 0.0
+    camR_CaMKII0 = 0.0
+    camR_ca1_A_CaMKII0 = 0.0
+    camR_ca1_B_CaMKII0 = 0.0
+    camR_ca1_C_CaMKII0 = 0.0
+    camR_ca1_D_CaMKII0 = 0.0
+    camR_ca2_AB_CaMKII0 = 0.0
+    camR_ca2_AC_CaMKII0 = 0.0
+    camR_ca2_AD_CaMKII0 = 0.0
+    camR_ca2_BC_CaMKII0 = 0.0
+    camR_ca2_BD_CaMKII0 = 0.0
+    camR_ca2_CD_CaMKII0 = 0.0
+    camR_ca3_ABC_CaMKII0 = 0.0
+    camR_ca3_ABD_CaMKII0 = 0.0
+    camR_ca3_ACD_CaMKII0 = 0.0
+    camR_ca3_BCD_CaMKII0 = 0.0
+    camR_ca4_ABCD_CaMKII0 = 0.0
+    camR_PP2B0 = 0.0
+    camR_ca1_A_PP2B0 = 0.0
+    camR_ca1_B_PP2B0 = 0.0
+    camR_ca1_C_PP2B0 = 0.0
+    camR_ca1_D_PP2B0 = 0.0
+    camR_ca2_AB_PP2B0 = 0.0
+    camR_ca2_AC_PP2B0 = 0.0
+    camR_ca2_AD_PP2B0 = 0.0
+    camR_ca2_BC_PP2B0 = 0.0
+    camR_ca2_BD_PP2B0 = 0.0
+    camR_ca2_CD_PP2B0 = 0.0
+    camR_ca3_ABC_PP2B0 = 0.0
+    camR_ca3_ABD_PP2B0 = 0.0
+    camR_ca3_ACD_PP2B0 = 0.0
+    camR_ca3_BCD_PP2B0 = 0.0
+    camR_ca4_ABCD_PP2B0 = 0.0
+    CaMKIIp0 = 0.0
+    camR_CaMKIIp0 = 0.0
+    camR_ca1_A_CaMKIIp0 = 0.0
+    camR_ca1_B_CaMKIIp0 = 0.0
+    camR_ca1_C_CaMKIIp0 = 0.0
+    camR_ca1_D_CaMKIIp0 = 0.0
+    camR_ca2_AB_CaMKIIp0 = 0.0
+    camR_ca2_AC_CaMKIIp0 = 0.0
+    camR_ca2_AD_CaMKIIp0 = 0.0
+    camR_ca2_BC_CaMKIIp0 = 0.0
+    camR_ca2_BD_CaMKIIp0 = 0.0
+    camR_ca2_CD_CaMKIIp0 = 0.0
+    camR_ca3_ABC_CaMKIIp0 = 0.0
+    camR_ca3_ABD_CaMKIIp0 = 0.0
+    camR_ca3_ACD_CaMKIIp0 = 0.0
+    camR_ca3_BCD_CaMKIIp0 = 0.0
+    camR_ca4_ABCD_CaMKIIp0 = 0.0
+    Dp0 = 0.0
+    D_PKA0 = 0.0
+    Dp_camR_PP2B0 = 0.0
+    Dp_camR_ca1_A_PP2B0 = 0.0
+    Dp_camR_ca1_B_PP2B0 = 0.0
+    Dp_camR_ca1_C_PP2B0 = 0.0
+    Dp_camR_ca1_D_PP2B0 = 0.0
+    Dp_camR_ca2_AB_PP2B0 = 0.0
+    Dp_camR_ca2_AC_PP2B0 = 0.0
+    Dp_camR_ca2_AD_PP2B0 = 0.0
+    Dp_camR_ca2_BC_PP2B0 = 0.0
+    Dp_camR_ca2_BD_PP2B0 = 0.0
+    Dp_camR_ca2_CD_PP2B0 = 0.0
+    Dp_camR_ca3_ABC_PP2B0 = 0.0
+    Dp_camR_ca3_ABD_PP2B0 = 0.0
+    Dp_camR_ca3_ACD_PP2B0 = 0.0
+    Dp_camR_ca3_BCD_PP2B0 = 0.0
+    Dp_camR_ca4_ABCD_PP2B0 = 0.0
+    PP1a_Dp0 = 0.0
+    CaMKIIp_PP1a0 = 0.0
+    camR_CaMKIIp_PP1a0 = 0.0
+    camR_ca1_A_CaMKIIp_PP1a0 = 0.0
+    camR_ca1_B_CaMKIIp_PP1a0 = 0.0
+    camR_ca1_C_CaMKIIp_PP1a0 = 0.0
+    camR_ca1_D_CaMKIIp_PP1a0 = 0.0
+    camR_ca2_AB_CaMKIIp_PP1a0 = 0.0
+    camR_ca2_AC_CaMKIIp_PP1a0 = 0.0
+    camR_ca2_AD_CaMKIIp_PP1a0 = 0.0
+    camR_ca2_BC_CaMKIIp_PP1a0 = 0.0
+    camR_ca2_BD_CaMKIIp_PP1a0 = 0.0
+    camR_ca2_CD_CaMKIIp_PP1a0 = 0.0
+    camR_ca3_ABC_CaMKIIp_PP1a0 = 0.0
+    camR_ca3_ABD_CaMKIIp_PP1a0 = 0.0
+    camR_ca3_ACD_CaMKIIp_PP1a0 = 0.0
+    camR_ca3_BCD_CaMKIIp_PP1a0 = 0.0
+    camR_ca4_ABCD_CaMKIIp_PP1a0 = 0.0
+    CaMKIIp_PP1a_Dp0 = 0.0
+    camR_CaMKIIp_PP1a_Dp0 = 0.0
+    camR_ca1_A_CaMKIIp_PP1a_Dp0 = 0.0
+    camR_ca1_B_CaMKIIp_PP1a_Dp0 = 0.0
+    camR_ca1_C_CaMKIIp_PP1a_Dp0 = 0.0
+    camR_ca1_D_CaMKIIp_PP1a_Dp0 = 0.0
+    camR_ca2_AB_CaMKIIp_PP1a_Dp0 = 0.0
+    camR_ca2_AC_CaMKIIp_PP1a_Dp0 = 0.0
+    camR_ca2_AD_CaMKIIp_PP1a_Dp0 = 0.0
+    camR_ca2_BC_CaMKIIp_PP1a_Dp0 = 0.0
+    camR_ca2_BD_CaMKIIp_PP1a_Dp0 = 0.0
+    camR_ca2_CD_CaMKIIp_PP1a_Dp0 = 0.0
+    camR_ca3_ABC_CaMKIIp_PP1a_Dp0 = 0.0
+    camR_ca3_ABD_CaMKIIp_PP1a_Dp0 = 0.0
+    camR_ca3_ACD_CaMKIIp_PP1a_Dp0 = 0.0
+    camR_ca3_BCD_CaMKIIp_PP1a_Dp0 = 0.0
+    camR_ca4_ABCD_CaMKIIp_PP1a_Dp0 = 0.0
+    AMPAR_P0 = 100.0
+    AMPAR0 = 900.0
+}
+
+ASSIGNED {
+    cai (mM)
+    cali (mM)
+    ca_total_prev (mM)
+    ca_input : molecules/s
+    ampa_weight
+    free_cam_ca4_total
+    camR_ca4_total
+    camR_ca4_ratio
+    cam_ca4_total
+    cam_ca4_totalRatio
+    free_camR_ca3_total
+    free_camT_ca3_total
+    free_cam_ca3_total
+    CaMKII_camR_ca3
+    PP2B_camR_ca3
+    camR_ca3_total
+    camR_ca3_ratio
+    cam_ca3_total
+    cam_ca3_totalRatio
+    free_camR_ca2_total
+    free_camT_ca2_total
+    free_cam_ca2_total
+    CaMKII_camR_ca2
+    PP2B_camR_ca2
+    camR_ca2_total
+    camR_ca2_ratio
+    cam_ca2_total
+    cam_ca2_totalRatio
+    free_camR_ca1_total
+    free_camT_ca1_total
+    free_cam_ca1_total
+    CaMKII_camR_ca1
+    PP2B_camR_ca1
+    camR_ca1_total
+    camR_ca1_ratio
+    cam_ca1_total
+    cam_ca1_totalRatio
+    free_cam_ca0_total
+    camR_ca0_total
+    camR_ca0_ratio
+    cam_ca0_total
+    cam_ca0_totalRatio
+    total_CaMKIIp
+    total_CaMKII_bound
+    totalCaMKII
+    CaMKIIpbar
+    total_CaMKII_active
+    CaMKIIbar
+    camCaMKIIbar
+    total_PP2B_bound
+    camPP2Bbar
+    totalPP2B
+    PP2Bbar
+    camR_unbound
+    totalcamR
+    totalcamT
+    Rbar
+    moles_bound_ca_per_moles_cam
+    epsilon
+    ybar
+    ybar_div__1_minus_ybar
+    totD
+    totDp
+    Dpbar
+    totPP1
+    totPP1a
+    PP1abar
+    CBPslowbar
+    CBPvslowbar
+    PKAinmodel
+    PKAbar
+}
+
+STATE {
+    camR
+    camT
+    ca
+    CaMKII
+    PP2B
+    D
+    PKA
+    PP1a
+    CBPslow
+    CBPvslow
+    CBPslowca
+    CBPvslowca
+    camR_ca1_A
+    camR_ca1_B
+    camR_ca1_C
+    camR_ca1_D
+    camR_ca2_AB
+    camR_ca2_AC
+    camR_ca2_AD
+    camR_ca2_BC
+    camR_ca2_BD
+    camR_ca2_CD
+    camR_ca3_ABC
+    camR_ca3_ABD
+    camR_ca3_ACD
+    camR_ca3_BCD
+    camR_ca4_ABCD
+    camT_ca1_A
+    camT_ca1_B
+    camT_ca1_C
+    camT_ca1_D
+    camT_ca2_AB
+    camT_ca2_AC
+    camT_ca2_AD
+    camT_ca2_BC
+    camT_ca2_BD
+    camT_ca2_CD
+    camT_ca3_ABC
+    camT_ca3_ABD
+    camT_ca3_ACD
+    camT_ca3_BCD
+    camT_ca4_ABCD
+    camR_CaMKII
+    camR_ca1_A_CaMKII
+    camR_ca1_B_CaMKII
+    camR_ca1_C_CaMKII
+    camR_ca1_D_CaMKII
+    camR_ca2_AB_CaMKII
+    camR_ca2_AC_CaMKII
+    camR_ca2_AD_CaMKII
+    camR_ca2_BC_CaMKII
+    camR_ca2_BD_CaMKII
+    camR_ca2_CD_CaMKII
+    camR_ca3_ABC_CaMKII
+    camR_ca3_ABD_CaMKII
+    camR_ca3_ACD_CaMKII
+    camR_ca3_BCD_CaMKII
+    camR_ca4_ABCD_CaMKII
+    camR_PP2B
+    camR_ca1_A_PP2B
+    camR_ca1_B_PP2B
+    camR_ca1_C_PP2B
+    camR_ca1_D_PP2B
+    camR_ca2_AB_PP2B
+    camR_ca2_AC_PP2B
+    camR_ca2_AD_PP2B
+    camR_ca2_BC_PP2B
+    camR_ca2_BD_PP2B
+    camR_ca2_CD_PP2B
+    camR_ca3_ABC_PP2B
+    camR_ca3_ABD_PP2B
+    camR_ca3_ACD_PP2B
+    camR_ca3_BCD_PP2B
+    camR_ca4_ABCD_PP2B
+    CaMKIIp
+    camR_CaMKIIp
+    camR_ca1_A_CaMKIIp
+    camR_ca1_B_CaMKIIp
+    camR_ca1_C_CaMKIIp
+    camR_ca1_D_CaMKIIp
+    camR_ca2_AB_CaMKIIp
+    camR_ca2_AC_CaMKIIp
+    camR_ca2_AD_CaMKIIp
+    camR_ca2_BC_CaMKIIp
+    camR_ca2_BD_CaMKIIp
+    camR_ca2_CD_CaMKIIp
+    camR_ca3_ABC_CaMKIIp
+    camR_ca3_ABD_CaMKIIp
+    camR_ca3_ACD_CaMKIIp
+    camR_ca3_BCD_CaMKIIp
+    camR_ca4_ABCD_CaMKIIp
+    Dp
+    D_PKA
+    Dp_camR_PP2B
+    Dp_camR_ca1_A_PP2B
+    Dp_camR_ca1_B_PP2B
+    Dp_camR_ca1_C_PP2B
+    Dp_camR_ca1_D_PP2B
+    Dp_camR_ca2_AB_PP2B
+    Dp_camR_ca2_AC_PP2B
+    Dp_camR_ca2_AD_PP2B
+    Dp_camR_ca2_BC_PP2B
+    Dp_camR_ca2_BD_PP2B
+    Dp_camR_ca2_CD_PP2B
+    Dp_camR_ca3_ABC_PP2B
+    Dp_camR_ca3_ABD_PP2B
+    Dp_camR_ca3_ACD_PP2B
+    Dp_camR_ca3_BCD_PP2B
+    Dp_camR_ca4_ABCD_PP2B
+    PP1a_Dp
+    CaMKIIp_PP1a
+    camR_CaMKIIp_PP1a
+    camR_ca1_A_CaMKIIp_PP1a
+    camR_ca1_B_CaMKIIp_PP1a
+    camR_ca1_C_CaMKIIp_PP1a
+    camR_ca1_D_CaMKIIp_PP1a
+    camR_ca2_AB_CaMKIIp_PP1a
+    camR_ca2_AC_CaMKIIp_PP1a
+    camR_ca2_AD_CaMKIIp_PP1a
+    camR_ca2_BC_CaMKIIp_PP1a
+    camR_ca2_BD_CaMKIIp_PP1a
+    camR_ca2_CD_CaMKIIp_PP1a
+    camR_ca3_ABC_CaMKIIp_PP1a
+    camR_ca3_ABD_CaMKIIp_PP1a
+    camR_ca3_ACD_CaMKIIp_PP1a
+    camR_ca3_BCD_CaMKIIp_PP1a
+    camR_ca4_ABCD_CaMKIIp_PP1a
+    CaMKIIp_PP1a_Dp
+    camR_CaMKIIp_PP1a_Dp
+    camR_ca1_A_CaMKIIp_PP1a_Dp
+    camR_ca1_B_CaMKIIp_PP1a_Dp
+    camR_ca1_C_CaMKIIp_PP1a_Dp
+    camR_ca1_D_CaMKIIp_PP1a_Dp
+    camR_ca2_AB_CaMKIIp_PP1a_Dp
+    camR_ca2_AC_CaMKIIp_PP1a_Dp
+    camR_ca2_AD_CaMKIIp_PP1a_Dp
+    camR_ca2_BC_CaMKIIp_PP1a_Dp
+    camR_ca2_BD_CaMKIIp_PP1a_Dp
+    camR_ca2_CD_CaMKIIp_PP1a_Dp
+    camR_ca3_ABC_CaMKIIp_PP1a_Dp
+    camR_ca3_ABD_CaMKIIp_PP1a_Dp
+    camR_ca3_ACD_CaMKIIp_PP1a_Dp
+    camR_ca3_BCD_CaMKIIp_PP1a_Dp
+    camR_ca4_ABCD_CaMKIIp_PP1a_Dp
+    AMPAR_P
+    AMPAR
+}
+
+BREAKPOINT {
+    SOLVE scheme METHOD sparse
+}
+
+INITIAL {
+    ca_total_prev = cai + cali
+    ca_input = 0
+    assign()
+    update_weight()
+}
+
+BEFORE STEP {
+    : Calcium entered in the head in the last step
+    ca_input = (cai + cali - ca_total_prev) / dt * head_vol * 602213670.0
+    ca_total_prev = cai + cali
+    assign()
+    update_weight()
+}
+
+PROCEDURE assign() {
+    free_cam_ca4_total = (camR_ca4_ABCD+camT_ca4_ABCD)
+    camR_ca4_total = (camR_ca4_ABCD+camR_ca4_ABCD_CaMKII+camR_ca4_ABCD_PP2B+camR_ca4_ABCD_CaMKIIp+Dp_camR_ca4_ABCD_PP2B+camR_ca4_ABCD_CaMKIIp_PP1a+camR_ca4_ABCD_CaMKIIp_PP1a_Dp+
+        PP1a_Dp_camR_ca4_ABCD_PP2B)
+    camR_ca4_ratio = (camR_ca4_total/cam_total)
+    cam_ca4_total = (camR_ca4_ABCD+camT_ca4_ABCD+camR_ca4_ABCD_CaMKII+camR_ca4_ABCD_PP2B+camR_ca4_ABCD_CaMKIIp+Dp_camR_ca4_ABCD_PP2B+camR_ca4_ABCD_CaMKIIp_PP1a+camR_ca4_ABCD_CaMKIIp_PP1a_Dp+
+        PP1a_Dp_camR_ca4_ABCD_PP2B)
+    cam_ca4_totalRatio = (cam_ca4_total/cam_total)
+    free_camR_ca3_total = (camR_ca3_ABC+camR_ca3_ABD+camR_ca3_ACD+camR_ca3_BCD)
+    free_camT_ca3_total = (camT_ca3_ABC+camT_ca3_ABD+camT_ca3_ACD+camT_ca3_BCD)
+    free_cam_ca3_total = (free_camR_ca3_total+free_camT_ca3_total)
+    CaMKII_camR_ca3 = (camR_ca3_ABC_CaMKII+camR_ca3_ABD_CaMKII+camR_ca3_ACD_CaMKII+camR_ca3_BCD_CaMKII+camR_ca3_ABC_CaMKIIp+camR_ca3_ABD_CaMKIIp+camR_ca3_ACD_CaMKIIp+camR_ca3_BCD_CaMKIIp+
+        camR_ca3_ABC_CaMKIIp_PP1a+camR_ca3_ABD_CaMKIIp_PP1a+camR_ca3_ACD_CaMKIIp_PP1a+camR_ca3_BCD_CaMKIIp_PP1a+camR_ca3_ABC_CaMKIIp_PP1a_Dp+camR_ca3_ABD_CaMKIIp_PP1a_Dp+camR_ca3_ACD_CaMKIIp_PP1a_Dp+
+        camR_ca3_BCD_CaMKIIp_PP1a_Dp)
+    PP2B_camR_ca3 = (camR_ca3_ABC_PP2B+camR_ca3_ABD_PP2B+camR_ca3_ACD_PP2B+camR_ca3_BCD_PP2B+Dp_camR_ca3_ABC_PP2B+Dp_camR_ca3_ABD_PP2B+Dp_camR_ca3_ACD_PP2B+Dp_camR_ca3_BCD_PP2B+
+        PP1a_Dp_camR_ca3_ABC_PP2B+PP1a_Dp_camR_ca3_ABD_PP2B+PP1a_Dp_camR_ca3_ACD_PP2B+PP1a_Dp_camR_ca3_BCD_PP2B)
+    camR_ca3_total = (free_camR_ca3_total+PP2B_camR_ca3+CaMKII_camR_ca3)
+    camR_ca3_ratio = (camR_ca3_total/cam_total)
+    cam_ca3_total = (CaMKII_camR_ca3+PP2B_camR_ca3+free_cam_ca3_total)
+    cam_ca3_totalRatio = (cam_ca3_total/cam_total)
+    free_camR_ca2_total = (camR_ca2_AB+camR_ca2_AC+camR_ca2_AD+camR_ca2_BC+camR_ca2_BD+camR_ca2_CD)
+    free_camT_ca2_total = (camT_ca2_AB+camT_ca2_AC+camT_ca2_AD+camT_ca2_BC+camT_ca2_BD+camT_ca2_CD)
+    free_cam_ca2_total = (free_camR_ca2_total+free_camT_ca2_total)
+    CaMKII_camR_ca2 = (camR_ca2_AB_CaMKII+camR_ca2_AC_CaMKII+camR_ca2_AD_CaMKII+camR_ca2_BC_CaMKII+camR_ca2_BD_CaMKII+camR_ca2_CD_CaMKII+camR_ca2_AB_CaMKIIp+camR_ca2_AC_CaMKIIp+camR_ca2_AD_CaMKIIp+
+        camR_ca2_BC_CaMKIIp+camR_ca2_BD_CaMKIIp+camR_ca2_CD_CaMKIIp+camR_ca2_AB_CaMKIIp_PP1a+camR_ca2_AC_CaMKIIp_PP1a+camR_ca2_AD_CaMKIIp_PP1a+camR_ca2_BC_CaMKIIp_PP1a+camR_ca2_BD_CaMKIIp_PP1a+
+        camR_ca2_CD_CaMKIIp_PP1a+camR_ca2_AB_CaMKIIp_PP1a_Dp+camR_ca2_AC_CaMKIIp_PP1a_Dp+camR_ca2_AD_CaMKIIp_PP1a_Dp+camR_ca2_BC_CaMKIIp_PP1a_Dp+camR_ca2_BD_CaMKIIp_PP1a_Dp+
+        camR_ca2_CD_CaMKIIp_PP1a_Dp)
+    PP2B_camR_ca2 = (camR_ca2_AB_PP2B+camR_ca2_AC_PP2B+camR_ca2_AD_PP2B+camR_ca2_BC_PP2B+camR_ca2_BD_PP2B+camR_ca2_CD_PP2B+Dp_camR_ca2_AB_PP2B+Dp_camR_ca2_AC_PP2B+Dp_camR_ca2_AD_PP2B+
+        Dp_camR_ca2_BC_PP2B+Dp_camR_ca2_BD_PP2B+Dp_camR_ca2_CD_PP2B+PP1a_Dp_camR_ca2_AB_PP2B+PP1a_Dp_camR_ca2_AC_PP2B+PP1a_Dp_camR_ca2_AD_PP2B+PP1a_Dp_camR_ca2_BC_PP2B+PP1a_Dp_camR_ca2_BD_PP2B+
+        PP1a_Dp_camR_ca2_CD_PP2B)
+    camR_ca2_total = (free_camR_ca2_total+CaMKII_camR_ca2+PP2B_camR_ca2)
+    camR_ca2_ratio = (camR_ca2_total/cam_total)
+    cam_ca2_total = (free_cam_ca2_total+CaMKII_camR_ca2+PP2B_camR_ca2)
+    cam_ca2_totalRatio = (cam_ca2_total/cam_total)
+    free_camR_ca1_total = (camR_ca1_A+camR_ca1_B+camR_ca1_C+camR_ca1_D)
+    free_camT_ca1_total = (camT_ca1_A+camT_ca1_B+camT_ca1_C+camT_ca1_D)
+    free_cam_ca1_total = (camR_ca1_A+camR_ca1_B+camR_ca1_C+camR_ca1_D+camT_ca1_A+camT_ca1_B+camT_ca1_C+camT_ca1_D)
+    CaMKII_camR_ca1 = (camR_ca1_A_CaMKII+camR_ca1_B_CaMKII+camR_ca1_C_CaMKII+camR_ca1_D_CaMKII+camR_ca1_A_CaMKIIp+camR_ca1_B_CaMKIIp+camR_ca1_C_CaMKIIp+camR_ca1_D_CaMKIIp+camR_ca1_A_CaMKIIp_PP1a+
+        camR_ca1_B_CaMKIIp_PP1a+camR_ca1_C_CaMKIIp_PP1a+camR_ca1_D_CaMKIIp_PP1a+camR_ca1_A_CaMKIIp_PP1a_Dp+camR_ca1_B_CaMKIIp_PP1a_Dp+camR_ca1_C_CaMKIIp_PP1a_Dp+camR_ca1_D_CaMKIIp_PP1a_Dp)
+    PP2B_camR_ca1 = (camR_ca1_A_PP2B+camR_ca1_B_PP2B+camR_ca1_C_PP2B+camR_ca1_D_PP2B+Dp_camR_ca1_A_PP2B+Dp_camR_ca1_B_PP2B+Dp_camR_ca1_C_PP2B+Dp_camR_ca1_D_PP2B+PP1a_Dp_camR_ca1_A_PP2B+
+        PP1a_Dp_camR_ca1_B_PP2B+PP1a_Dp_camR_ca1_C_PP2B+PP1a_Dp_camR_ca1_D_PP2B)
+    camR_ca1_total = (free_camR_ca1_total+CaMKII_camR_ca1+PP2B_camR_ca1)
+    camR_ca1_ratio = (camR_ca1_total/cam_total)
+    cam_ca1_total = (free_cam_ca1_total+CaMKII_camR_ca1+PP2B_camR_ca1)
+    cam_ca1_totalRatio = (cam_ca1_total/cam_total)
+    free_cam_ca0_total = (camR+camT)
+    camR_ca0_total = (camR+camR_CaMKII+camR_PP2B+camR_CaMKIIp+Dp_camR_PP2B+camR_CaMKIIp_PP1a+camR_CaMKIIp_PP1a_Dp+PP1a_Dp_camR_PP2B)
+    camR_ca0_ratio = (camR_ca0_total/cam_total)
+    cam_ca0_total = (camR+camT+camR_CaMKII+camR_PP2B+camR_CaMKIIp+Dp_camR_PP2B+camR_CaMKIIp_PP1a+camR_CaMKIIp_PP1a_Dp+PP1a_Dp_camR_PP2B)
+    cam_ca0_totalRatio = (cam_ca0_total/cam_total)
+    total_CaMKIIp = (CaMKIIp+CaMKIIp_PP1a+camR_CaMKIIp+camR_CaMKIIp_PP1a+camR_ca1_A_CaMKIIp+camR_ca1_B_CaMKIIp+camR_ca1_C_CaMKIIp+camR_ca1_D_CaMKIIp+camR_ca1_A_CaMKIIp_PP1a+camR_ca1_B_CaMKIIp_PP1a+
+        camR_ca1_C_CaMKIIp_PP1a+camR_ca1_D_CaMKIIp_PP1a+camR_ca2_AB_CaMKIIp+camR_ca2_AC_CaMKIIp+camR_ca2_AD_CaMKIIp+camR_ca2_BC_CaMKIIp+camR_ca2_BD_CaMKIIp+camR_ca2_CD_CaMKIIp+
+        camR_ca2_AB_CaMKIIp_PP1a+camR_ca2_AC_CaMKIIp_PP1a+camR_ca2_AD_CaMKIIp_PP1a+camR_ca2_BC_CaMKIIp_PP1a+camR_ca2_BD_CaMKIIp_PP1a+camR_ca2_CD_CaMKIIp_PP1a+camR_ca3_ABC_CaMKIIp+camR_ca3_ABD_CaMKIIp+
+        camR_ca3_ACD_CaMKIIp+camR_ca3_BCD_CaMKIIp+camR_ca3_ABC_CaMKIIp_PP1a+camR_ca3_ABD_CaMKIIp_PP1a+camR_ca3_ACD_CaMKIIp_PP1a+camR_ca3_BCD_CaMKIIp_PP1a+camR_ca4_ABCD_CaMKIIp+
+        camR_ca4_ABCD_CaMKIIp_PP1a+CaMKIIp_PP1a_Dp+camR_CaMKIIp_PP1a_Dp+camR_ca1_A_CaMKIIp_PP1a_Dp+camR_ca1_B_CaMKIIp_PP1a_Dp+camR_ca1_C_CaMKIIp_PP1a_Dp+camR_ca1_D_CaMKIIp_PP1a_Dp+
+        camR_ca2_AB_CaMKIIp_PP1a_Dp+camR_ca2_AC_CaMKIIp_PP1a_Dp+camR_ca2_AD_CaMKIIp_PP1a_Dp+camR_ca2_BC_CaMKIIp_PP1a_Dp+camR_ca2_BD_CaMKIIp_PP1a_Dp+camR_ca2_CD_CaMKIIp_PP1a_Dp+
+        camR_ca3_ABC_CaMKIIp_PP1a_Dp+camR_ca3_ABD_CaMKIIp_PP1a_Dp+camR_ca3_ACD_CaMKIIp_PP1a_Dp+camR_ca3_BCD_CaMKIIp_PP1a_Dp+camR_ca4_ABCD_CaMKIIp_PP1a_Dp)
+    total_CaMKII_bound = (camR_CaMKII+CaMKII_camR_ca1+CaMKII_camR_ca2+CaMKII_camR_ca3+camR_ca4_ABCD_CaMKII+camR_CaMKIIp+camR_CaMKIIp_PP1a+camR_CaMKIIp_PP1a_Dp+camR_ca4_ABCD_CaMKIIp+
+        camR_ca4_ABCD_CaMKIIp_PP1a+camR_ca4_ABCD_CaMKIIp_PP1a_Dp)
+    totalCaMKII = (total_CaMKII_bound+CaMKII+CaMKIIp+CaMKIIp_PP1a+CaMKIIp_PP1a_Dp)
+    CaMKIIpbar = (total_CaMKIIp/totalCaMKII)
+    total_CaMKII_active = total_CaMKII_bound+CaMKIIp+CaMKIIp_PP1a+CaMKIIp_PP1a_Dp
+    CaMKIIbar = (total_CaMKII_active/totalCaMKII)
+    camCaMKIIbar = (total_CaMKII_bound/cam_total)
+    total_PP2B_bound = (camR_PP2B+PP2B_camR_ca1+PP2B_camR_ca2+PP2B_camR_ca3+camR_ca4_ABCD_PP2B+Dp_camR_PP2B+Dp_camR_ca4_ABCD_PP2B+PP1a_Dp_camR_PP2B+PP1a_Dp_camR_ca4_ABCD_PP2B)
+    camPP2Bbar = (total_PP2B_bound/cam_total)
+    totalPP2B = (total_PP2B_bound+PP2B)
+    PP2Bbar = (total_PP2B_bound/totalPP2B)
+    camR_unbound = (camR+camR_ca1_A+camR_ca1_B+camR_ca1_C+camR_ca1_D+camR_ca2_AB+camR_ca2_AC+camR_ca2_AD+camR_ca2_BC+camR_ca2_BD+camR_ca2_CD+camR_ca3_ABC+camR_ca3_ABD+camR_ca3_ACD+camR_ca3_BCD+
+        camR_ca4_ABCD)
+    totalcamR = (camR_unbound+total_CaMKII_bound+total_PP2B_bound)
+    totalcamT = (camT+camT_ca1_A+camT_ca1_B+camT_ca1_C+camT_ca1_D+camT_ca2_AB+camT_ca2_AC+camT_ca2_AD+camT_ca2_BC+camT_ca2_BD+camT_ca2_CD+camT_ca3_ABC+camT_ca3_ABD+camT_ca3_ACD+camT_ca3_BCD+
+        camT_ca4_ABCD)
+    Rbar = (totalcamR/(totalcamR+totalcamT))
+    moles_bound_ca_per_moles_cam = ((((4.0)*cam_ca4_total)+((3.0)*cam_ca3_total)+((2.0)*cam_ca2_total)+cam_ca1_total)/cam_total)
+    epsilon = (camR/(camR+camT))
+    ybar = (moles_bound_ca_per_moles_cam/(4.0))
+    ybar_div__1_minus_ybar = (ybar/((1.0)-ybar))
+    totD = D+Dp+D_PKA+Dp_camR_PP2B+Dp_camR_ca1_A_PP2B+Dp_camR_ca1_B_PP2B+Dp_camR_ca1_C_PP2B+Dp_camR_ca1_D_PP2B+Dp_camR_ca2_AB_PP2B+Dp_camR_ca2_AC_PP2B+Dp_camR_ca2_AD_PP2B+Dp_camR_ca2_BC_PP2B+
+        Dp_camR_ca2_BD_PP2B+Dp_camR_ca2_CD_PP2B+Dp_camR_ca3_ABC_PP2B+Dp_camR_ca3_ABD_PP2B+Dp_camR_ca3_ACD_PP2B+Dp_camR_ca3_BCD_PP2B+Dp_camR_ca4_ABCD_PP2B+PP1a_Dp+CaMKIIp_PP1a_Dp+camR_CaMKIIp_PP1a_Dp+
+        camR_ca1_A_CaMKIIp_PP1a_Dp+camR_ca1_B_CaMKIIp_PP1a_Dp+camR_ca1_C_CaMKIIp_PP1a_Dp+camR_ca1_D_CaMKIIp_PP1a_Dp+camR_ca2_AB_CaMKIIp_PP1a_Dp+camR_ca2_AC_CaMKIIp_PP1a_Dp+camR_ca2_AD_CaMKIIp_PP1a_Dp+
+        camR_ca2_BC_CaMKIIp_PP1a_Dp+camR_ca2_BD_CaMKIIp_PP1a_Dp+camR_ca2_CD_CaMKIIp_PP1a_Dp+camR_ca3_ABC_CaMKIIp_PP1a_Dp+camR_ca3_ABD_CaMKIIp_PP1a_Dp+camR_ca3_ACD_CaMKIIp_PP1a_Dp+
+        camR_ca3_BCD_CaMKIIp_PP1a_Dp+camR_ca4_ABCD_CaMKIIp_PP1a_Dp+PP1a_Dp_camR_PP2B+PP1a_Dp_camR_ca1_A_PP2B+PP1a_Dp_camR_ca1_B_PP2B+PP1a_Dp_camR_ca1_C_PP2B+PP1a_Dp_camR_ca1_D_PP2B+
+        PP1a_Dp_camR_ca2_AB_PP2B+PP1a_Dp_camR_ca2_AC_PP2B+PP1a_Dp_camR_ca2_AD_PP2B+PP1a_Dp_camR_ca2_BC_PP2B+PP1a_Dp_camR_ca2_BD_PP2B+PP1a_Dp_camR_ca2_CD_PP2B+PP1a_Dp_camR_ca3_ABC_PP2B+
+        PP1a_Dp_camR_ca3_ABD_PP2B+PP1a_Dp_camR_ca3_ACD_PP2B+PP1a_Dp_camR_ca3_BCD_PP2B+PP1a_Dp_camR_ca4_ABCD_PP2B
+    totDp = Dp+Dp_camR_PP2B+Dp_camR_ca1_A_PP2B+Dp_camR_ca1_B_PP2B+Dp_camR_ca1_C_PP2B+Dp_camR_ca1_D_PP2B+Dp_camR_ca2_AB_PP2B+Dp_camR_ca2_AC_PP2B+Dp_camR_ca2_AD_PP2B+Dp_camR_ca2_BC_PP2B+
+        Dp_camR_ca2_BD_PP2B+Dp_camR_ca2_CD_PP2B+Dp_camR_ca3_ABC_PP2B+Dp_camR_ca3_ABD_PP2B+Dp_camR_ca3_ACD_PP2B+Dp_camR_ca3_BCD_PP2B+Dp_camR_ca4_ABCD_PP2B+PP1a_Dp+CaMKIIp_PP1a_Dp+camR_CaMKIIp_PP1a_Dp+
+        camR_ca1_A_CaMKIIp_PP1a_Dp+camR_ca1_B_CaMKIIp_PP1a_Dp+camR_ca1_C_CaMKIIp_PP1a_Dp+camR_ca1_D_CaMKIIp_PP1a_Dp+camR_ca2_AB_CaMKIIp_PP1a_Dp+camR_ca2_AC_CaMKIIp_PP1a_Dp+camR_ca2_AD_CaMKIIp_PP1a_Dp+
+        camR_ca2_BC_CaMKIIp_PP1a_Dp+camR_ca2_BD_CaMKIIp_PP1a_Dp+camR_ca2_CD_CaMKIIp_PP1a_Dp+camR_ca3_ABC_CaMKIIp_PP1a_Dp+camR_ca3_ABD_CaMKIIp_PP1a_Dp+camR_ca3_ACD_CaMKIIp_PP1a_Dp+
+        camR_ca3_BCD_CaMKIIp_PP1a_Dp+camR_ca4_ABCD_CaMKIIp_PP1a_Dp+PP1a_Dp_camR_PP2B+PP1a_Dp_camR_ca1_A_PP2B+PP1a_Dp_camR_ca1_B_PP2B+PP1a_Dp_camR_ca1_C_PP2B+PP1a_Dp_camR_ca1_D_PP2B+
+        PP1a_Dp_camR_ca2_AB_PP2B+PP1a_Dp_camR_ca2_AC_PP2B+PP1a_Dp_camR_ca2_AD_PP2B+PP1a_Dp_camR_ca2_BC_PP2B+PP1a_Dp_camR_ca2_BD_PP2B+PP1a_Dp_camR_ca2_CD_PP2B+PP1a_Dp_camR_ca3_ABC_PP2B+
+        PP1a_Dp_camR_ca3_ABD_PP2B+PP1a_Dp_camR_ca3_ACD_PP2B+PP1a_Dp_camR_ca3_BCD_PP2B+PP1a_Dp_camR_ca4_ABCD_PP2B
+    Dpbar = (totDp/totD)
+    totPP1 = PP1a+PP1a_Dp+CaMKIIp_PP1a+camR_CaMKIIp_PP1a+camR_ca1_A_CaMKIIp_PP1a+camR_ca1_B_CaMKIIp_PP1a+camR_ca1_C_CaMKIIp_PP1a+camR_ca1_D_CaMKIIp_PP1a+camR_ca2_AB_CaMKIIp_PP1a+
+        camR_ca2_AC_CaMKIIp_PP1a+camR_ca2_AD_CaMKIIp_PP1a+camR_ca2_BC_CaMKIIp_PP1a+camR_ca2_BD_CaMKIIp_PP1a+camR_ca2_CD_CaMKIIp_PP1a+camR_ca3_ABC_CaMKIIp_PP1a+camR_ca3_ABD_CaMKIIp_PP1a+
+        camR_ca3_ACD_CaMKIIp_PP1a+camR_ca3_BCD_CaMKIIp_PP1a+camR_ca4_ABCD_CaMKIIp_PP1a+CaMKIIp_PP1a_Dp+camR_CaMKIIp_PP1a_Dp+camR_ca1_A_CaMKIIp_PP1a_Dp+camR_ca1_B_CaMKIIp_PP1a_Dp+
+        camR_ca1_C_CaMKIIp_PP1a_Dp+camR_ca1_D_CaMKIIp_PP1a_Dp+camR_ca2_AB_CaMKIIp_PP1a_Dp+camR_ca2_AC_CaMKIIp_PP1a_Dp+camR_ca2_AD_CaMKIIp_PP1a_Dp+camR_ca2_BC_CaMKIIp_PP1a_Dp+
+        camR_ca2_BD_CaMKIIp_PP1a_Dp+camR_ca2_CD_CaMKIIp_PP1a_Dp+camR_ca3_ABC_CaMKIIp_PP1a_Dp+camR_ca3_ABD_CaMKIIp_PP1a_Dp+camR_ca3_ACD_CaMKIIp_PP1a_Dp+camR_ca3_BCD_CaMKIIp_PP1a_Dp+
+        camR_ca4_ABCD_CaMKIIp_PP1a_Dp+PP1a_Dp_camR_PP2B+PP1a_Dp_camR_ca1_A_PP2B+PP1a_Dp_camR_ca1_B_PP2B+PP1a_Dp_camR_ca1_C_PP2B+PP1a_Dp_camR_ca1_D_PP2B+PP1a_Dp_camR_ca2_AB_PP2B+
+        PP1a_Dp_camR_ca2_AC_PP2B+PP1a_Dp_camR_ca2_AD_PP2B+PP1a_Dp_camR_ca2_BC_PP2B+PP1a_Dp_camR_ca2_BD_PP2B+PP1a_Dp_camR_ca2_CD_PP2B+PP1a_Dp_camR_ca3_ABC_PP2B+PP1a_Dp_camR_ca3_ABD_PP2B+
+        PP1a_Dp_camR_ca3_ACD_PP2B+PP1a_Dp_camR_ca3_BCD_PP2B+PP1a_Dp_camR_ca4_ABCD_PP2B
+    totPP1a = PP1a+CaMKIIp_PP1a+camR_CaMKIIp_PP1a+camR_ca1_A_CaMKIIp_PP1a+camR_ca1_B_CaMKIIp_PP1a+camR_ca1_C_CaMKIIp_PP1a+camR_ca1_D_CaMKIIp_PP1a+camR_ca2_AB_CaMKIIp_PP1a+camR_ca2_AC_CaMKIIp_PP1a+
+        camR_ca2_AD_CaMKIIp_PP1a+camR_ca2_BC_CaMKIIp_PP1a+camR_ca2_BD_CaMKIIp_PP1a+camR_ca2_CD_CaMKIIp_PP1a+camR_ca3_ABC_CaMKIIp_PP1a+camR_ca3_ABD_CaMKIIp_PP1a+camR_ca3_ACD_CaMKIIp_PP1a+
+        camR_ca3_BCD_CaMKIIp_PP1a+camR_ca4_ABCD_CaMKIIp_PP1a
+    PP1abar = (totPP1a/totPP1)
+    CBPslowbar = CBPslowca/CBPslowtotal
+    CBPvslowbar = CBPvslowca/CBPvslowtotal
+    PKAinmodel = PKA+D_PKA
+    PKAbar = PKAinmodel/totPKA
+}
+
+PROCEDURE update_weight() {
+    if (ampar_P_baseline > 0) {
+        ampa_weight = AMPAR_P / ampar_P_baseline
+    } else {
+        ampa_weight = 1
+    }
+}
+
+KINETIC scheme {
+    LOCAL v_ca_pump, v_ca_leak, v_ca_in, v_PKA_pump, v_PKA_leak, v_reaction_129, v_reaction_130, v_reaction_131, v_reaction_132, v_reaction_133, v_reaction_134, v_reaction_135, v_reaction_136,
+        v_reaction_137, v_reaction_138, v_reaction_139, v_reaction_140, v_reaction_141, v_reaction_142, v_reaction_143, v_reaction_144, v_reaction_145, v_reaction_146, v_reaction_147, v_reaction_148,
+        v_reaction_149, v_reaction_150, v_reaction_151, v_reaction_152, v_reaction_153, v_reaction_154, v_reaction_155, v_reaction_156, v_reaction_157, v_reaction_158, v_r352, v_r353, v_r354, v_r355,
+        v_r356, v_r357, v_r358, v_r359, v_r360, v_r361, v_r362, v_r363, v_r364, v_r365, v_r366, v_r367, v_AMPAR_Phosphorylation_831, v_AMPAR_Dephosphorylation_831
+    assign()
+    : ca_pump
+    v_ca_pump = 0.001 * ((((1 - coupled) * ca_pump_vmax)*((ca / 602213670.0)/((ca / 602213670.0)+1e-06)))*602213670.0)
+    ~ ca << (-1 * v_ca_pump)
+    : ca_leak
+    v_ca_leak = 0.001 * ((((1 - coupled) * ca_leak_vmax)*(1e-08/(1e-08+1e-06)))*602213670.0)
+    ~ ca << (1 * v_ca_leak)
+    : ca_in
+    v_ca_in = 0.001 * ((ca_in_k + coupled * ca_input))
+    ~ ca << (1 * v_ca_in)
+    : PKA_pump
+    v_PKA_pump = 0.001 * ((0.0*((PKA / 602213670.0)/((PKA / 602213670.0)+1e-06)))*602213670.0)
+    ~ PKA << (-1 * v_PKA_pump)
+    : PKA_leak
+    v_PKA_leak = 0.001 * ((0.0*(1.2e-08/(1.2e-08+1e-06)))*602213670.0)
+    ~ PKA << (1 * v_PKA_leak)
+    : CBPslow_ca_on, CBPslow_ca_off
+    ~ ca + CBPslow <-> CBPslowca (1.660540186674939e-05, 0.01)
+    : CBPvslow_ca_on, CBPvslow_ca_off
+    ~ ca + CBPvslow <-> CBPvslowca (1.6605401866749388e-06, 0.001)
+    : reaction_0, reaction_4
+    ~ ca + camR <-> camR_ca1_A (1.6605401866749388e-06, 0.008320000000000003)
+    : reaction_1, reaction_5
+    ~ ca + camR <-> camR_ca1_B (1.6605401866749388e-06, 1.66e-05)
+    : reaction_2, reaction_6
+    ~ ca + camR <-> camR_ca1_C (1.6605401866749388e-06, 0.0174)
+    : reaction_3, reaction_7
+    ~ ca + camR <-> camR_ca1_D (1.6605401866749388e-06, 1.4500000000000003e-05)
+    : reaction_8, reaction_20
+    ~ ca + camR_ca1_A <-> camR_ca2_AB (1.6605401866749388e-06, 1.66e-05)
+    : reaction_9, reaction_21
+    ~ ca + camR_ca1_A <-> camR_ca2_AC (1.6605401866749388e-06, 0.0174)
+    : reaction_10, reaction_22
+    ~ ca + camR_ca1_A <-> camR_ca2_AD (1.6605401866749388e-06, 1.4500000000000003e-05)
+    : reaction_11, reaction_23
+    ~ ca + camR_ca1_B <-> camR_ca2_AB (1.6605401866749388e-06, 0.008320000000000003)
+    : reaction_12, reaction_24
+    ~ ca + camR_ca1_B <-> camR_ca2_BC (1.6605401866749388e-06, 0.0174)
+    : reaction_13, reaction_25
+    ~ ca + camR_ca1_B <-> camR_ca2_BD (1.6605401866749388e-06, 1.4500000000000003e-05)
+    : reaction_14, reaction_26
+    ~ ca + camR_ca1_C <-> camR_ca2_AC (1.6605401866749388e-06, 0.008320000000000003)
+    : reaction_15, reaction_27
+    ~ ca + camR_ca1_C <-> camR_ca2_BC (1.6605401866749388e-06, 1.66e-05)
+    : reaction_16, reaction_28
+    ~ ca + camR_ca1_C <-> camR_ca2_CD (1.6605401866749388e-06, 1.4500000000000003e-05)
+    : reaction_17, reaction_29
+    ~ ca + camR_ca1_D <-> camR_ca2_AD (1.6605401866749388e-06, 0.008320000000000003)
+    : reaction_18, reaction_30
+    ~ ca + camR_ca1_D <-> camR_ca2_BD (1.6605401866749388e-06, 1.66e-05)
+    : reaction_19, reaction_31
+    ~ ca + camR_ca1_D <-> camR_ca2_CD (1.6605401866749388e-06, 0.0174)
+    : reaction_32, reaction_46
+    ~ ca + camR_ca2_AB <-> camR_ca3_ABC (1.6605401866749388e-06, 0.0174)
+    : reaction_33, reaction_49
+    ~ ca + camR_ca2_AB <-> camR_ca3_ABD (1.6605401866749388e-06, 1.4500000000000003e-05)
+    : reaction_34, reaction_45
+    ~ ca + camR_ca2_AC <-> camR_ca3_ABC (1.6605401866749388e-06, 1.66e-05)
+    : reaction_35, reaction_52
+    ~ ca + camR_ca2_AC <-> camR_ca3_ACD (1.6605401866749388e-06, 1.4500000000000003e-05)
+    : reaction_36, reaction_48
+    ~ ca + camR_ca2_AD <-> camR_ca3_ABD (1.6605401866749388e-06, 1.66e-05)
+    : reaction_37, reaction_51
+    ~ ca + camR_ca2_AD <-> camR_ca3_ACD (1.6605401866749388e-06, 0.0174)
+    : reaction_38, reaction_44
+    ~ ca + camR_ca2_BC <-> camR_ca3_ABC (1.6605401866749388e-06, 0.008320000000000003)
+    : reaction_39, reaction_55
+    ~ ca + camR_ca2_BC <-> camR_ca3_BCD (1.6605401866749388e-06, 1.4500000000000003e-05)
+    : reaction_40, reaction_47
+    ~ ca + camR_ca2_BD <-> camR_ca3_ABD (1.6605401866749388e-06, 0.008320000000000003)
+    : reaction_41, reaction_54
+    ~ ca + camR_ca2_BD <-> camR_ca3_BCD (1.6605401866749388e-06, 0.0174)
+    : reaction_42, reaction_50
+    ~ ca + camR_ca2_CD <-> camR_ca3_ACD (1.6605401866749388e-06, 0.008320000000000003)
+    : reaction_43, reaction_53
+    ~ ca + camR_ca2_CD <-> camR_ca3_BCD (1.6605401866749388e-06, 1.66e-05)
+    : reaction_56, reaction_60
+    ~ ca + camR_ca3_ABC <-> camR_ca4_ABCD (1.6605401866749388e-06, 1.4500000000000003e-05)
+    : reaction_57, reaction_61
+    ~ ca + camR_ca3_ABD <-> camR_ca4_ABCD (1.6605401866749388e-06, 0.0174)
+    : reaction_58, reaction_62
+    ~ ca + camR_ca3_ACD <-> camR_ca4_ABCD (1.6605401866749388e-06, 1.66e-05)
+    : reaction_59, reaction_63
+    ~ ca + camR_ca3_BCD <-> camR_ca4_ABCD (1.6605401866749388e-06, 0.008320000000000003)
+    : reaction_64, reaction_68
+    ~ ca + camT <-> camT_ca1_A (1.6605401866749388e-06, 2.1010101010100004)
+    : reaction_65, reaction_69
+    ~ ca + camT <-> camT_ca1_B (1.6605401866749388e-06, 0.00419191919192)
+    : reaction_66, reaction_70
+    ~ ca + camT <-> camT_ca1_C (1.6605401866749388e-06, 4.39393939394)
+    : reaction_67, reaction_71
+    ~ ca + camT <-> camT_ca1_D (1.6605401866749388e-06, 0.0036616161616200007)
+    : reaction_72, reaction_85
+    ~ ca + camT_ca1_A <-> camT_ca2_AB (1.6605401866749388e-06, 0.00419191919192)
+    : reaction_73, reaction_87
+    ~ ca + camT_ca1_A <-> camT_ca2_AC (1.6605401866749388e-06, 4.39393939394)
+    : reaction_74, reaction_89
+    ~ ca + camT_ca1_A <-> camT_ca2_AD (1.6605401866749388e-06, 0.0036616161616200007)
+    : reaction_75, reaction_84
+    ~ ca + camT_ca1_B <-> camT_ca2_AB (1.6605401866749388e-06, 2.1010101010100004)
+    : reaction_76, reaction_91
+    ~ ca + camT_ca1_B <-> camT_ca2_BC (1.6605401866749388e-06, 4.39393939394)
+    : reaction_77, reaction_93
+    ~ ca + camT_ca1_B <-> camT_ca2_BD (1.6605401866749388e-06, 0.0036616161616200007)
+    : reaction_78, reaction_86
+    ~ ca + camT_ca1_C <-> camT_ca2_AC (1.6605401866749388e-06, 2.1010101010100004)
+    : reaction_79, reaction_90
+    ~ ca + camT_ca1_C <-> camT_ca2_BC (1.6605401866749388e-06, 0.00419191919192)
+    : reaction_80, reaction_95
+    ~ ca + camT_ca1_C <-> camT_ca2_CD (1.6605401866749388e-06, 0.0036616161616200007)
+    : reaction_81, reaction_88
+    ~ ca + camT_ca1_D <-> camT_ca2_AD (1.6605401866749388e-06, 2.1010101010100004)
+    : reaction_82, reaction_92
+    ~ ca + camT_ca1_D <-> camT_ca2_BD (1.6605401866749388e-06, 0.00419191919192)
+    : reaction_83, reaction_94
+    ~ ca + camT_ca1_D <-> camT_ca2_CD (1.6605401866749388e-06, 4.39393939394)
+    : reaction_96, reaction_351
+    ~ ca + camT_ca2_AB <-> camT_ca3_ABC (1.6605401866749388e-06, 4.39393939394)
+    : reaction_97, reaction_110
+    ~ ca + camT_ca2_AB <-> camT_ca3_ABD (1.6605401866749388e-06, 0.0036616161616200007)
+    : reaction_98, reaction_108
+    ~ ca + camT_ca2_AC <-> camT_ca3_ABC (1.6605401866749388e-06, 0.00419191919192)
+    : reaction_99, reaction_113
+    ~ ca + camT_ca2_AC <-> camT_ca3_ACD (1.6605401866749388e-06, 0.0036616161616200007)
+    : reaction_100, reaction_111
+    ~ ca + camT_ca2_AD <-> camT_ca3_ABD (1.6605401866749388e-06, 0.00419191919192)
+    : reaction_101, reaction_114
+    ~ ca + camT_ca2_AD <-> camT_ca3_ACD (1.6605401866749388e-06, 4.39393939394)
+    : reaction_102, reaction_109
+    ~ ca + camT_ca2_BC <-> camT_ca3_ABC (1.6605401866749388e-06, 2.1010101010100004)
+    : reaction_103, reaction_116
+    ~ ca + camT_ca2_BC <-> camT_ca3_BCD (1.6605401866749388e-06, 0.0036616161616200007)
+    : reaction_104, reaction_112
+    ~ ca + camT_ca2_BD <-> camT_ca3_ABD (1.6605401866749388e-06, 2.1010101010100004)
+    : reaction_105, reaction_117
+    ~ ca + camT_ca2_BD <-> camT_ca3_BCD (1.6605401866749388e-06, 4.39393939394)
+    : reaction_106, reaction_115
+    ~ ca + camT_ca2_CD <-> camT_ca3_ACD (1.6605401866749388e-06, 2.1010101010100004)
+    : reaction_107, reaction_118
+    ~ ca + camT_ca2_CD <-> camT_ca3_BCD (1.6605401866749388e-06, 0.00419191919192)
+    : reaction_119, reaction_123
+    ~ ca + camT_ca3_ABC <-> camT_ca4_ABCD (1.6605401866749388e-06, 0.0036616161616200007)
+    : reaction_120, reaction_124
+    ~ ca + camT_ca3_ABD <-> camT_ca4_ABCD (1.6605401866749388e-06, 4.39393939394)
+    : reaction_121, reaction_125
+    ~ ca + camT_ca3_ACD <-> camT_ca4_ABCD (1.6605401866749388e-06, 0.00419191919192)
+    : reaction_122, reaction_126
+    ~ ca + camT_ca3_BCD <-> camT_ca4_ABCD (1.6605401866749388e-06, 2.1010101010100004)
+    : reaction_127, reaction_128
+    ~ camR <-> camT (1000.00000698, 0.048379294)
+    : reaction_129
+    v_reaction_129 = 0.001 * ((1 / 602213670.0)*1000000.00698*pow(0.00396,1.0/2.0)*602213670.0)
+    ~ camR_ca1_A <-> camT_ca1_A (v_reaction_129, 0)
+    : reaction_130
+    v_reaction_130 = 0.001 * ((1 / 602213670.0)*1000000.00698*pow(0.00396,1.0/2.0)*602213670.0)
+    ~ camR_ca1_B <-> camT_ca1_B (v_reaction_130, 0)
+    : reaction_131
+    v_reaction_131 = 0.001 * ((1 / 602213670.0)*1000000.00698*pow(0.00396,1.0/2.0)*602213670.0)
+    ~ camR_ca1_C <-> camT_ca1_C (v_reaction_131, 0)
+    : reaction_132
+    v_reaction_132 = 0.001 * ((1 / 602213670.0)*1000000.00698*pow(0.00396,1.0/2.0)*602213670.0)
+    ~ camR_ca1_D <-> camT_ca1_D (v_reaction_132, 0)
+    : reaction_133
+    v_reaction_133 = 0.001 * ((((1 / 602213670.0)*48.379294)/(pow(0.00396,((1.0)/(2.0)))))*602213670.0)
+    ~ camT_ca1_A <-> camR_ca1_A (v_reaction_133, 0)
+    : reaction_134
+    v_reaction_134 = 0.001 * ((((1 / 602213670.0)*48.379294)/(pow(0.00396,((1.0)/(2.0)))))*602213670.0)
+    ~ camT_ca1_B <-> camR_ca1_B (v_reaction_134, 0)
+    : reaction_135
+    v_reaction_135 = 0.001 * ((((1 / 602213670.0)*48.379294)/(pow(0.00396,((1.0)/(2.0)))))*602213670.0)
+    ~ camT_ca1_C <-> camR_ca1_C (v_reaction_135, 0)
+    : reaction_136
+    v_reaction_136 = 0.001 * ((((1 / 602213670.0)*48.379294)/(pow(0.00396,((1.0)/(2.0)))))*602213670.0)
+    ~ camT_ca1_D <-> camR_ca1_D (v_reaction_136, 0)
+    : reaction_137
+    v_reaction_137 = 0.001 * (((1 / 602213670.0)*1000000.00698*(pow((0.00396*0.00396),((1.0)/(2.0)))))*602213670.0)
+    ~ camR_ca2_AB <-> camT_ca2_AB (v_reaction_137, 0)
+    : reaction_138
+    v_reaction_138 = 0.001 * (((1 / 602213670.0)*1000000.00698*(pow((0.00396*0.00396),((1.0)/(2.0)))))*602213670.0)
+    ~ camR_ca2_AC <-> camT_ca2_AC (v_reaction_138, 0)
+    : reaction_139
+    v_reaction_139 = 0.001 * (((1 / 602213670.0)*1000000.00698*(pow((0.00396*0.00396),((1.0)/(2.0)))))*602213670.0)
+    ~ camR_ca2_AD <-> camT_ca2_AD (v_reaction_139, 0)
+    : reaction_140
+    v_reaction_140 = 0.001 * (((1 / 602213670.0)*1000000.00698*(pow((0.00396*0.00396),((1.0)/(2.0)))))*602213670.0)
+    ~ camR_ca2_BC <-> camT_ca2_BC (v_reaction_140, 0)
+    : reaction_141
+    v_reaction_141 = 0.001 * (((1 / 602213670.0)*1000000.00698*(pow((0.00396*0.00396),((1.0)/(2.0)))))*602213670.0)
+    ~ camR_ca2_BD <-> camT_ca2_BD (v_reaction_141, 0)
+    : reaction_142
+    v_reaction_142 = 0.001 * (((1 / 602213670.0)*1000000.00698*(pow((0.00396*0.00396),((1.0)/(2.0)))))*602213670.0)
+    ~ camR_ca2_CD <-> camT_ca2_CD (v_reaction_142, 0)
+    : reaction_143
+    v_reaction_143 = 0.001 * ((((1 / 602213670.0)*48.379294)/(pow((0.00396*0.00396),((1.0)/(2.0)))))*602213670.0)
+    ~ camT_ca2_AB <-> camR_ca2_AB (v_reaction_143, 0)
+    : reaction_144
+    v_reaction_144 = 0.001 * ((((1 / 602213670.0)*48.379294)/(pow((0.00396*0.00396),((1.0)/(2.0)))))*602213670.0)
+    ~ camT_ca2_AC <-> camR_ca2_AC (v_reaction_144, 0)
+    : reaction_145
+    v_reaction_145 = 0.001 * ((((1 / 602213670.0)*48.379294)/(pow((0.00396*0.00396),((1.0)/(2.0)))))*602213670.0)
+    ~ camT_ca2_AD <-> camR_ca2_AD (v_reaction_145, 0)
+    : reaction_146
+    v_reaction_146 = 0.001 * ((((1 / 602213670.0)*48.379294)/(pow((0.00396*0.00396),((1.0)/(2.0)))))*602213670.0)
+    ~ camT_ca2_BC <-> camR_ca2_BC (v_reaction_146, 0)
+    : reaction_147
+    v_reaction_147 = 0.001 * ((((1 / 602213670.0)*48.379294)/(pow((0.00396*0.00396),((1.0)/(2.0)))))*602213670.0)
+    ~ camT_ca2_BD <-> camR_ca2_BD (v_reaction_147, 0)
+    : reaction_148
+    v_reaction_148 = 0.001 * ((((1 / 602213670.0)*48.379294)/(pow((0.00396*0.00396),((1.0)/(2.0)))))*602213670.0)
+    ~ camT_ca2_CD <-> camR_ca2_CD (v_reaction_148, 0)
+    : reaction_149
+    v_reaction_149 = 0.001 * (((1 / 602213670.0)*1000000.00698*(pow((0.00396*0.00396*0.00396),((1.0)/(2.0)))))*602213670.0)
+    ~ camR_ca3_ABC <-> camT_ca3_ABC (v_reaction_149, 0)
+    : reaction_150
+    v_reaction_150 = 0.001 * (((1 / 602213670.0)*1000000.00698*(pow((0.00396*0.00396*0.00396),((1.0)/(2.0)))))*602213670.0)
+    ~ camR_ca3_ABD <-> camT_ca3_ABD (v_reaction_150, 0)
+    : reaction_151
+    v_reaction_151 = 0.001 * (((1 / 602213670.0)*1000000.00698*(pow((0.00396*0.00396*0.00396),((1.0)/(2.0)))))*602213670.0)
+    ~ camR_ca3_ACD <-> camT_ca3_ACD (v_reaction_151, 0)
+    : reaction_152
+    v_reaction_152 = 0.001 * (((1 / 602213670.0)*1000000.00698*(pow((0.00396*0.00396*0.00396),((1.0)/(2.0)))))*602213670.0)
+    ~ camR_ca3_BCD <-> camT_ca3_BCD (v_reaction_152, 0)
+    : reaction_153
+    v_reaction_153 = 0.001 * ((((1 / 602213670.0)*48.379294)/(pow((0.00396*0.00396*0.00396),((1.0)/(2.0)))))*602213670.0)
+    ~ camT_ca3_ABC <-> camR_ca3_ABC (v_reaction_153, 0)
+    : reaction_154
+    v_reaction_154 = 0.001 * ((((1 / 602213670.0)*48.379294)/(pow((0.00396*0.00396*0.00396),((1.0)/(2.0)))))*602213670.0)
+    ~ camT_ca3_ABD <-> camR_ca3_ABD (v_reaction_154, 0)
+    : reaction_155
+    v_reaction_155 = 0.001 * ((((1 / 602213670.0)*48.379294)/(pow((0.00396*0.00396*0.00396),((1.0)/(2.0)))))*602213670.0)
+    ~ camT_ca3_ACD <-> camR_ca3_ACD (v_reaction_155, 0)
+    : reaction_156
+    v_reaction_156 = 0.001 * ((((1 / 602213670.0)*48.379294)/(pow((0.00396*0.00396*0.00396),((1.0)/(2.0)))))*602213670.0)
+    ~ camT_ca3_BCD <-> camR_ca3_BCD (v_reaction_156, 0)
+    : reaction_157
+    v_reaction_157 = 0.001 * (((1 / 602213670.0)*1000000.00698*(pow((0.00396*0.00396*0.00396*0.00396),((1.0)/(2.0)))))*602213670.0)
+    ~ camR_ca4_ABCD <-> camT_ca4_ABCD (v_reaction_157, 0)
+    : reaction_158
+    v_reaction_158 = 0.001 * ((((1 / 602213670.0)*48.379294)/(pow((0.00396*0.00396*0.00396*0.00396),((1.0)/(2.0)))))*602213670.0)
+    ~ camT_ca4_ABCD <-> camR_ca4_ABCD (v_reaction_158, 0)
+    : reaction_159, reaction_175
+    ~ CaMKII + camR <-> camR_CaMKII (5.313728597359804e-06, 0.00034300000000000004)
+    : reaction_160, reaction_176
+    ~ CaMKII + camR_ca1_A <-> camR_ca1_A_CaMKII (5.313728597359804e-06, 0.00034300000000000004)
+    : reaction_161, reaction_177
+    ~ CaMKII + camR_ca1_B <-> camR_ca1_B_CaMKII (5.313728597359804e-06, 0.00034300000000000004)
+    : reaction_162, reaction_178
+    ~ CaMKII + camR_ca1_C <-> camR_ca1_C_CaMKII (5.313728597359804e-06, 0.00034300000000000004)
+    : reaction_163, reaction_179
+    ~ CaMKII + camR_ca1_D <-> camR_ca1_D_CaMKII (5.313728597359804e-06, 0.00034300000000000004)
+    : reaction_164, reaction_180
+    ~ CaMKII + camR_ca2_AB <-> camR_ca2_AB_CaMKII (5.313728597359804e-06, 0.00034300000000000004)
+    : reaction_165, reaction_181
+    ~ CaMKII + camR_ca2_AC <-> camR_ca2_AC_CaMKII (5.313728597359804e-06, 0.00034300000000000004)
+    : reaction_166, reaction_182
+    ~ CaMKII + camR_ca2_AD <-> camR_ca2_AD_CaMKII (5.313728597359804e-06, 0.00034300000000000004)
+    : reaction_167, reaction_183
+    ~ CaMKII + camR_ca2_BC <-> camR_ca2_BC_CaMKII (5.313728597359804e-06, 0.00034300000000000004)
+    : reaction_168, reaction_184
+    ~ CaMKII + camR_ca2_BD <-> camR_ca2_BD_CaMKII (5.313728597359804e-06, 0.00034300000000000004)
+    : reaction_169, reaction_185
+    ~ CaMKII + camR_ca2_CD <-> camR_ca2_CD_CaMKII (5.313728597359804e-06, 0.00034300000000000004)
+    : reaction_170, reaction_186
+    ~ CaMKII + camR_ca3_ABC <-> camR_ca3_ABC_CaMKII (5.313728597359804e-06, 0.00034300000000000004)
+    : reaction_171, reaction_187
+    ~ CaMKII + camR_ca3_ABD <-> camR_ca3_ABD_CaMKII (5.313728597359804e-06, 0.00034300000000000004)
+    : reaction_172, reaction_188
+    ~ CaMKII + camR_ca3_ACD <-> camR_ca3_ACD_CaMKII (5.313728597359804e-06, 0.00034300000000000004)
+    : reaction_173, reaction_189
+    ~ CaMKII + camR_ca3_BCD <-> camR_ca3_BCD_CaMKII (5.313728597359804e-06, 0.00034300000000000004)
+    : reaction_174, reaction_190
+    ~ CaMKII + camR_ca4_ABCD <-> camR_ca4_ABCD_CaMKII (5.313728597359804e-06, 0.00034300000000000004)
+    : reaction_191, reaction_207
+    ~ PP2B + camR <-> camR_PP2B (7.638484858704718e-05, 0.0004)
+    : reaction_192, reaction_208
+    ~ PP2B + camR_ca1_A <-> camR_ca1_A_PP2B (7.638484858704718e-05, 0.0004)
+    : reaction_193, reaction_209
+    ~ PP2B + camR_ca1_B <-> camR_ca1_B_PP2B (7.638484858704718e-05, 0.0004)
+    : reaction_194, reaction_210
+    ~ PP2B + camR_ca1_C <-> camR_ca1_C_PP2B (7.638484858704718e-05, 0.0004)
+    : reaction_195, reaction_211
+    ~ PP2B + camR_ca1_D <-> camR_ca1_D_PP2B (7.638484858704718e-05, 0.0004)
+    : reaction_196, reaction_212
+    ~ PP2B + camR_ca2_AB <-> camR_ca2_AB_PP2B (7.638484858704718e-05, 0.0004)
+    : reaction_198, reaction_214
+    ~ PP2B + camR_ca2_AD <-> camR_ca2_AD_PP2B (7.638484858704718e-05, 0.0004)
+    : reaction_199, reaction_215
+    ~ PP2B + camR_ca2_BC <-> camR_ca2_BC_PP2B (7.638484858704718e-05, 0.0004)
+    : reaction_200, reaction_216
+    ~ PP2B + camR_ca2_BD <-> camR_ca2_BD_PP2B (7.638484858704718e-05, 0.0004)
+    : reaction_201, reaction_217
+    ~ PP2B + camR_ca2_CD <-> camR_ca2_CD_PP2B (7.638484858704718e-05, 0.0004)
+    : reaction_202, reaction_218
+    ~ PP2B + camR_ca3_ABC <-> camR_ca3_ABC_PP2B (7.638484858704718e-05, 0.0004)
+    : reaction_203, reaction_219
+    ~ PP2B + camR_ca3_ABD <-> camR_ca3_ABD_PP2B (7.638484858704718e-05, 0.0004)
+    : reaction_204, reaction_220
+    ~ PP2B + camR_ca3_ACD <-> camR_ca3_ACD_PP2B (7.638484858704718e-05, 0.0004)
+    : reaction_205, reaction_221
+    ~ PP2B + camR_ca3_BCD <-> camR_ca3_BCD_PP2B (7.638484858704718e-05, 0.0004)
+    : reaction_206, reaction_222
+    ~ PP2B + camR_ca4_ABCD <-> camR_ca4_ABCD_PP2B (7.638484858704718e-05, 0.0004)
+    : reaction_213
+    ~ camR_ca2_AC_PP2B <-> camR_ca2_AC + PP2B (0.0004, 0)
+    : reaction_223, reaction_227
+    ~ ca + camR_CaMKII <-> camR_ca1_A_CaMKII (1.6605401866749388e-06, 0.008320000000000003)
+    : reaction_224, reaction_350
+    ~ ca + camR_CaMKII <-> camR_ca1_B_CaMKII (1.6605401866749388e-06, 1.66e-05)
+    : reaction_225, reaction_228
+    ~ ca + camR_CaMKII <-> camR_ca1_C_CaMKII (1.6605401866749388e-06, 0.0174)
+    : reaction_226, reaction_229
+    ~ ca + camR_CaMKII <-> camR_ca1_D_CaMKII (1.6605401866749388e-06, 1.4500000000000003e-05)
+    : reaction_230, reaction_243
+    ~ ca + camR_ca1_A_CaMKII <-> camR_ca2_AB_CaMKII (1.6605401866749388e-06, 1.66e-05)
+    : reaction_231, reaction_245
+    ~ ca + camR_ca1_A_CaMKII <-> camR_ca2_AC_CaMKII (1.6605401866749388e-06, 0.0174)
+    : reaction_232, reaction_247
+    ~ ca + camR_ca1_A_CaMKII <-> camR_ca2_AD_CaMKII (1.6605401866749388e-06, 1.4500000000000003e-05)
+    : reaction_233, reaction_242
+    ~ ca + camR_ca1_B_CaMKII <-> camR_ca2_AB_CaMKII (1.6605401866749388e-06, 0.008320000000000003)
+    : reaction_234, reaction_249
+    ~ ca + camR_ca1_B_CaMKII <-> camR_ca2_BC_CaMKII (1.6605401866749388e-06, 0.0174)
+    : reaction_235, reaction_251
+    ~ ca + camR_ca1_B_CaMKII <-> camR_ca2_BD_CaMKII (1.6605401866749388e-06, 1.4500000000000003e-05)
+    : reaction_236, reaction_244
+    ~ ca + camR_ca1_C_CaMKII <-> camR_ca2_AC_CaMKII (1.6605401866749388e-06, 0.008320000000000003)
+    : reaction_237, reaction_248
+    ~ ca + camR_ca1_C_CaMKII <-> camR_ca2_BC_CaMKII (1.6605401866749388e-06, 1.66e-05)
+    : reaction_238, reaction_253
+    ~ ca + camR_ca1_C_CaMKII <-> camR_ca2_CD_CaMKII (1.6605401866749388e-06, 1.4500000000000003e-05)
+    : reaction_239, reaction_246
+    ~ ca + camR_ca1_D_CaMKII <-> camR_ca2_AD_CaMKII (1.6605401866749388e-06, 0.008320000000000003)
+    : reaction_240, reaction_250
+    ~ ca + camR_ca1_D_CaMKII <-> camR_ca2_BD_CaMKII (1.6605401866749388e-06, 1.66e-05)
+    : reaction_241, reaction_252
+    ~ ca + camR_ca1_D_CaMKII <-> camR_ca2_CD_CaMKII (1.6605401866749388e-06, 0.0174)
+    : reaction_254, reaction_266
+    ~ ca + camR_ca2_AB_CaMKII <-> camR_ca3_ABC_CaMKII (1.6605401866749388e-06, 0.0174)
+    : reaction_255, reaction_269
+    ~ ca + camR_ca2_AB_CaMKII <-> camR_ca3_ABD_CaMKII (1.6605401866749388e-06, 1.4500000000000003e-05)
+    : reaction_256, reaction_267
+    ~ ca + camR_ca2_AC_CaMKII <-> camR_ca3_ABC_CaMKII (1.6605401866749388e-06, 1.66e-05)
+    : reaction_257, reaction_272
+    ~ ca + camR_ca2_AC_CaMKII <-> camR_ca3_ACD_CaMKII (1.6605401866749388e-06, 1.4500000000000003e-05)
+    : reaction_258, reaction_270
+    ~ ca + camR_ca2_AD_CaMKII <-> camR_ca3_ABD_CaMKII (1.6605401866749388e-06, 1.66e-05)
+    : reaction_259, reaction_273
+    ~ ca + camR_ca2_AD_CaMKII <-> camR_ca3_ACD_CaMKII (1.6605401866749388e-06, 0.0174)
+    : reaction_260, reaction_268
+    ~ ca + camR_ca2_BC_CaMKII <-> camR_ca3_ABC_CaMKII (1.6605401866749388e-06, 0.008320000000000003)
+    : reaction_261, reaction_275
+    ~ ca + camR_ca2_BC_CaMKII <-> camR_ca3_BCD_CaMKII (1.6605401866749388e-06, 1.4500000000000003e-05)
+    : reaction_262, reaction_271
+    ~ ca + camR_ca2_BD_CaMKII <-> camR_ca3_ABD_CaMKII (1.6605401866749388e-06, 0.008320000000000003)
+    : reaction_263, reaction_276
+    ~ ca + camR_ca2_BD_CaMKII <-> camR_ca3_BCD_CaMKII (1.6605401866749388e-06, 0.0174)
+    : reaction_264, reaction_274
+    ~ ca + camR_ca2_CD_CaMKII <-> camR_ca3_ACD_CaMKII (1.6605401866749388e-06, 0.008320000000000003)
+    : reaction_265, reaction_277
+    ~ ca + camR_ca2_CD_CaMKII <-> camR_ca3_BCD_CaMKII (1.6605401866749388e-06, 1.66e-05)
+    : reaction_278, reaction_282
+    ~ ca + camR_ca3_BCD_CaMKII <-> camR_ca4_ABCD_CaMKII (1.6605401866749388e-06, 0.008320000000000003)
+    : reaction_279, reaction_283
+    ~ ca + camR_ca3_ACD_CaMKII <-> camR_ca4_ABCD_CaMKII (1.6605401866749388e-06, 1.66e-05)
+    : reaction_280, reaction_284
+    ~ ca + camR_ca3_ABD_CaMKII <-> camR_ca4_ABCD_CaMKII (1.6605401866749388e-06, 0.0174)
+    : reaction_281, reaction_285
+    ~ ca + camR_ca3_ABC_CaMKII <-> camR_ca4_ABCD_CaMKII (1.6605401866749388e-06, 1.4500000000000003e-05)
+    : reaction_286, reaction_290
+    ~ ca + camR_PP2B <-> camR_ca1_A_PP2B (1.6605401866749388e-06, 0.008320000000000003)
+    : reaction_287, reaction_291
+    ~ ca + camR_PP2B <-> camR_ca1_B_PP2B (1.6605401866749388e-06, 1.66e-05)
+    : reaction_288, reaction_292
+    ~ ca + camR_PP2B <-> camR_ca1_C_PP2B (1.6605401866749388e-06, 0.0174)
+    : reaction_289, reaction_293
+    ~ ca + camR_PP2B <-> camR_ca1_D_PP2B (1.6605401866749388e-06, 1.4500000000000003e-05)
+    : reaction_294, reaction_307
+    ~ ca + camR_ca1_A_PP2B <-> camR_ca2_AB_PP2B (1.6605401866749388e-06, 1.66e-05)
+    : reaction_295, reaction_309
+    ~ ca + camR_ca1_A_PP2B <-> camR_ca2_AC_PP2B (1.6605401866749388e-06, 0.0174)
+    : reaction_296, reaction_311
+    ~ ca + camR_ca1_A_PP2B <-> camR_ca2_AD_PP2B (1.6605401866749388e-06, 1.4500000000000003e-05)
+    : reaction_297, reaction_306
+    ~ ca + camR_ca1_B_PP2B <-> camR_ca2_AB_PP2B (1.6605401866749388e-06, 0.008320000000000003)
+    : reaction_298, reaction_313
+    ~ ca + camR_ca1_B_PP2B <-> camR_ca2_BC_PP2B (1.6605401866749388e-06, 0.0174)
+    : reaction_299, reaction_315
+    ~ ca + camR_ca1_B_PP2B <-> camR_ca2_BD_PP2B (1.6605401866749388e-06, 1.4500000000000003e-05)
+    : reaction_300, reaction_308
+    ~ ca + camR_ca1_C_PP2B <-> camR_ca2_AC_PP2B (1.6605401866749388e-06, 0.008320000000000003)
+    : reaction_301, reaction_312
+    ~ ca + camR_ca1_C_PP2B <-> camR_ca2_BC_PP2B (1.6605401866749388e-06, 1.66e-05)
+    : reaction_302, reaction_317
+    ~ ca + camR_ca1_C_PP2B <-> camR_ca2_CD_PP2B (1.6605401866749388e-06, 1.4500000000000003e-05)
+    : reaction_303, reaction_310
+    ~ ca + camR_ca1_D_PP2B <-> camR_ca2_AD_PP2B (1.6605401866749388e-06, 0.008320000000000003)
+    : reaction_304, reaction_314
+    ~ ca + camR_ca1_D_PP2B <-> camR_ca2_BD_PP2B (1.6605401866749388e-06, 1.66e-05)
+    : reaction_305, reaction_316
+    ~ ca + camR_ca1_D_PP2B <-> camR_ca2_CD_PP2B (1.6605401866749388e-06, 0.0174)
+    : reaction_318, reaction_332
+    ~ ca + camR_ca2_AB_PP2B <-> camR_ca3_ABC_PP2B (1.6605401866749388e-06, 0.0174)
+    : reaction_319, reaction_335
+    ~ ca + camR_ca2_AB_PP2B <-> camR_ca3_ABD_PP2B (1.6605401866749388e-06, 1.4500000000000003e-05)
+    : reaction_320, reaction_331
+    ~ ca + camR_ca2_AC_PP2B <-> camR_ca3_ABC_PP2B (1.6605401866749388e-06, 1.66e-05)
+    : reaction_321, reaction_338
+    ~ ca + camR_ca2_AC_PP2B <-> camR_ca3_ACD_PP2B (1.6605401866749388e-06, 1.4500000000000003e-05)
+    : reaction_322, reaction_334
+    ~ ca + camR_ca2_AD_PP2B <-> camR_ca3_ABD_PP2B (1.6605401866749388e-06, 1.66e-05)
+    : reaction_323, reaction_337
+    ~ ca + camR_ca2_AD_PP2B <-> camR_ca3_ACD_PP2B (1.6605401866749388e-06, 0.0174)
+    : reaction_324, reaction_330
+    ~ ca + camR_ca2_BC_PP2B <-> camR_ca3_ABC_PP2B (1.6605401866749388e-06, 0.008320000000000003)
+    : reaction_325, reaction_341
+    ~ ca + camR_ca2_BC_PP2B <-> camR_ca3_BCD_PP2B (1.6605401866749388e-06, 1.4500000000000003e-05)
+    : reaction_326, reaction_333
+    ~ ca + camR_ca2_BD_PP2B <-> camR_ca3_ABD_PP2B (1.6605401866749388e-06, 0.008320000000000003)
+    : reaction_327, reaction_340
+    ~ ca + camR_ca2_BD_PP2B <-> camR_ca3_BCD_PP2B (1.6605401866749388e-06, 0.0174)
+    : reaction_328, reaction_336
+    ~ ca + camR_ca2_CD_PP2B <-> camR_ca3_ACD_PP2B (1.6605401866749388e-06, 0.008320000000000003)
+    : reaction_329, reaction_339
+    ~ ca + camR_ca2_CD_PP2B <-> camR_ca3_BCD_PP2B (1.6605401866749388e-06, 1.66e-05)
+    : reaction_342, reaction_349
+    ~ ca + camR_ca3_ABC_PP2B <-> camR_ca4_ABCD_PP2B (1.6605401866749388e-06, 1.4500000000000003e-05)
+    : reaction_343, reaction_348
+    ~ ca + camR_ca3_ABD_PP2B <-> camR_ca4_ABCD_PP2B (1.6605401866749388e-06, 0.0174)
+    : reaction_344, reaction_347
+    ~ ca + camR_ca3_ACD_PP2B <-> camR_ca4_ABCD_PP2B (1.6605401866749388e-06, 1.66e-05)
+    : reaction_345, reaction_346
+    ~ ca + camR_ca3_BCD_PP2B <-> camR_ca4_ABCD_PP2B (1.6605401866749388e-06, 0.008320000000000003)
+    : r352
+    v_r352 = 0.001 * ((-0.929*((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^5+3.128*((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^4-4.249*
+        ((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^3+2.998*((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^2+0.05152*
+        ((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))-0.001008)*6.3*(1 / 602213670.0)*602213670.0)
+    ~ camR_CaMKII <-> camR_CaMKIIp (v_r352, 0)
+    : r353
+    v_r353 = 0.001 * ((-0.929*((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^5+3.128*((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^4-4.249*
+        ((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^3+2.998*((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^2+0.05152*
+        ((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))-0.001008)*6.3*(1 / 602213670.0)*602213670.0)
+    ~ camR_ca1_A_CaMKII <-> camR_ca1_A_CaMKIIp (v_r353, 0)
+    : r354
+    v_r354 = 0.001 * ((-0.929*((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^5+3.128*((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^4-4.249*
+        ((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^3+2.998*((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^2+0.05152*
+        ((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))-0.001008)*6.3*(1 / 602213670.0)*602213670.0)
+    ~ camR_ca1_B_CaMKII <-> camR_ca1_B_CaMKIIp (v_r354, 0)
+    : r355
+    v_r355 = 0.001 * ((-0.929*((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^5+3.128*((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^4-4.249*
+        ((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^3+2.998*((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^2+0.05152*
+        ((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))-0.001008)*6.3*(1 / 602213670.0)*602213670.0)
+    ~ camR_ca1_C_CaMKII <-> camR_ca1_C_CaMKIIp (v_r355, 0)
+    : r356
+    v_r356 = 0.001 * ((-0.929*((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^5+3.128*((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^4-4.249*
+        ((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^3+2.998*((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^2+0.05152*
+        ((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))-0.001008)*6.3*(1 / 602213670.0)*602213670.0)
+    ~ camR_ca1_D_CaMKII <-> camR_ca1_D_CaMKIIp (v_r356, 0)
+    : r357
+    v_r357 = 0.001 * ((-0.929*((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^5+3.128*((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^4-4.249*
+        ((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^3+2.998*((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^2+0.05152*
+        ((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))-0.001008)*6.3*(1 / 602213670.0)*602213670.0)
+    ~ camR_ca2_AB_CaMKII <-> camR_ca2_AB_CaMKIIp (v_r357, 0)
+    : r358
+    v_r358 = 0.001 * ((-0.929*((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^5+3.128*((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^4-4.249*
+        ((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^3+2.998*((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^2+0.05152*
+        ((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))-0.001008)*6.3*(1 / 602213670.0)*602213670.0)
+    ~ camR_ca2_AC_CaMKII <-> camR_ca2_AC_CaMKIIp (v_r358, 0)
+    : r359
+    v_r359 = 0.001 * ((-0.929*((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^5+3.128*((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^4-4.249*
+        ((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^3+2.998*((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^2+0.05152*
+        ((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))-0.001008)*6.3*(1 / 602213670.0)*602213670.0)
+    ~ camR_ca2_AD_CaMKII <-> camR_ca2_AD_CaMKIIp (v_r359, 0)
+    : r360
+    v_r360 = 0.001 * ((-0.929*((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^5+3.128*((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^4-4.249*
+        ((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^3+2.998*((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^2+0.05152*
+        ((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))-0.001008)*6.3*(1 / 602213670.0)*602213670.0)
+    ~ camR_ca2_BC_CaMKII <-> camR_ca2_BC_CaMKIIp (v_r360, 0)
+    : r361
+    v_r361 = 0.001 * ((-0.929*((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^5+3.128*((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^4-4.249*
+        ((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^3+2.998*((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^2+0.05152*
+        ((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))-0.001008)*6.3*(1 / 602213670.0)*602213670.0)
+    ~ camR_ca2_BD_CaMKII <-> camR_ca2_BD_CaMKIIp (v_r361, 0)
+    : r362
+    v_r362 = 0.001 * ((-0.929*((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^5+3.128*((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^4-4.249*
+        ((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^3+2.998*((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^2+0.05152*
+        ((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))-0.001008)*6.3*(1 / 602213670.0)*602213670.0)
+    ~ camR_ca2_CD_CaMKII <-> camR_ca2_CD_CaMKIIp (v_r362, 0)
+    : r363
+    v_r363 = 0.001 * ((-0.929*((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^5+3.128*((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^4-4.249*
+        ((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^3+2.998*((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^2+0.05152*
+        ((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))-0.001008)*6.3*(1 / 602213670.0)*602213670.0)
+    ~ camR_ca3_ABC_CaMKII <-> camR_ca3_ABC_CaMKIIp (v_r363, 0)
+    : r364
+    v_r364 = 0.001 * ((-0.929*((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^5+3.128*((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^4-4.249*
+        ((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^3+2.998*((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^2+0.05152*
+        ((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))-0.001008)*6.3*(1 / 602213670.0)*602213670.0)
+    ~ camR_ca3_ABD_CaMKII <-> camR_ca3_ABD_CaMKIIp (v_r364, 0)
+    : r365
+    v_r365 = 0.001 * ((-0.929*((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^5+3.128*((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^4-4.249*
+        ((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^3+2.998*((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^2+0.05152*
+        ((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))-0.001008)*6.3*(1 / 602213670.0)*602213670.0)
+    ~ camR_ca3_ACD_CaMKII <-> camR_ca3_ACD_CaMKIIp (v_r365, 0)
+    : r366
+    v_r366 = 0.001 * ((-0.929*((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^5+3.128*((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^4-4.249*
+        ((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^3+2.998*((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^2+0.05152*
+        ((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))-0.001008)*6.3*(1 / 602213670.0)*602213670.0)
+    ~ camR_ca3_BCD_CaMKII <-> camR_ca3_BCD_CaMKIIp (v_r366, 0)
+    : r367
+    v_r367 = 0.001 * ((-0.929*((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^5+3.128*((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^4-4.249*
+        ((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^3+2.998*((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))^2+0.05152*
+        ((total_CaMKII_active / 602213670.0)/(totalCaMKII / 602213670.0))-0.001008)*6.3*(1 / 602213670.0)*602213670.0)
+    ~ camR_ca4_ABCD_CaMKII <-> camR_ca4_ABCD_CaMKIIp (v_r367, 0)
+    : r368, r369
+    ~ CaMKIIp + camR <-> camR_CaMKIIp (5.313728597359804e-06, 1e-06)
+    : r370, r371
+    ~ CaMKIIp + camR_ca1_A <-> camR_ca1_A_CaMKIIp (5.313728597359804e-06, 1e-06)
+    : r372, r373
+    ~ CaMKIIp + camR_ca1_B <-> camR_ca1_B_CaMKIIp (5.313728597359804e-06, 1e-06)
+    : r374, r375
+    ~ CaMKIIp + camR_ca1_C <-> camR_ca1_C_CaMKIIp (5.313728597359804e-06, 1e-06)
+    : r376, r377
+    ~ CaMKIIp + camR_ca1_D <-> camR_ca1_D_CaMKIIp (5.313728597359804e-06, 1e-06)
+    : r378, r379
+    ~ CaMKIIp + camR_ca2_AB <-> camR_ca2_AB_CaMKIIp (5.313728597359804e-06, 1e-06)
+    : r380, r381
+    ~ CaMKIIp + camR_ca2_AC <-> camR_ca2_AC_CaMKIIp (5.313728597359804e-06, 1e-06)
+    : r382, r383
+    ~ CaMKIIp + camR_ca2_AD <-> camR_ca2_AD_CaMKIIp (5.313728597359804e-06, 1e-06)
+    : r384, r385
+    ~ CaMKIIp + camR_ca2_BC <-> camR_ca2_BC_CaMKIIp (5.313728597359804e-06, 1e-06)
+    : r386, r387
+    ~ CaMKIIp + camR_ca2_BD <-> camR_ca2_BD_CaMKIIp (5.313728597359804e-06, 1e-06)
+    : r388, r389
+    ~ CaMKIIp + camR_ca2_CD <-> camR_ca2_CD_CaMKIIp (5.313728597359804e-06, 1e-06)
+    : r390, r391
+    ~ CaMKIIp + camR_ca3_ABC <-> camR_ca3_ABC_CaMKIIp (5.313728597359804e-06, 1e-06)
+    : r392, r393
+    ~ CaMKIIp + camR_ca3_ABD <-> camR_ca3_ABD_CaMKIIp (5.313728597359804e-06, 1e-06)
+    : r394, r395
+    ~ CaMKIIp + camR_ca3_ACD <-> camR_ca3_ACD_CaMKIIp (5.313728597359804e-06, 1e-06)
+    : r396, r397
+    ~ CaMKIIp + camR_ca3_BCD <-> camR_ca3_BCD_CaMKIIp (5.313728597359804e-06, 1e-06)
+    : r398, r399
+    ~ CaMKIIp + camR_ca4_ABCD <-> camR_ca4_ABCD_CaMKIIp (5.313728597359804e-06, 1e-06)
+    : r504, r508
+    ~ ca + camR_CaMKIIp <-> camR_ca1_A_CaMKIIp (1.6605401866749388e-06, 0.008320000000000003)
+    : r505, r567
+    ~ ca + camR_CaMKIIp <-> camR_ca1_B_CaMKIIp (1.6605401866749388e-06, 1.66e-05)
+    : r506, r509
+    ~ ca + camR_CaMKIIp <-> camR_ca1_C_CaMKIIp (1.6605401866749388e-06, 0.0174)
+    : r507, r510
+    ~ ca + camR_CaMKIIp <-> camR_ca1_D_CaMKIIp (1.6605401866749388e-06, 1.4500000000000003e-05)
+    : r511, r524
+    ~ ca + camR_ca1_A_CaMKIIp <-> camR_ca2_AB_CaMKIIp (1.6605401866749388e-06, 1.66e-05)
+    : r512, r526
+    ~ ca + camR_ca1_A_CaMKIIp <-> camR_ca2_AC_CaMKIIp (1.6605401866749388e-06, 0.0174)
+    : r513, r528
+    ~ ca + camR_ca1_A_CaMKIIp <-> camR_ca2_AD_CaMKIIp (1.6605401866749388e-06, 1.4500000000000003e-05)
+    : r514, r523
+    ~ ca + camR_ca1_B_CaMKIIp <-> camR_ca2_AB_CaMKIIp (1.6605401866749388e-06, 0.008320000000000003)
+    : r515, r530
+    ~ ca + camR_ca1_B_CaMKIIp <-> camR_ca2_BC_CaMKIIp (1.6605401866749388e-06, 0.0174)
+    : r516, r532
+    ~ ca + camR_ca1_B_CaMKIIp <-> camR_ca2_BD_CaMKIIp (1.6605401866749388e-06, 1.4500000000000003e-05)
+    : r517, r525
+    ~ ca + camR_ca1_C_CaMKIIp <-> camR_ca2_AC_CaMKIIp (1.6605401866749388e-06, 0.008320000000000003)
+    : r518, r529
+    ~ ca + camR_ca1_C_CaMKIIp <-> camR_ca2_BC_CaMKIIp (1.6605401866749388e-06, 1.66e-05)
+    : r519, r534
+    ~ ca + camR_ca1_C_CaMKIIp <-> camR_ca2_CD_CaMKIIp (1.6605401866749388e-06, 1.4500000000000003e-05)
+    : r520, r527
+    ~ ca + camR_ca1_D_CaMKIIp <-> camR_ca2_AD_CaMKIIp (1.6605401866749388e-06, 0.008320000000000003)
+    : r521, r531
+    ~ ca + camR_ca1_D_CaMKIIp <-> camR_ca2_BD_CaMKIIp (1.6605401866749388e-06, 1.66e-05)
+    : r522, r533
+    ~ ca + camR_ca1_D_CaMKIIp <-> camR_ca2_CD_CaMKIIp (1.6605401866749388e-06, 0.0174)
+    : r535, r547
+    ~ ca + camR_ca2_AB_CaMKIIp <-> camR_ca3_ABC_CaMKIIp (1.6605401866749388e-06, 0.0174)
+    : r536, r550
+    ~ ca + camR_ca2_AB_CaMKIIp <-> camR_ca3_ABD_CaMKIIp (1.6605401866749388e-06, 1.4500000000000003e-05)
+    : r537, r548
+    ~ ca + camR_ca2_AC_CaMKIIp <-> camR_ca3_ABC_CaMKIIp (1.6605401866749388e-06, 1.66e-05)
+    : r538, r553
+    ~ ca + camR_ca2_AC_CaMKIIp <-> camR_ca3_ACD_CaMKIIp (1.6605401866749388e-06, 1.4500000000000003e-05)
+    : r539, r551
+    ~ ca + camR_ca2_AD_CaMKIIp <-> camR_ca3_ABD_CaMKIIp (1.6605401866749388e-06, 1.66e-05)
+    : r540, r554
+    ~ ca + camR_ca2_AD_CaMKIIp <-> camR_ca3_ACD_CaMKIIp (1.6605401866749388e-06, 0.0174)
+    : r541, r549
+    ~ ca + camR_ca2_BC_CaMKIIp <-> camR_ca3_ABC_CaMKIIp (1.6605401866749388e-06, 0.008320000000000003)
+    : r542, r556
+    ~ ca + camR_ca2_BC_CaMKIIp <-> camR_ca3_BCD_CaMKIIp (1.6605401866749388e-06, 1.4500000000000003e-05)
+    : r543, r552
+    ~ ca + camR_ca2_BD_CaMKIIp <-> camR_ca3_ABD_CaMKIIp (1.6605401866749388e-06, 0.008320000000000003)
+    : r544, r557
+    ~ ca + camR_ca2_BD_CaMKIIp <-> camR_ca3_BCD_CaMKIIp (1.6605401866749388e-06, 0.0174)
+    : r545, r555
+    ~ ca + camR_ca2_CD_CaMKIIp <-> camR_ca3_ACD_CaMKIIp (1.6605401866749388e-06, 0.008320000000000003)
+    : r546, r558
+    ~ ca + camR_ca2_CD_CaMKIIp <-> camR_ca3_BCD_CaMKIIp (1.6605401866749388e-06, 1.66e-05)
+    : r559, r563
+    ~ ca + camR_ca3_BCD_CaMKIIp <-> camR_ca4_ABCD_CaMKIIp (1.6605401866749388e-06, 0.008320000000000003)
+    : r560, r564
+    ~ ca + camR_ca3_ACD_CaMKIIp <-> camR_ca4_ABCD_CaMKIIp (1.6605401866749388e-06, 1.66e-05)
+    : r561, r565
+    ~ ca + camR_ca3_ABD_CaMKIIp <-> camR_ca4_ABCD_CaMKIIp (1.6605401866749388e-06, 0.0174)
+    : r562, r566
+    ~ ca + camR_ca3_ABC_CaMKIIp <-> camR_ca4_ABCD_CaMKIIp (1.6605401866749388e-06, 1.4500000000000003e-05)
+    : r400, r401
+    ~ PKA + D <-> D_PKA (9.299025045379657e-06, 0.0108)
+    : r402
+    ~ D_PKA <-> Dp + PKA (0.0027, 0)
+    : r403, r404
+    ~ camR_PP2B + Dp <-> Dp_camR_PP2B (6.808214765367251e-06, 0.0064)
+    : r405
+    ~ Dp_camR_PP2B <-> D + camR_PP2B (0.0002, 0)
+    : r406, r407
+    ~ camR_ca1_A_PP2B + Dp <-> Dp_camR_ca1_A_PP2B (6.808214765367251e-06, 0.0064)
+    : r408
+    ~ Dp_camR_ca1_A_PP2B <-> D + camR_ca1_A_PP2B (0.0002, 0)
+    : r409, r410
+    ~ camR_ca1_B_PP2B + Dp <-> Dp_camR_ca1_B_PP2B (6.808214765367251e-06, 0.0064)
+    : r411
+    ~ Dp_camR_ca1_B_PP2B <-> D + camR_ca1_B_PP2B (0.0002, 0)
+    : r412, r413
+    ~ camR_ca1_C_PP2B + Dp <-> Dp_camR_ca1_C_PP2B (6.808214765367251e-06, 0.0064)
+    : r414
+    ~ Dp_camR_ca1_C_PP2B <-> D + camR_ca1_C_PP2B (0.0002, 0)
+    : r415, r416
+    ~ camR_ca1_D_PP2B + Dp <-> Dp_camR_ca1_D_PP2B (6.808214765367251e-06, 0.0064)
+    : r417
+    ~ Dp_camR_ca1_D_PP2B <-> D + camR_ca1_D_PP2B (0.0002, 0)
+    : r418, r419
+    ~ camR_ca2_AB_PP2B + Dp <-> Dp_camR_ca2_AB_PP2B (6.808214765367251e-06, 0.0064)
+    : r420
+    ~ Dp_camR_ca2_AB_PP2B <-> D + camR_ca2_AB_PP2B (0.0002, 0)
+    : r421, r422
+    ~ camR_ca2_AC_PP2B + Dp <-> Dp_camR_ca2_AC_PP2B (6.808214765367251e-06, 0.0064)
+    : r423
+    ~ Dp_camR_ca2_AC_PP2B <-> D + camR_ca2_AC_PP2B (0.0002, 0)
+    : r424, r425
+    ~ camR_ca2_AD_PP2B + Dp <-> Dp_camR_ca2_AD_PP2B (6.808214765367251e-06, 0.0064)
+    : r426
+    ~ Dp_camR_ca2_AD_PP2B <-> D + camR_ca2_AD_PP2B (0.0002, 0)
+    : r427, r428
+    ~ camR_ca2_BC_PP2B + Dp <-> Dp_camR_ca2_BC_PP2B (6.808214765367251e-06, 0.0064)
+    : r429
+    ~ Dp_camR_ca2_BC_PP2B <-> D + camR_ca2_BC_PP2B (0.0002, 0)
+    : r430, r431
+    ~ camR_ca2_BD_PP2B + Dp <-> Dp_camR_ca2_BD_PP2B (6.808214765367251e-06, 0.0064)
+    : r432
+    ~ Dp_camR_ca2_BD_PP2B <-> D + camR_ca2_BD_PP2B (0.0002, 0)
+    : r433, r434
+    ~ camR_ca2_CD_PP2B + Dp <-> Dp_camR_ca2_CD_PP2B (6.808214765367251e-06, 0.0064)
+    : r435
+    ~ Dp_camR_ca2_CD_PP2B <-> D + camR_ca2_CD_PP2B (0.0002, 0)
+    : r436, r437
+    ~ camR_ca3_ABC_PP2B + Dp <-> Dp_camR_ca3_ABC_PP2B (6.808214765367251e-06, 0.0064)
+    : r438
+    ~ Dp_camR_ca3_ABC_PP2B <-> D + camR_ca3_ABC_PP2B (0.0002, 0)
+    : r439, r440
+    ~ camR_ca3_ABD_PP2B + Dp <-> Dp_camR_ca3_ABD_PP2B (6.808214765367251e-06, 0.0064)
+    : r441
+    ~ Dp_camR_ca3_ABD_PP2B <-> D + camR_ca3_ABD_PP2B (0.0002, 0)
+    : r442, r443
+    ~ camR_ca3_ACD_PP2B + Dp <-> Dp_camR_ca3_ACD_PP2B (6.808214765367251e-06, 0.0064)
+    : r444
+    ~ Dp_camR_ca3_ACD_PP2B <-> D + camR_ca3_ACD_PP2B (0.0002, 0)
+    : r445, r446
+    ~ camR_ca3_BCD_PP2B + Dp <-> Dp_camR_ca3_BCD_PP2B (6.808214765367251e-06, 0.0064)
+    : r447
+    ~ Dp_camR_ca3_BCD_PP2B <-> D + camR_ca3_BCD_PP2B (0.0002, 0)
+    : r448, r449
+    ~ camR_ca4_ABCD_PP2B + Dp <-> Dp_camR_ca4_ABCD_PP2B (6.808214765367251e-06, 0.0064)
+    : r450
+    ~ Dp_camR_ca4_ABCD_PP2B <-> D + camR_ca4_ABCD_PP2B (0.0002, 0)
+    : r451, r452
+    ~ Dp + PP1a <-> PP1a_Dp (6.642160746699755e-06, 0.0004)
+    : r453, r454
+    ~ PP1a + CaMKIIp <-> CaMKIIp_PP1a (4.981620560024816e-06, 0.0005)
+    : r455
+    ~ CaMKIIp_PP1a <-> CaMKII + PP1a (0.002, 0)
+    : r456, r457
+    ~ PP1a + camR_CaMKIIp <-> camR_CaMKIIp_PP1a (4.981620560024816e-06, 0.0005)
+    : r458
+    ~ camR_CaMKIIp_PP1a <-> camR_CaMKII + PP1a (0.002, 0)
+    : r459, r460
+    ~ PP1a + camR_ca1_A_CaMKIIp <-> camR_ca1_A_CaMKIIp_PP1a (4.981620560024816e-06, 0.0005)
+    : r461
+    ~ camR_ca1_A_CaMKIIp_PP1a <-> camR_ca1_A_CaMKII + PP1a (0.002, 0)
+    : r462, r463
+    ~ PP1a + camR_ca1_B_CaMKIIp <-> camR_ca1_B_CaMKIIp_PP1a (4.981620560024816e-06, 0.0005)
+    : r464
+    ~ camR_ca1_B_CaMKIIp_PP1a <-> camR_ca1_B_CaMKII + PP1a (0.002, 0)
+    : r465, r466
+    ~ PP1a + camR_ca1_C_CaMKIIp <-> camR_ca1_C_CaMKIIp_PP1a (4.981620560024816e-06, 0.0005)
+    : r467
+    ~ camR_ca1_C_CaMKIIp_PP1a <-> camR_ca1_C_CaMKII + PP1a (0.002, 0)
+    : r468, r469
+    ~ PP1a + camR_ca1_D_CaMKIIp <-> camR_ca1_D_CaMKIIp_PP1a (4.981620560024816e-06, 0.0005)
+    : r470
+    ~ camR_ca1_D_CaMKIIp_PP1a <-> camR_ca1_D_CaMKII + PP1a (0.002, 0)
+    : r471, r472
+    ~ PP1a + camR_ca2_AB_CaMKIIp <-> camR_ca2_AB_CaMKIIp_PP1a (4.981620560024816e-06, 0.0005)
+    : r473
+    ~ camR_ca2_AB_CaMKIIp_PP1a <-> camR_ca2_AB_CaMKII + PP1a (0.002, 0)
+    : r474, r475
+    ~ PP1a + camR_ca2_AC_CaMKIIp <-> camR_ca2_AC_CaMKIIp_PP1a (4.981620560024816e-06, 0.0005)
+    : r476
+    ~ camR_ca2_AC_CaMKIIp_PP1a <-> camR_ca2_AC_CaMKII + PP1a (0.002, 0)
+    : r477, r478
+    ~ PP1a + camR_ca2_AD_CaMKIIp <-> camR_ca2_AD_CaMKIIp_PP1a (4.981620560024816e-06, 0.0005)
+    : r479
+    ~ camR_ca2_AD_CaMKIIp_PP1a <-> camR_ca2_AD_CaMKII + PP1a (0.002, 0)
+    : r480, r481
+    ~ PP1a + camR_ca2_BC_CaMKIIp <-> camR_ca2_BC_CaMKIIp_PP1a (4.981620560024816e-06, 0.0005)
+    : r482
+    ~ camR_ca2_BC_CaMKIIp_PP1a <-> camR_ca2_BC_CaMKII + PP1a (0.002, 0)
+    : r483, r484
+    ~ PP1a + camR_ca2_BD_CaMKIIp <-> camR_ca2_BD_CaMKIIp_PP1a (4.981620560024816e-06, 0.0005)
+    : r485
+    ~ camR_ca2_BD_CaMKIIp_PP1a <-> camR_ca2_BD_CaMKII + PP1a (0.002, 0)
+    : r486, r487
+    ~ PP1a + camR_ca2_CD_CaMKIIp <-> camR_ca2_CD_CaMKIIp_PP1a (4.981620560024816e-06, 0.0005)
+    : r488
+    ~ camR_ca2_CD_CaMKIIp_PP1a <-> camR_ca2_CD_CaMKII + PP1a (0.002, 0)
+    : r489, r490
+    ~ PP1a + camR_ca3_ABC_CaMKIIp <-> camR_ca3_ABC_CaMKIIp_PP1a (4.981620560024816e-06, 0.0005)
+    : r491
+    ~ camR_ca3_ABC_CaMKIIp_PP1a <-> camR_ca3_ABC_CaMKII + PP1a (0.002, 0)
+    : r492, r493
+    ~ PP1a + camR_ca3_ABD_CaMKIIp <-> camR_ca3_ABD_CaMKIIp_PP1a (4.981620560024816e-06, 0.0005)
+    : r494
+    ~ camR_ca3_ABD_CaMKIIp_PP1a <-> camR_ca3_ABD_CaMKII + PP1a (0.002, 0)
+    : r495, r496
+    ~ PP1a + camR_ca3_ACD_CaMKIIp <-> camR_ca3_ACD_CaMKIIp_PP1a (4.981620560024816e-06, 0.0005)
+    : r497
+    ~ camR_ca3_ACD_CaMKIIp_PP1a <-> camR_ca3_ACD_CaMKII + PP1a (0.002, 0)
+    : r498, r499
+    ~ PP1a + camR_ca3_BCD_CaMKIIp <-> camR_ca3_BCD_CaMKIIp_PP1a (4.981620560024816e-06, 0.0005)
+    : r500
+    ~ camR_ca3_BCD_CaMKIIp_PP1a <-> camR_ca3_BCD_CaMKII + PP1a (0.002, 0)
+    : r501, r502
+    ~ PP1a + camR_ca4_ABCD_CaMKIIp <-> camR_ca4_ABCD_CaMKIIp_PP1a (4.981620560024816e-06, 0.0005)
+    : r503
+    ~ camR_ca4_ABCD_CaMKIIp_PP1a <-> camR_ca4_ABCD_CaMKII + PP1a (0.002, 0)
+    : r568, r569
+    ~ PP1a_Dp + CaMKIIp <-> CaMKIIp_PP1a_Dp (0.0, 0.0)
+    : r570, r571
+    ~ PP1a_Dp + camR_CaMKIIp <-> camR_CaMKIIp_PP1a_Dp (0.0, 0.0)
+    : r572, r573
+    ~ PP1a_Dp + camR_ca1_A_CaMKIIp <-> camR_ca1_A_CaMKIIp_PP1a_Dp (0.0, 0.0)
+    : r574, r575
+    ~ PP1a_Dp + camR_ca1_B_CaMKIIp <-> camR_ca1_B_CaMKIIp_PP1a_Dp (0.0, 0.0)
+    : r576, r577
+    ~ PP1a_Dp + camR_ca1_C_CaMKIIp <-> camR_ca1_C_CaMKIIp_PP1a_Dp (0.0, 0.0)
+    : r578, r579
+    ~ PP1a_Dp + camR_ca1_D_CaMKIIp <-> camR_ca1_D_CaMKIIp_PP1a_Dp (0.0, 0.0)
+    : r580, r581
+    ~ PP1a_Dp + camR_ca2_AB_CaMKIIp <-> camR_ca2_AB_CaMKIIp_PP1a_Dp (0.0, 0.0)
+    : r582, r583
+    ~ PP1a_Dp + camR_ca2_AC_CaMKIIp <-> camR_ca2_AC_CaMKIIp_PP1a_Dp (0.0, 0.0)
+    : r584, r585
+    ~ PP1a_Dp + camR_ca2_AD_CaMKIIp <-> camR_ca2_AD_CaMKIIp_PP1a_Dp (0.0, 0.0)
+    : r586, r587
+    ~ PP1a_Dp + camR_ca2_BC_CaMKIIp <-> camR_ca2_BC_CaMKIIp_PP1a_Dp (0.0, 0.0)
+    : r588, r589
+    ~ PP1a_Dp + camR_ca2_BD_CaMKIIp <-> camR_ca2_BD_CaMKIIp_PP1a_Dp (0.0, 0.0)
+    : r590, r591
+    ~ PP1a_Dp + camR_ca2_CD_CaMKIIp <-> camR_ca2_CD_CaMKIIp_PP1a_Dp (0.0, 0.0)
+    : r592, r593
+    ~ PP1a_Dp + camR_ca3_ABC_CaMKIIp <-> camR_ca3_ABC_CaMKIIp_PP1a_Dp (0.0, 0.0)
+    : r594, r595
+    ~ PP1a_Dp + camR_ca3_ABD_CaMKIIp <-> camR_ca3_ABD_CaMKIIp_PP1a_Dp (0.0, 0.0)
+    : r596, r597
+    ~ PP1a_Dp + camR_ca3_ACD_CaMKIIp <-> camR_ca3_ACD_CaMKIIp_PP1a_Dp (0.0, 0.0)
+    : r598, r599
+    ~ PP1a_Dp + camR_ca3_BCD_CaMKIIp <-> camR_ca3_BCD_CaMKIIp_PP1a_Dp (0.0, 0.0)
+    : r600, r601
+    ~ PP1a_Dp + camR_ca4_ABCD_CaMKIIp <-> camR_ca4_ABCD_CaMKIIp_PP1a_Dp (0.0, 0.0)
+    : r602, r603
+    ~ Dp + CaMKIIp_PP1a <-> CaMKIIp_PP1a_Dp (0.0, 0.0)
+    : r604, r605
+    ~ Dp + camR_CaMKIIp_PP1a <-> camR_CaMKIIp_PP1a_Dp (0.0, 0.0)
+    : r606, r607
+    ~ Dp + camR_ca1_A_CaMKIIp_PP1a <-> camR_ca1_A_CaMKIIp_PP1a_Dp (0.0, 0.0)
+    : r608, r609
+    ~ Dp + camR_ca1_B_CaMKIIp_PP1a <-> camR_ca1_B_CaMKIIp_PP1a_Dp (0.0, 0.0)
+    : r610, r611
+    ~ Dp + camR_ca1_C_CaMKIIp_PP1a <-> camR_ca1_C_CaMKIIp_PP1a_Dp (0.0, 0.0)
+    : r612, r613
+    ~ Dp + camR_ca1_D_CaMKIIp_PP1a <-> camR_ca1_D_CaMKIIp_PP1a_Dp (0.0, 0.0)
+    : r614, r615
+    ~ Dp + camR_ca2_AB_CaMKIIp_PP1a <-> camR_ca2_AB_CaMKIIp_PP1a_Dp (0.0, 0.0)
+    : r616, r617
+    ~ Dp + camR_ca2_AC_CaMKIIp_PP1a <-> camR_ca2_AC_CaMKIIp_PP1a_Dp (0.0, 0.0)
+    : r618, r619
+    ~ Dp + camR_ca2_AD_CaMKIIp_PP1a <-> camR_ca2_AD_CaMKIIp_PP1a_Dp (0.0, 0.0)
+    : r620, r621
+    ~ Dp + camR_ca2_BC_CaMKIIp_PP1a <-> camR_ca2_BC_CaMKIIp_PP1a_Dp (0.0, 0.0)
+    : r622, r623
+    ~ Dp + camR_ca2_BD_CaMKIIp_PP1a <-> camR_ca2_BD_CaMKIIp_PP1a_Dp (0.0, 0.0)
+    : r624, r625
+    ~ Dp + camR_ca2_CD_CaMKIIp_PP1a <-> camR_ca2_CD_CaMKIIp_PP1a_Dp (0.0, 0.0)
+    : r626, r627
+    ~ Dp + camR_ca3_ABC_CaMKIIp_PP1a <-> camR_ca3_ABC_CaMKIIp_PP1a_Dp (0.0, 0.0)
+    : r628, r629
+    ~ Dp + camR_ca3_ABD_CaMKIIp_PP1a <-> camR_ca3_ABD_CaMKIIp_PP1a_Dp (0.0, 0.0)
+    : r630, r631
+    ~ Dp + camR_ca3_ACD_CaMKIIp_PP1a <-> camR_ca3_ACD_CaMKIIp_PP1a_Dp (0.0, 0.0)
+    : r632, r633
+    ~ Dp + camR_ca3_BCD_CaMKIIp_PP1a <-> camR_ca3_BCD_CaMKIIp_PP1a_Dp (0.0, 0.0)
+    : r634, r635
+    ~ Dp + camR_ca4_ABCD_CaMKIIp_PP1a <-> camR_ca4_ABCD_CaMKIIp_PP1a_Dp (0.0, 0.0)
+    : AMPAR_Phosphorylation_831
+    v_AMPAR_Phosphorylation_831 = 0.001 * (0.5 * (total_CaMKII_active / 602213670.0) *  ((AMPAR / 602213670.0) / ((AMPAR / 602213670.0) + 9.00001e-05)) *602213670.0)
+    ~ AMPAR << (-1 * v_AMPAR_Phosphorylation_831)
+    ~ AMPAR_P << (1 * v_AMPAR_Phosphorylation_831)
+    : AMPAR_Dephosphorylation_831
+    v_AMPAR_Dephosphorylation_831 = 0.001 * (0.5 * (totPP1 / 602213670.0) *  ((AMPAR_P / 602213670.0) / ((AMPAR_P / 602213670.0) + 2e-06)) *602213670.0)
+    ~ AMPAR_P << (-1 * v_AMPAR_Dephosphorylation_831)
+    ~ AMPAR << (1 * v_AMPAR_Dephosphorylation_831)
+}
@@ -17,6 +17,7 @@ Copyright	  Maciej Lazarewicz, 2001
 ENDCOMMENT
 
 NEURON {
+	THREADSAFE
 	SUFFIX bkkca
 	USEION k READ ek WRITE ik
 	USEION ca READ cai
@@ -12,9 +12,11 @@ UNITS {
 }
 
 NEURON {
+	THREADSAFE
 	SUFFIX caL
 	USEION cal READ cali, calo WRITE ical VALENCE 2
-	RANGE pbar, ical, mshift, hshift
+	RANGE pbar, ical
+	GLOBAL mshift, hshift	: the TABLE depends on them
 }
 
 PARAMETER {
@@ -12,9 +12,11 @@ UNITS {
 }
 
 NEURON {
+	THREADSAFE
 	SUFFIX caL13
 	USEION cal READ cali, calo WRITE ical VALENCE 2
-	RANGE pcaLbar, ical, mshift, hshift, qfact, hqfact
+	RANGE pcaLbar, ical, qfact, hqfact
+	GLOBAL mshift, hshift	: the TABLE depends on them
 }
 
 PARAMETER {
@@ -3,6 +3,7 @@ TITLE Submembrane calcium dynamics for N, P/Q, R calcium pool for NAcb cell
 INDEPENDENT {t FROM 0 TO 1 WITH 1 (ms)}
 
 NEURON {
+	THREADSAFE
 	SUFFIX cadyn
 	USEION ca READ ica, cai WRITE cai
 	RANGE pump, cainf, taur, drive
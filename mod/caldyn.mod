@@ -3,6 +3,7 @@ TITLE Submembrane calcium dynamics for L-type calcium channels (HVA & LVA)
 INDEPENDENT {t FROM 0 TO 1 WITH 1 (ms)}
 
 NEURON {
+	THREADSAFE
 	SUFFIX caldyn
 	USEION cal READ ical, cali WRITE cali VALENCE 2
 	RANGE pump, cainf, taur, drive
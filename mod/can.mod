@@ -12,6 +12,7 @@ UNITS {
 }
 
 NEURON {
+	THREADSAFE
 	SUFFIX can
 	USEION ca READ cai, cao WRITE ica
 	RANGE pbar, ica
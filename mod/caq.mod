@@ -12,6 +12,7 @@ UNITS {
 }
 
 NEURON {
+	THREADSAFE
 	SUFFIX caq
 	USEION ca READ cai, cao WRITE ica
 	RANGE pcaqbar, ica
@@ -12,6 +12,7 @@ UNITS {
 }
 
 NEURON {
+	THREADSAFE
 	SUFFIX car
 	USEION ca READ cai, cao WRITE ica
 	RANGE pcarbar, ica
@@ -12,6 +12,7 @@ UNITS {
 }
 
 NEURON {
+	THREADSAFE
 	SUFFIX cat
 	USEION cal READ cali, calo WRITE ical VALENCE 2
 	RANGE pcatbar, ical
@@ -5,7 +5,7 @@ NEURON {
 	SUFFIX catrack
 	USEION ca READ cao, cai, ica WRITE cai, ica
 	RANGE ica_pmp
-	GLOBAL vrat : vrat must be GLOBAL see INITIAL block
+	GLOBAL vrat : filled by factors() in INITIAL
 	: however TotalBuffer may be RANGE
 }
 
@@ -70,13 +70,9 @@ BREAKPOINT {
 	ica = ica_pmp
 }
 
-LOCAL factors_done
-
 INITIAL {
-	if (factors_done == 0) { 	: flag becomes 1 in the first segment
-		factors_done = 1 		: all subsequent segments will have
-		factors() 				: vrat = 0 unless vrat is GLOBAL
-	}
+	factors()	: vrat is thread specific (THREADSAFE), so every
+				: thread fills its own copy
 
 	Kd = k1buf/k2buf
 	B0 = TotalBuffer/(1 + Kd*cai)
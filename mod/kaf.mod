@@ -18,9 +18,11 @@ UNITS {
 }
 
 NEURON {
+	THREADSAFE
 	SUFFIX kaf
 	USEION k READ ek WRITE ik
-	RANGE gkbar, ik, mshift, hshift
+	RANGE gkbar, ik
+	GLOBAL mshift, hshift	: the TABLE depends on them
 }
 
 PARAMETER {
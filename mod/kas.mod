@@ -19,6 +19,7 @@ UNITS {
 }
  
 NEURON {
+        THREADSAFE
         SUFFIX kas
         USEION k READ ek WRITE ik
         RANGE  gkbar, ik
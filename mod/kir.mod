@@ -31,9 +31,11 @@ UNITS {
 }
  
 NEURON {
+        THREADSAFE
         SUFFIX kir
         USEION k READ ek WRITE ik
-        RANGE  gkbar, ik, mvhalf, mslope, mshift, qfact
+        RANGE  gkbar, ik, qfact
+        GLOBAL mvhalf, mslope, mshift	: the TABLE depends on them
 }
  
 PARAMETER {
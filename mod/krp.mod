@@ -19,6 +19,7 @@ UNITS {
 }
  
 NEURON {
+        THREADSAFE
         SUFFIX krp
         USEION k READ ek WRITE ik
         RANGE  gkbar, ik
@@ -17,9 +17,11 @@ UNITS {
 }
  
 NEURON {
+        THREADSAFE
         SUFFIX naf
         USEION na READ ena WRITE ina
-        RANGE  gnabar, ina, mshift, hshift
+        RANGE  gnabar, ina
+        GLOBAL mshift, hshift	: the TABLE depends on them
 }
  
 PARAMETER {
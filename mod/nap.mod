@@ -19,6 +19,7 @@ UNITS {
 }
  
 NEURON {
+        THREADSAFE
         SUFFIX nap
         USEION na READ ena WRITE ina
         RANGE  gnabar, ina
@@ -5,6 +5,7 @@ TITLE Submembrane calcium dynamics for N, P/Q, R calcium pool for NAcb cell
 INDEPENDENT {t FROM 0 TO 1 WITH 1 (ms)}
 
 NEURON {
+	THREADSAFE
 	SUFFIX rubin
 	USEION ca READ cai 
 	USEION cal READ cali 
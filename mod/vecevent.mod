@@ -58,6 +58,14 @@ VERBATIM
 ENDVERBATIM
 }
 
+PROCEDURE rewind() {
+: back to the first element, as after the INITIAL but without the
+: event: used after a SaveState restore, which keeps the event queue
+: of the INITIAL and overwrites the index
+	index = 0
+	element()
+}
+
 PROCEDURE play() {
 VERBATIM
 	void** vv;
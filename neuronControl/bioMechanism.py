@@ -0,0 +1,183 @@
+# Control the biochemical mechanism inserted in the spine head.
+
+"""
+The biomd183 mechanism (mod/biomd183.mod, generated with
+ecellControl/nmodlWriter.py) integrates the biochemical model inside NEURON,
+one copy for each spine head. The BioMechanismManager exposes the attributes
+of the EcellManager used by the Runner, so the spine doesn't know which
+simulator is behind.
+
+The equilibrium of the biochemical model is computed once with the batched
+engine, or solved as steady state (see ecellControl.steadyState), and used
+as initial value of the mechanism.
+"""
+
+import numpy
+from neuron import h
+
+import logging
+logger = logging.getLogger(__name__)
+
+SUFFIX = 'biomd183'
+
+
+def equilibrate(filename, t_equilibrium, steady_state=False):
+    """Bring the model to equilibrium with the batched engine, or to the
+    steady state if stable, and set the values as initial values of the
+    mechanism.
+
+    Return the SizeN_A of the spine, to convert the values in MolarConc.
+    To be called before the finitialize."""
+    from ecellControl.batchedManager import BatchedEcellManager
+    from ecellControl.emlNetwork import get_name
+    batch = BatchedEcellManager(filename, 1)
+    values = None
+    if steady_state:
+        from ecellControl.steadyState import solve_steady_state
+        values = solve_steady_state(filename)
+    if values is None:
+        batch.run(t_equilibrium)
+    else:
+        batch.values[0] = [values[var] for var in batch.network.variables]
+    for col in batch.states:
+        name = get_name(batch.network.variables[col])
+        setattr(h, "%s0_%s" %(name, SUFFIX), batch.values[0, col])
+    logger.info("Biochemical equilibrium computed for the %s mechanism" %SUFFIX)
+    return batch.size_n_a[batch.var_index['Variable:/Spine:ca']]
+
+
+class MechanismStub(object):
+    """Get and set a variable or a coupling property of the mechanism,
+    with the E-Cell stub syntax: stub['Value']"""
+
+    def __init__(self, segment, id, size_n_a=None):
+        self.segment = segment
+        self.id = id
+        self.size_n_a = size_n_a
+
+    def __getitem__(self, name):
+        return self.getProperty(name)
+
+    def __setitem__(self, name, value):
+        self.setProperty(name, value)
+
+    def get_range_name(self, name):
+        if name in ('Value', 'MolarConc'):
+            return "%s_%s" %(self.id, SUFFIX)
+        return "%s_%s_%s" %(self.id, name, SUFFIX)
+
+    def getProperty(self, name):
+        value = getattr(self.segment, self.get_range_name(name))
+        if name == 'MolarConc':
+            value = value / self.size_n_a
+        return value
+
+    def setProperty(self, name, value):
+        if name == 'MolarConc':
+            value = value * self.size_n_a
+        setattr(self.segment, self.get_range_name(name), value)
+
+
+class VectorLogger(object):
+    """Logger of a mechanism variable, recorded in a NEURON Vector.
+    getData returns the n x 2 array (time [s], value) of the E-Cell loggers"""
+
+    def __init__(self, segment, id, time_vec, time_offset, interval,
+                 scale=1.):
+        self.vec = h.Vector()
+        self.vec.record(getattr(segment, "_ref_%s_%s" %(id, SUFFIX)), interval)
+        self.time_vec = time_vec
+        self.time_offset = time_offset
+        self.scale = scale
+
+    def getData(self):
+        time = self.time_offset + numpy.array(self.time_vec) / 1e3
+        values = numpy.array(self.vec) * self.scale
+        return numpy.column_stack((time, values))
+
+
+class NrnSession(object):
+    """The part of the E-Cell Session used by the Runner"""
+
+    def __init__(self, time_offset):
+        self.time_offset = time_offset
+
+    def run(self, delta_t):
+        """Nothing to do: NEURON advances the mechanism."""
+        pass
+
+    def getCurrentTime(self):
+        return self.time_offset + h.t / 1e3
+
+
+class BioMechanismManager(object):
+    """Drop-in replacement of the EcellManager using the mechanism in the
+    head of the spine.
+
+    :param
+        time_offset - E-Cell time [s] at NEURON time 0, so the time courses
+        are aligned with the ones of the E-Cell backend
+        interval - recording interval [ms] of the loggers
+    """
+
+    def __init__(self, spine, size_n_a, time_offset, interval):
+        head = spine.head
+        head.insert(SUFFIX)
+        self.segment = head(0.5)
+        setattr(self.segment, "head_vol_%s" %SUFFIX, spine.head_vol)
+        self.size_n_a = size_n_a
+        self.time_offset = time_offset
+        self.interval = interval
+        self.ses = NrnSession(time_offset)
+        self.molToTrack = ('ca',
+                           'moles_bound_ca_per_moles_cam',
+                           'Rbar',
+                           'PP2Bbar',
+                           'CaMKIIbar',
+                           'PP1abar', # Active PP1/Total PP1
+                           'AMPAR', #
+                           'AMPAR_P',
+                           'D',
+                           'totDp',
+                           'Dpbar'
+                           )
+        self.ca = MechanismStub(self.segment, 'ca', size_n_a)
+        self.CaMKIIbar = MechanismStub(self.segment, 'CaMKIIbar', size_n_a)
+        self.ampar_P = MechanismStub(self.segment, 'AMPAR_P', size_n_a)
+        self.ca_in = MechanismStub(self.segment, 'ca_in')
+        self.ca_leak = MechanismStub(self.segment, 'ca_leak')
+        self.ca_pump = MechanismStub(self.segment, 'ca_pump')
+
+    def createLoggers(self):
+        """Record the same species of the EcellManager"""
+        self.time_vec = h.Vector()
+        self.time_vec.record(h._ref_t, self.interval)
+        loggers = {}
+        for mol in self.molToTrack:
+            loggers[mol] = VectorLogger(self.segment, mol, self.time_vec,
+                                        self.time_offset, self.interval)
+        loggers['ca_conc'] = VectorLogger(self.segment, 'ca', self.time_vec,
+                                          self.time_offset, self.interval,
+                                          scale=1. / self.size_n_a)
+        self.loggers = loggers
+
+    def converToTimeCourses(self):
+        timeCourses = {}
+        for key in self.loggers:
+            timeCourses[key] = self.loggers[key].getData()
+        self.timeCourses = timeCourses
+
+    def set_coupled(self, coupled):
+        """Let the calcium of the head enter the biochemical model"""
+        setattr(self.segment, "coupled_%s" %SUFFIX, int(coupled))
+
+    def drive_ampa(self, spine):
+        """Use the AMPAR_P of the mechanism, relative to the equilibrium
+        baseline of the spine, as weight of the AMPA synapses."""
+        setattr(self.segment, "ampar_P_baseline_%s" %SUFFIX,
+                spine.ampa_equilibrium_conc)
+        for syn in spine.synapses:
+            if syn.chan_type == 'ampa':
+                h.setpointer(getattr(self.segment, "_ref_ampa_weight_%s" %SUFFIX),
+                             'bio_weight', syn.chan)
+                syn.chan.bio_weight_on = 1
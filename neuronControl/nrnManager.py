@@ -1,6 +1,7 @@
 # Author: Michele Mattioni
 # Tue Nov 11 11:54:40 GMT 2008
 
+import math
 import neuron
 from neuron import h
 import numpy
@@ -8,20 +9,57 @@ import os
 import sys
 
 from spine import *
+from spineRegistry import SpineRegistry
 from synapse import Synapse
 from helpers.loader import Loader
 
 
-class Event():
-    """Event will be added to the cvode queue list"""
-    def __init__(self, eventTime, cvode, nrnSim):
-        self.eventTime = eventTime
-        self.cvode = cvode
-        self.fih = h.FInitializeHandler(1, self.callback)
-        
-    def callback(self, eventTime, nrnSim) :
-        print "event at %f " %h.t
-        self.cvode.event(self.eventTime, self.callback(eventTime, nrnSim))
+class SyncScheduler(object):
+    """
+    Deliver the synchronization points between NEURON and Ecell as events in 
+    the cvode queue. NEURON integrates natively between two events and the 
+    python callback is called only at the sync instants.
+    """
+    def __init__(self, callback, dt):
+        """
+        :param
+            callback - python callable invoked at each sync point, 
+            without arguments. h.t holds the time of the event.
+            dt - fixed step of NEURON [ms], for the tolerance on the times: 
+            with CVode h.dt is the last variable step
+        """
+        self.callback = callback
+        self.dt = dt
+        self.cvode = h.CVode()
+        self.n_events = 0
+        
+    def schedule(self, t_start, t_stop, interval):
+        """Register one event every `interval` [ms] from `t_start` (excluded) 
+        to `t_stop`.
+        
+        The events falling within half a dt from t_stop are not registered, 
+        because the integration can stop before delivering them. Return 
+        the number of registered events."""
+        # Computing the times from the index to avoid cumulative float errors
+        n_sync = int((t_stop - t_start) / interval + 0.5)
+        n_registered = 0
+        for i in range(1, n_sync + 1):
+            t_event = t_start + i * interval
+            if t_event > t_stop - self.dt / 2.:
+                break
+            self.cvode.event(t_event, self.fire)
+            n_registered += 1
+        return n_registered
+    
+    def schedule_at(self, t_event):
+        """Register one event at `t_event` [ms]. It can be called from the 
+        callback, to schedule the next sync on the fly."""
+        self.cvode.event(t_event, self.fire)
+    
+    def fire(self):
+        """Called by NEURON when the event is delivered"""
+        self.n_events += 1
+        self.callback()
 
 
 class NeuronManager():
@@ -33,9 +71,24 @@ class NeuronManager():
                  hoc_path="hoc",
                  mod_path="mod", 
                  msn=True, 
-                 spines_dist=None):
+                 spines_dist=None,
+                 explicit_spines=None,
+                 neighbour_distance=0,
+                 d_lambda=None,
+                 lambda_freq=100,
+                 stimulated_spines=()):
         """Load and initiate all the hoc and mod file. Can load the model of the neuron
-        or otherwise can just expose general method"""
+        or otherwise can just expose general method
+        
+        With `explicit_spines` (list of spine ids) only these spines, and 
+        the ones within `neighbour_distance` [um] from them on the same 
+        dendrite, are created. The area of the others is folded in the 
+        dendrite (see fold_spines).
+        
+        With `d_lambda` the number of segments of all the sections is set 
+        by the d_lambda rule at `lambda_freq` [Hz], once the spines are 
+        attached (see set_nseg). The sections of the `stimulated_spines` 
+        and their dendrites keep at least their resolution."""
         
         # Mod file are always in a mod directory
         if not os.path.exists(mod_path) :
@@ -51,6 +104,11 @@ class NeuronManager():
 
         preface_pos = head
         
+        # Spine factor of the segments with folded spines
+        self.spine_factors = {}
+        # All the spines, also the folded ones
+        self.registry = SpineRegistry()
+        
         h('strdef preface, dirstr') # preface and dirstr used in each hoc
         preface_string = "preface = \"" + preface_pos + "\""
         h(preface_string)
@@ -61,8 +119,17 @@ class NeuronManager():
             self._set_geometry()
             
             self.biochemical_filename = biochemical_filename
+            self.explicit_spines = explicit_spines
+            self.neighbour_distance = neighbour_distance
             # Adding the spines
             self.distribute_spines(spines_dist, big_spine)
+            self.registry.set_stimulated(stimulated_spines)
+            if d_lambda is not None:
+                self.set_nseg(d_lambda, lambda_freq, stimulated_spines, 
+                              big_spine)
+            folded = numpy.flatnonzero(~self.registry.explicit)
+            if len(folded):
+                self.fold_spines(folded, big_spine)
         
         h.load_file("stdrun.hoc")
         h.v_init = -87.75 #Setting the vinit
@@ -82,10 +149,29 @@ class NeuronManager():
         
         
     def run(self, tStop):
-        """Run the simulation until tStop"""
+        """Run the simulation until tStop. NEURON integrates the whole 
+        interval (see solve)."""
+        self.solve(tStop)
+    
+    def fadvance_until(self, tStop):
+        """Run the simulation until tStop advancing one dt at the time from 
+        python. The float drift of t can add one step past tStop."""
         h.tstop = tStop
         while h.t < h.tstop:
             h.fadvance()
+    
+    def solve(self, tStop):
+        """Hand the integration to NEURON until tStop. The events in the 
+        queue (stims and the sync events) are delivered on the way, without 
+        going back to python at every dt. NEURON stops on the step closest 
+        to tStop, also with the threads."""
+        if not hasattr(self, 'pc'):
+            self.pc = h.ParallelContext()
+            # Without NetCons (no stims yet) the step between the 
+            # exchanges would be zero
+            self.pc.set_maxstep(10)
+        h.tstop = tStop
+        self.pc.psolve(tStop)
             
 
     def enable_threads(self, n_threads, multisplit_on=True):
@@ -96,6 +182,16 @@ class NeuronManager():
         if multisplit_on:
             pc.multisplit(1)
         
+    def enable_cvode(self, atol, local_dt=False):
+        """Integrate with the variable step method (CVode) with absolute 
+        tolerance atol. With local_dt each cell has its own step (lvardt): 
+        not with multisplit. The events (stims and sync points) are 
+        delivered at their exact time."""
+        cvode = h.CVode()
+        cvode.active(1)
+        cvode.atol(atol)
+        cvode.use_local_dt(int(local_dt))
+    
     def init(self, v_init=-87.75):
         """Initialize the simulator"""
         h.v_init = v_init
@@ -109,6 +205,7 @@ class NeuronManager():
     def distribute_spines(self, spine_dist, big_spine):
         """Attach spines to the dendrites"""
         self.spines = {}
+        self.registry = SpineRegistry()
         if spine_dist == 'zero':
           pass  
         elif spine_dist == 'two':
@@ -185,29 +282,163 @@ class NeuronManager():
         else:
             print "Value for the spine not understood"
             sys.exit()
+        self.create_spines(big_spine)
     
     def populate_dend(self, spine_positions, dendList, big_spine):
-        """Distribute the psines among the dends"""
-        
+        """Distribute the psines among the dends. The spines are numbered 
+        in the registry and created by create_spines."""
+        head_vol = get_head_volume(big_spine)
         for sec in dendList :
-            for pos in spine_positions:
-                tmpName = sec.name()
-                tmpName = tmpName.split('.')[1] # Get rid of the MSP_Cell[0] prefix
-                spine_number = len (self.spines) + 1
-                id = 'spine' + str(spine_number)
-                # Instantiate the spine with the biochemical model
-                spine = Spine(id, self.biochemical_filename, big_spine)
-                spine.attach(sec, pos, 0) # Attaching the spine in the right pos
-                self.spines[spine.id] = spine
-                #print "Addedd spine: %s, pos %s, sec %s" % (spine.id, pos, sec.name())
+            self.registry.add_spines(sec, spine_positions, head_vol)
+    
+    def create_spines(self, big_spine):
+        """Create the spines of the registry. Without explicit_spines all 
+        of them, otherwise the explicit ones: the others are folded in the 
+        dendrites after the segmentation."""
+        explicit_ids = self.get_explicit_spines()
+        if explicit_ids is None:
+            indexes = numpy.arange(len(self.registry))
+        else:
+            indexes = numpy.sort(self.registry.get_indexes(explicit_ids))
+        self.build_spines(self.registry.get_layout(indexes), big_spine)
+    
+    def build_spines(self, layout, big_spine):
+        """Create the spines of the layout, (id, parent section, position), 
+        and add them to the spines. The ion concentrations are set once 
+        for all of them."""
+        set_ion_concentrations()
+        spines = []
+        for id, sec, pos in layout:
+            # Instantiate the spine with the biochemical model
+            spine = Spine(id, self.biochemical_filename, big_spine, 
+                          reset_ions=False)
+            spine.attach(sec, pos, 0) # Attaching the spine in the right pos
+            spines.append((id, spine))
+            self.registry.explicit[self.registry.get_index(id)] = True
+        self.spines.update(spines)
+    
+    def get_explicit_spines(self):
+        """Ids of the spines to create: the explicit_spines and their 
+        neighbours, which are in the registry. None for all the spines."""
+        if self.explicit_spines is None:
+            return None
+        explicit_ids = set([spine_id for spine_id in self.explicit_spines 
+                            if spine_id in self.registry])
+        if self.neighbour_distance > 0:
+            for spine_id in list(explicit_ids):
+                sec = self.registry.get_parent(spine_id)
+                pos = self.registry.position[self.registry.get_index(spine_id)]
+                delta = self.neighbour_distance / sec.L
+                explicit_ids.update(self.registry.on_section(sec.name(), 
+                                                             pos - delta, 
+                                                             pos + delta))
+        return explicit_ids
+    
+    def fold_spines(self, indexes, big_spine):
+        """Fold the membrane of the spines (indexes in the registry) in the 
+        segment of the dendrite where they would be attached. The capacitance 
+        and the conductances of the segment are scaled by the spine factor 
+        (area of the segment + area of the spines) / area of the segment, 
+        the correction Wolf 2005 applied to the geometry."""
+        spine_area = get_spine_area(big_spine)
+        registry = self.registry
+        parents = registry.parent[indexes]
+        nseg = numpy.array([sec.nseg for sec in registry.sections])[parents]
+        segments = numpy.minimum((registry.position[indexes] * nseg).astype(int), 
+                                 nseg - 1)
+        # Number of spines on each (parent, segment)
+        n_max = nseg.max()
+        keys, counts = numpy.unique(parents * n_max + segments, 
+                                    return_counts=True)
+        for key, count in zip(keys, counts):
+            sec = registry.sections[key // n_max]
+            # The centre of the segment, as when iterating the section
+            x = (key % n_max + 0.5) / sec.nseg
+            area = count * spine_area
+            seg = sec(x)
+            factor = (seg.area() + area) / seg.area()
+            seg.cm *= factor
+            for mech in seg:
+                for name in self.get_densities(mech):
+                    setattr(mech, name, getattr(mech, name) * factor)
+            self.spine_factors[(sec.name(), x)] = factor
+        print "Spines created: %d, folded in the dendrites: %d" %(len(self.spines), 
+                                                              len(indexes))
+    
+    def count_compartments(self):
+        """Number of segments of all the sections"""
+        return sum([sec.nseg for sec in h.allsec()])
+    
+    def get_lambda(self, sec, freq, spine_factor=1.):
+        """AC length constant [um] of the section at freq [Hz], as lambda_f 
+        in msp_template.hoc. The capacitance is scaled by spine_factor."""
+        cm = sec.cm * spine_factor
+        n3d = int(h.n3d(sec=sec))
+        if n3d < 2:
+            return 1e5 * math.sqrt(sec.diam / (4 * math.pi * freq * sec.Ra * cm))
+        x1 = h.arc3d(0, sec=sec)
+        d1 = h.diam3d(0, sec=sec)
+        lam = 0
+        for i in range(1, n3d):
+            x2 = h.arc3d(i, sec=sec)
+            d2 = h.diam3d(i, sec=sec)
+            lam += (x2 - x1) / math.sqrt(d1 + d2)
+            x1, d1 = x2, d2
+        lam *= math.sqrt(2) * 1e-5 * math.sqrt(4 * math.pi * freq * sec.Ra * cm)
+        return sec.L / lam
+    
+    def set_nseg(self, d_lambda, freq, stimulated_spines, big_spine):
+        """Set the segments of all the sections with the d_lambda rule 
+        (geom_nseg in msp_template.hoc): each segment shorter than d_lambda 
+        times the length constant at freq [Hz]. The length constant of the 
+        dendrites takes the spines into account, with their area as extra 
+        capacitance. The dendrites with a stimulated spine and the sections 
+        of the stimulated spines don't lose segments."""
+        n_before = self.count_compartments()
+        spines_area = {}
+        if len(self.registry):
+            spine_area = get_spine_area(big_spine)
+            counts = self.registry.count_per_section()
+            for sec, count in zip(self.registry.sections, counts):
+                spines_area[sec.name()] = count * spine_area
+        guarded = set()
+        for spine_id in stimulated_spines:
+            if self.spines.has_key(spine_id):
+                spine = self.spines[spine_id]
+                for sec in (spine.parent, spine.neck, spine.head, spine.psd):
+                    guarded.add(sec.name())
+        for sec in h.allsec():
+            name = sec.name()
+            sec_area = sum([seg.area() for seg in sec])
+            spine_factor = (sec_area + spines_area.get(name, 0)) / sec_area
+            lam = self.get_lambda(sec, freq, spine_factor)
+            nseg = int((sec.L / (d_lambda * lam) + 0.9) / 2) * 2 + 1
+            if name in guarded:
+                nseg = max(nseg, sec.nseg)
+            sec.nseg = nseg
+        print "Compartments before d_lambda: %d, after: %d" %(n_before, 
+                                                            self.count_compartments())
+    
+    def get_densities(self, mech):
+        """Names of the membrane densities of a mechanism scaled by the 
+        spine factor: the conductances and the calcium permeabilities. 
+        Listed by name, because skkca has rate constants ending in bar 
+        (abar, bbar)."""
+        if mech.name() == 'pas':
+            return ['g']
+        return [name for name in ('gkbar', 'gnabar', 'pbar', 'pcaLbar', 
+                                  'pcaqbar', 'pcarbar', 'pcatbar') 
+                if hasattr(mech, name)]
             
     def set_kir_gkbar(self, gkbar):
-        """Set the conductance of kir"""
+        """Set the conductance of kir (times the spine factor in the 
+        segments with folded spines)"""
         for sec in h.allsec():
             for seg in sec:
+                factor = self.spine_factors.get((sec.name(), seg.x), 1.)
                 for mech in seg:
                     if mech.name() == 'kir':
-                        mech.gkbar = gkbar
+                        mech.gkbar = gkbar * factor
         
     
     def iClampPointProcess(self, delay=100, dur=500, amp=0.2480):
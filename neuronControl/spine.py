@@ -10,14 +10,51 @@ from synapse import Synapse
 import logging
 logger = logging.getLogger(__name__)
 
-class Spine():
+# Geometry of the sections (L, diam) [um]
+NECK = (1.5, 0.1)
+BIG_HEAD = (1, 1.175)
+PSD = (0.05, 0.5)        # Holmes & Levy 1990, Wilson 1998 (Shepherd book)
+
+def get_spine_area(big_spine):
+    """Membrane area [um2] of the neck, head and psd of a Spine, as NEURON 
+    computes it (lateral surfaces)"""
+    if not big_spine:
+        raise NotImplementedError("Area of the small spine not implemented")
+    area = 0
+    for L, diam in (NECK, BIG_HEAD, PSD):
+        area += math.pi * diam * L
+    return area
+
+def get_head_volume(big_spine):
+    """Volume [um3] of the head of a Spine"""
+    if not big_spine:
+        raise NotImplementedError("Volume of the small spine not implemented")
+    L, diam = BIG_HEAD
+    r = diam/2.
+    return math.pi * r * r * L
+
+def set_ion_concentrations():
+    """Initial concentrations of the ions of the spines (GLOBAL of the ions)"""
+    h.cai0_ca_ion = 0.001        #// mM, Churchill 1998
+    h.cao0_ca_ion = 5            #// mM, Churchill 1998 - gives eca = 100 mV
+    h.cali0_cal_ion = 0.001        #// mM, Churchill 1998
+    h.calo0_cal_ion = 5            #// mM, Churchill 1998 - gives eca = 100 mVh.cao0_ca_ion =
+
+
+class Spine(object):
     """
     Class spine. Create a spine with head neck and psd
     """
+    __slots__ = ('id', 'head_vol', 'neck', 'head', 'psd', 'parent', 'pos', 
+                 'synapses', 'filename', 'k_flux', 'Ra', 'ecellMan', 
+                 'calcium_mark', 'ampa_equilibrium_conc')
     
-    def __init__(self, id, filename_bioch_mod, big_spine):
+    def __init__(self, id, filename_bioch_mod, big_spine, reset_ions=True):
         """ Create a spine with a standard volume of ~0.11 um
-        the h is the reference to the main hoc interpreter"""
+        the h is the reference to the main hoc interpreter
+        
+        The ion concentrations are global: NeuronManager.build_spines sets 
+        them once for all the spines (reset_ions False)."""
         self.id = id
         self.head_vol = None#0.11 #um3 calculated directly from the spine heads
         self.neck = self.create_neck()
@@ -29,16 +66,19 @@ class Spine():
         self.k_flux = [[],[]]
         
         # Reset ions
-        h.cai0_ca_ion = 0.001        #// mM, Churchill 1998
-        h.cao0_ca_ion = 5            #// mM, Churchill 1998 - gives eca = 100 mV
-        h.cali0_cal_ion = 0.001        #// mM, Churchill 1998
-        h.calo0_cal_ion = 5            #// mM, Churchill 1998 - gives eca = 100 mVh.cao0_ca_ion =
+        if reset_ions:
+            set_ion_concentrations()
         
-    def setup_bio_sim(self):
+    def setup_bio_sim(self, ecellMan=None):
         """Initialize the Biochemical Simulator creating the instance of 
-        the object to control the simulation"""
+        the object to control the simulation. 
+        
+        :param
+            ecellMan - object to use instead of a new EcellManager, e.g.
+            the spine manager of a batched backend."""
         if not hasattr(self, 'ecellMan'):
-            ecellMan = eC.EcellManager(self.filename)
+            if ecellMan is None:
+                ecellMan = eC.EcellManager(self.filename)
             ecellMan.createLoggers()
             # Setting the head volume with the spine head
             ecellMan.ses.vol = self.head_vol * 1e-15 #Converted in l
@@ -77,6 +117,27 @@ class Spine():
         self.ecellMan.ca_pump['vmax'] = 0
         self.ecellMan.ca_leak['vmax'] = 0
     
+    def get_calcium(self):
+        """Calcium in the head [mM], of both the ca and the cal ions"""
+        seg = self.head(0.5)
+        return seg.cai + seg.cali
+    
+    def mark_calcium(self):
+        """Keep the calcium of the head at a sync point, the start of the 
+        next interval of the calcium flux"""
+        self.calcium_mark = self.get_calcium()
+    
+    def get_inputs(self, syn):
+        """Return the times of all the stims of the synapse"""
+        inputs = []
+        for stim in syn.stims:
+
+            stim_inputs = stim.get_stims_time()
+            #print "inputs: %s" % stim_inputs
+            inputs.extend(stim_inputs)
+            stim.spine = self.id
+        return inputs
+    
     def deploy_stims(self, neuron_time_interval_resolution):
         """Create the array with the inputs for all the synapses in this spine
         
@@ -84,52 +145,49 @@ class Spine():
             neuron_time_interval_resolution - Resolution of the vector to record 
             the synapse"""
         for syn in self.synapses:
-            inputs = []
-            for stim in syn.stims:
-
-                stim_inputs = stim.get_stims_time()
-                #print "inputs: %s" % stim_inputs
-                inputs.extend(stim_inputs)
-                stim.spine = self.id
+            inputs = self.get_inputs(syn)
             logger.info( "Creating the stim for spine: %s syn type: %s" %(self.id, syn.chan_type))
             syn.create_stimul(inputs, neuron_time_interval_resolution)
+    
+    def update_stims(self):
+        """Set the times of the current stims in the synapses already 
+        deployed"""
+        for syn in self.synapses:
+            syn.set_stims_time(self.get_inputs(syn))
+    
+    def rewind_stims(self):
+        """Rewind the vecStims of the synapses after a SaveState restore"""
+        for syn in self.synapses:
+            if hasattr(syn, 'vecStim'):
+                syn.rewind_stimul()
             
     
     def create_neck(self):
         """ Create the neck with the Grunditz value"""
-        name_sec = self.id + "_neck"
-        h("create " + name_sec)
-        neck = getattr(h, name_sec)
+        neck = h.Section(name=self.id + "_neck")
 
         neck.nseg = 3
-        neck.L = 1.5 # um
-        neck.diam = 0.1
+        neck.L, neck.diam = NECK # um
         #neck.Ra = 150.0 # Used by Grunditz et al 2008 (see supplemental material)
         neck.Ra = 100.0 #
         
         #neck.insert("pas")
         neck.insert("kir")
         
-        h.factors_catrack() # Called on the NMOD catrack
+        # the geometry factors are computed in the INITIAL of the mechanisms
         neck.insert("catrack")
-        
-        h.factors_caltrack() # Called on the NMOD caltrack
         neck.insert("caltrack") 
                 
         return neck
         
     def create_head(self, neck, head_vol, big_spine):
         """Create the head of the spine and populate it with the right channels"""
-        name_sec = self.id + "_head"
-        h("create " + name_sec)
-        head = getattr(h, name_sec)
+        head = h.Section(name=self.id + "_head")
         
         
         if big_spine:
-            head.L = 1
-            head.diam = 1.175
-            r = head.diam/2.
-            self.head_vol = math.pi * r * r * head.L
+            head.L, head.diam = BIG_HEAD
+            self.head_vol = get_head_volume(big_spine)
         else:
             head.L = 0.5
             head.diam = math.sqrt(head_vol / (head.L * math.pi) ) * 2
@@ -145,10 +203,7 @@ class Spine():
         head.insert("car")
         head.insert("skkca")
 
-        h.factors_caltrack()
         head.insert("caltrack")
-        
-        h.factors_catrack()
         head.insert("catrack")
         
         return head
@@ -156,12 +211,9 @@ class Spine():
     def create_psd(self, head):
         """Create the Post Synaptic Density of the spine to model the different \
         location of the different channel"""
-        name_sec = self.id + "_psd"
-        h("create " + name_sec)
-        psd = getattr(h, name_sec)
+        psd = h.Section(name=self.id + "_psd")
         
-        psd.L = 0.05        # um, Holmes & Levy 1990
-        psd.diam = 0.5      # Wilson 1998 (Shepherd book)
+        psd.L, psd.diam = PSD
         psd.Ra =100
         psd.nseg = 1
         
@@ -171,9 +223,7 @@ class Spine():
         psd.insert("caL")
         psd.insert("rubin")
         
-        h.factors_catrack()
         psd.insert("catrack")
-        h.factors_caltrack()
         psd.insert("caltrack")
         
         return psd
@@ -0,0 +1,153 @@
+# Registry of the spines of the neuron.
+
+"""
+The SpineRegistry keeps all the spines of the distribution in numpy arrays,
+also the ones folded in the dendrites, which have no Spine object. Entry i
+is the spine 'spine<i+1>', so the lookup by id is an index. The queries on
+the parent section, the position and the distance are vectorized::
+
+    registry.on_section('MSP_Cell[0].dend3_1[1]', 0.2, 0.6)
+    registry.nearest('spine559', 5)
+"""
+
+import numpy
+from neuron import h
+
+ID_PREFIX = 'spine'
+
+
+def get_coordinates(sec, positions):
+    """3d coordinates [um] of the positions on the section, interpolated on
+    its 3d points (nan without them)"""
+    xyz = numpy.empty((len(positions), 3))
+    xyz.fill(numpy.nan)
+    n3d = int(h.n3d(sec=sec))
+    if n3d < 2:
+        return xyz
+    arc = [h.arc3d(i, sec=sec) for i in range(n3d)]
+    for j, coordinate in enumerate((h.x3d, h.y3d, h.z3d)):
+        points = [coordinate(i, sec=sec) for i in range(n3d)]
+        xyz[:, j] = numpy.interp(positions * arc[-1], arc, points)
+    return xyz
+
+
+class SpineRegistry(object):
+    """All the spines of the neuron, in the order of creation
+
+    :arrays
+        parent - index of the parent section in `sections`
+        position - position on the parent section
+        head_vol - volume of the head [um3]
+        stimulated - True if the spine receives inputs
+        explicit - True if the Spine object is created
+        xyz - 3d coordinates of the spine on the parent section [um]
+    """
+
+    def __init__(self):
+        self.sections = []
+        self.section_index = {} # section name -> index in sections
+        self.parent = numpy.zeros(0, dtype=int)
+        self.position = numpy.zeros(0)
+        self.head_vol = numpy.zeros(0)
+        self.stimulated = numpy.zeros(0, dtype=bool)
+        self.explicit = numpy.zeros(0, dtype=bool)
+        self.xyz = numpy.zeros((0, 3))
+
+    def __len__(self):
+        return len(self.position)
+
+    def __contains__(self, spine_id):
+        try:
+            self.get_index(spine_id)
+        except KeyError:
+            return False
+        return True
+
+    def add_spines(self, sec, positions, head_vol):
+        """Add the spines on the section at the positions and return their
+        ids"""
+        name = sec.name()
+        if not self.section_index.has_key(name):
+            self.section_index[name] = len(self.sections)
+            self.sections.append(sec)
+        positions = numpy.asarray(positions, dtype=float)
+        n = len(positions)
+        start = len(self)
+        self.parent = numpy.concatenate((self.parent,
+                                         numpy.repeat(self.section_index[name], n)))
+        self.position = numpy.concatenate((self.position, positions))
+        self.head_vol = numpy.concatenate((self.head_vol,
+                                           numpy.repeat(float(head_vol), n)))
+        self.stimulated = numpy.concatenate((self.stimulated,
+                                             numpy.zeros(n, dtype=bool)))
+        self.explicit = numpy.concatenate((self.explicit,
+                                           numpy.zeros(n, dtype=bool)))
+        self.xyz = numpy.concatenate((self.xyz, get_coordinates(sec, positions)))
+        return self.get_ids(range(start, start + n))
+
+    def get_id(self, index):
+        return ID_PREFIX + str(index + 1)
+
+    def get_ids(self, indexes):
+        return [self.get_id(index) for index in indexes]
+
+    def get_index(self, spine_id):
+        """Index of the spine in the arrays. KeyError if the id is unknown."""
+        try:
+            index = int(spine_id[len(ID_PREFIX):]) - 1
+        except ValueError:
+            raise KeyError(spine_id)
+        if not spine_id.startswith(ID_PREFIX) or not 0 <= index < len(self):
+            raise KeyError(spine_id)
+        return index
+
+    def get_indexes(self, spine_ids):
+        return numpy.array([self.get_index(spine_id) for spine_id in spine_ids],
+                           dtype=int)
+
+    def get_parent(self, spine_id):
+        """Parent section of the spine"""
+        return self.sections[self.parent[self.get_index(spine_id)]]
+
+    def get_layout(self, indexes):
+        """(id, parent section, position) of the spines"""
+        return [(self.get_id(i), self.sections[self.parent[i]],
+                 self.position[i]) for i in indexes]
+
+    def set_stimulated(self, spine_ids):
+        """Flag the spines which receive inputs, ignoring the unknown ids"""
+        self.stimulated[:] = False
+        for spine_id in spine_ids:
+            try:
+                self.stimulated[self.get_index(spine_id)] = True
+            except KeyError:
+                pass
+
+    def count_per_section(self):
+        """Number of spines on each of the sections"""
+        return numpy.bincount(self.parent, minlength=len(self.sections))
+
+    def select(self, sec_name, start=0., stop=1.):
+        """Mask of the spines on the section between the positions start
+        and stop"""
+        if not self.section_index.has_key(sec_name):
+            return numpy.zeros(len(self), dtype=bool)
+        return ((self.parent == self.section_index[sec_name]) &
+                (self.position >= start) & (self.position <= stop))
+
+    def on_section(self, sec_name, start=0., stop=1.):
+        """Ids of the spines on the section between the positions start and
+        stop"""
+        return self.get_ids(numpy.flatnonzero(self.select(sec_name, start,
+                                                          stop)))
+
+    def distances(self, spine_id):
+        """Euclidean distances [um] of all the spines from the spine"""
+        index = self.get_index(spine_id)
+        return numpy.sqrt(((self.xyz - self.xyz[index])**2).sum(axis=1))
+
+    def nearest(self, spine_id, k):
+        """Ids of the k spines nearest to the spine, the closest first"""
+        distances = self.distances(spine_id)
+        distances[self.get_index(spine_id)] = numpy.inf
+        return self.get_ids(numpy.argsort(distances, kind='mergesort')[:k])
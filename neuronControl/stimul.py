@@ -1,6 +1,8 @@
 # Author Michele Mattioni   
 # Tue Oct  6 08:01:52 BST 2009
 
+import bisect
+
 class Stimul(object):
     """Store the inputs we are going to deliver to the different synapses"""
     def __init__(self, time, number, interval, chan_type, noise=0):
@@ -38,4 +40,43 @@ class Stimul(object):
     
     def to_log(self):
         s = "spine %s, time %s [ms], number %s\n" %(self.spine, self.time, self.number)
-        return s 
\ No newline at end of file
+        return s 
+
+class StimulusTimeline(object):
+    """The inputs of the stimulated spines, in time order.
+    
+    Built from the Stimul objects of the synapses of the spines. A cursor 
+    moves on the sorted inputs: each sync window starts at the first input 
+    after the current time and lasts t_buffer [ms]; the inputs within the 
+    window are consumed with it.
+    """
+    def __init__(self, spines, t_buffer):
+        inputs = []
+        for spine in spines:
+            for syn in spine.synapses:
+                for stim in syn.stims:
+                    for t in stim.get_stims_time():
+                        inputs.append((t, spine.id))
+        inputs.sort()
+        self.times = [t for t, spine_id in inputs]
+        self.spine_ids = [spine_id for t, spine_id in inputs]
+        self.t_buffer = t_buffer
+        self.cursor = 0
+    
+    def __len__(self):
+        """Number of inputs not consumed yet"""
+        return len(self.times) - self.cursor
+    
+    def next_window(self, t):
+        """Skip the inputs up to t and return the next window as 
+        (t_start, t_stop, ids of the spines with an input in it), or None 
+        if there are no inputs left."""
+        self.cursor = bisect.bisect_right(self.times, t, self.cursor)
+        if self.cursor == len(self.times):
+            return None
+        t_start = self.times[self.cursor]
+        t_stop = t_start + self.t_buffer
+        end = bisect.bisect_left(self.times, t_stop, self.cursor)
+        active_spine_ids = set(self.spine_ids[self.cursor:end])
+        self.cursor = end
+        return t_start, t_stop, active_spine_ids
@@ -34,10 +34,7 @@ class Synapse(object):
             array_inputs - Array which holds the inputs time
             neuron_time_resolution - resolution of the vectors when saving results"""
         
-        # Removing duplicates
-        array_inputs = list(set(array_inputs))
-        # Ordering the inputs
-        array_inputs.sort()
+        array_inputs = self.sort_inputs(array_inputs)
         print "Creating vecStim for syn  Channel %s, %s Array input: %s" %(self.chan,
                                                                        self.chan_type, 
                                                                        array_inputs)
@@ -57,6 +54,26 @@ class Synapse(object):
         self.createVec(neuron_time_resolution) # Recording the synapse
 
         
+    def sort_inputs(self, array_inputs):
+        """Remove the duplicates and order the inputs"""
+        array_inputs = list(set(array_inputs))
+        array_inputs.sort()
+        return array_inputs
+    
+    def set_stims_time(self, array_inputs):
+        """Change the inputs of the vecStim created by create_stimul. 
+        The vecStim reads the vector at the next finitialize."""
+        array_inputs = self.sort_inputs(array_inputs)
+        self.vec.resize(len(array_inputs))
+        for i, t in enumerate(array_inputs):
+            self.vec.x[i] = t
+    
+    def rewind_stimul(self):
+        """Point the vecStim back to the vector and to its first input after 
+        a SaveState restore, which overwrites them with the saved ones."""
+        self.vecStim.play(self.vec)
+        self.vecStim.rewind()
+        
     def createVec(self, neuron_time_resolution):
         """Create the vector to measure the activity of the synapse
         
@@ -25,8 +25,8 @@ import matplotlib.pyplot as plt
 from neuronvisio.manager import Manager
 from sumatra.external.NeuroTools import parameters
 
-from neuronControl.nrnManager import NeuronManager
-from neuronControl.stimul import Stimul
+from neuronControl.nrnManager import NeuronManager, SyncScheduler
+from neuronControl.stimul import Stimul, StimulusTimeline
 
 #import tables 
 from extref import ExtRef 
@@ -48,6 +48,25 @@ class Runner():
         # Create Neuronvisio Manager
         self.manager = Manager()
         self.vecs = {}
+        # Calcium syncs of the adaptive sync_policy and of the fixed one
+        self.n_syncs = 0
+        self.n_syncs_fixed = 0
+        # Spines with an input in the current window, with `selective_sync`
+        self.active_spine_ids = None
+        # StreamingRecorder, with `recording_flush_interval`
+        self.recorder = None
+        # Simulated time [ms] run with the coarse dt, with `dt_coarse`, 
+        # and with dtNeuron
+        self.t_coarse = 0
+        self.t_fine = 0
+        # Profiler of the phases, with `profile`. Without it the methods 
+        # are not wrapped.
+        self.profiler = None
+        if self.param.get('profile', False):
+            from helpers.profiler import Profiler
+            self.profiler = Profiler(count_steps=(self.param.get('integrator', 
+                                                                 'fixed') == 'fixed'))
+            self.profiler.instrument_runner(self)
     
     def advance_ecell(self, spine, delta_t):
         """
@@ -57,16 +76,24 @@ class Runner():
         ----------
         tmp_tstop: Temporary tstop. It has to be expressed in seconds
         """
-        current_time = spine.ecellMan.ses.getCurrentTime()
-        len_current_time = len (spine.ecellMan.loggers['ca'].getData()[:,0])
-        logger.debug ("Ecell current time: %s in %s. Advancing of: %s seconds.\
-        Current time len: %s" %(current_time, spine.id, delta_t, len_current_time))
+        if logger.isEnabledFor(logging.DEBUG):
+            # Reading the logger is expensive with the batched and pool backends
+            current_time = spine.ecellMan.ses.getCurrentTime()
+            len_current_time = len (spine.ecellMan.loggers['ca'].getData()[:,0])
+            logger.debug ("Ecell current time: %s in %s. Advancing of: %s seconds.\
+            Current time len: %s" %(current_time, spine.id, delta_t, len_current_time))
         spine.ecellMan.ses.run(delta_t)
     
-    def advance_quickly(self, tmp_tstop, nrnManager):
+    def advance_quickly(self, tmp_tstop, nrnManager, before_input=True):
         """
         Advance the two simulators quickly in an independent way. Synapse weight 
         is synchronized at the end
+        
+        With `dt_coarse` NEURON is advanced with the coarse dt and goes 
+        back to dtNeuron `dt_fine_margin` [ms] before tmp_tstop, if an 
+        input follows (before_input). NEURON first reaches the next 
+        multiple of dt_coarse with dtNeuron, so the coarse steps stay on 
+        the time base of the recordings.
         """
         stimulated_spines = self.param['stimulated_spines']
         #Update the weight
@@ -79,12 +106,55 @@ class Runner():
         logger.info ("\nAdvance quickly routine.")
         logger.info ("Current Neuron time: %s, aimed tstop[ms]: %s" %(h.t, tmp_tstop))
         logger.info ("Delta applied on Ecell simulator [s]: %s\n" % delta_ecell_seconds)
-        nrnManager.run(tmp_tstop)
+        dt_coarse = self.param.get('dt_coarse')
+        if dt_coarse:
+            margin = 0
+            if before_input:
+                margin = self.param.get('dt_fine_margin', 1)
+            # The switches are on multiples of the coarse dt
+            t_start = math.ceil(h.t / dt_coarse - 1e-6) * dt_coarse
+            n_coarse = int((tmp_tstop - margin - t_start) / dt_coarse + 1e-6)
+            if n_coarse > 0:
+                self.run_neuron(t_start, nrnManager)
+                t_start = h.t
+                h.dt = dt_coarse
+                self.run_neuron(t_start + n_coarse * dt_coarse, nrnManager)
+                h.dt = nrnManager.dt
+                self.t_coarse += h.t - t_start
+        self.run_neuron(tmp_tstop, nrnManager)
         for spine_id in stimulated_spines:
             spine = nrnManager.spines[spine_id]
             self.advance_ecell(spine, delta_ecell_seconds)
             self.update_synape_weight(spine)     
         
+    def run_neuron(self, tmp_tstop, nrnManager):
+        """Run NEURON until tmp_tstop, flushing the recordings every 
+        `recording_flush_interval` when streaming."""
+        if self.recorder is None:
+            nrnManager.run(tmp_tstop)
+        else:
+            # NEURON stops on the step closest to the time asked.
+            while h.t < tmp_tstop - nrnManager.dt / 2.:
+                nrnManager.run(min(h.t + self.param['recording_flush_interval'], 
+                                   tmp_tstop))
+                self.recorder.flush()
+    
+    def check_dt_coarse(self):
+        """The coarse dt has to be a multiple of dtNeuron and a divisor of 
+        the recording interval, to keep the recordings on the same time 
+        base in the two regimes."""
+        dt_coarse = self.param['dt_coarse']
+        for multiple, divisor, name in (
+            (dt_coarse, self.param['dtNeuron'], 'dtNeuron'),
+            (self.param['neuron_time_recording_interval'], dt_coarse, 
+             'dt_coarse')):
+            ratio = multiple / divisor
+            if ratio < 1 - 1e-6 or abs(ratio - round(ratio)) > 1e-6:
+                raise ValueError("dt_coarse %s: %s is not a multiple of %s" 
+                                 %(dt_coarse, multiple, name))
+        if self.param.get('integrator', 'fixed') == 'cvode':
+            raise ValueError("dt_coarse can't be used with the cvode integrator")
+    
     def build_vecs_to_plot(self, var, secs, anyRefs):
         """Create the dictionary of section->vectors to plot"""
         vecs_to_plot = {}
@@ -103,45 +173,121 @@ class Runner():
         - Create the NEURON inputs on each synapses according to the parameters
         - Record the synaptic vars with a SynVecRef
         - Set and initialize the ecell biochemical simulator in the stimulated
-        spine."""
+        spine.
+        
+        Return the StimulusTimeline of the inputs."""
+        
+        self.assign_stims(nrnManager)
+        for spine in self.get_input_spines(nrnManager):
+            spine.deploy_stims(self.param['neuron_time_recording_interval'])
         
+        if self.param['bio_on']:
+            self.setup_bio_sim(nrnManager) # Initializing ecell
+        
+        return self.get_timeline(nrnManager)
+    
+    def update_excitatory_inputs(self, nrnManager):
+        """Set the stims of the current param in the synapses created by 
+        create_excitatory_inputs and return the new StimulusTimeline. The 
+        new inputs are read by the vecStims at the next finitialize."""
+        for spine in self.get_input_spines(nrnManager):
+            for syn in spine.synapses:
+                syn.stims = []
+        self.assign_stims(nrnManager)
+        for spine in self.get_input_spines(nrnManager):
+            spine.update_stims()
+        return self.get_timeline(nrnManager)
+    
+    def get_timeline(self, nrnManager):
+        """StimulusTimeline of the stims assigned to the input spines"""
+        return StimulusTimeline(self.get_input_spines(nrnManager), 
+                                self.param['t_buffer'])
+    
+    def get_input_spines(self, nrnManager):
+        """The stimulated spines with a list of stims in the param"""
+        return [nrnManager.spines[spine_id] 
+                for spine_id in self.param['stimulated_spines'] 
+                if spine_id in self.param.keys()]
+    
+    def assign_stims(self, nrnManager):
+        """Append the stims in the param to the synapses of the stimulated 
+        spines and return the sorted times of all the stims"""
         excitatory_stimuli = []
         
-        for spine_id in self.param['stimulated_spines']:
-            if spine_id in self.param.keys(): # for each spine we list the input
-                spine = nrnManager.spines[spine_id]
-                for stim_id in self.param[spine.id]:
-                    stim_dictionary = self.param[stim_id]
-                    
-                    if stim_dictionary.has_key('t_stim'):
-                        stim = Stimul((stim_dictionary['t_stim']), 
-                                      stim_dictionary['numbers'], 
-                                      stim_dictionary['delay'], 
-                                      stim_dictionary['type'])   
-                        if stim.chan_type == 'ampa':
-                            for syn in spine.synapses:
-                                if syn.chan_type == 'ampa':
-                                    syn.stims.append(stim)
-                                    
-                        elif stim.chan_type == 'nmda':# more than one stim
-                            for syn in spine.synapses:
-                                if syn.chan_type == 'nmda':
-                                    syn.stims.append(stim)
-                           
-                        stims_time = stim.get_stims_time()
-                        excitatory_stimuli.extend(stims_time)
-                    else:
-                        logger.info("No stim applied to spine: %s" %spine_id)
-                    
-                spine.deploy_stims(self.param['neuron_time_recording_interval'])
-                if self.param['bio_on']:
-                    spine.setup_bio_sim() # Initializing ecell
+        for spine in self.get_input_spines(nrnManager):
+            spine_id = spine.id
+            for stim_id in self.param[spine.id]:
+                stim_dictionary = self.param[stim_id]
                 
+                if stim_dictionary.has_key('t_stim'):
+                    stim = Stimul((stim_dictionary['t_stim']), 
+                                  stim_dictionary['numbers'], 
+                                  stim_dictionary['delay'], 
+                                  stim_dictionary['type'])   
+                    if stim.chan_type == 'ampa':
+                        for syn in spine.synapses:
+                            if syn.chan_type == 'ampa':
+                                syn.stims.append(stim)
+                                
+                    elif stim.chan_type == 'nmda':# more than one stim
+                        for syn in spine.synapses:
+                            if syn.chan_type == 'nmda':
+                                syn.stims.append(stim)
+                       
+                    stims_time = stim.get_stims_time()
+                    excitatory_stimuli.extend(stims_time)
+                else:
+                    logger.info("No stim applied to spine: %s" %spine_id)
         
         excitatory_stimuli = list(set(excitatory_stimuli))
         excitatory_stimuli.sort()
         return excitatory_stimuli
     
+    def setup_bio_sim(self, nrnManager):
+        """
+        Initialize the biochemical simulator in the stimulated spines.
+        
+        The `bio_backend` param selects the simulator: 'ecell' (default) 
+        creates one E-Cell session per spine, 'batched' integrates all the 
+        spines together as one numpy system, 'nrn' inserts the biochemical 
+        mechanism in the spine heads and NEURON integrates it, 'pool' hosts 
+        the E-Cell sessions in `bio_workers` processes which advance in 
+        parallel.
+        """
+        spines = self.get_input_spines(nrnManager)
+        bio_backend = self.param.get('bio_backend', 'ecell')
+        if bio_backend == 'batched':
+            from ecellControl.batchedManager import BatchedEcellManager
+            self.batchedMan = BatchedEcellManager(self.param['biochemical_filename'], 
+                                                  len(spines))
+            for i, spine in enumerate(spines):
+                spine.setup_bio_sim(self.batchedMan.spine_manager(i))
+        elif bio_backend == 'pool':
+            from ecellControl.poolManager import PoolEcellManager
+            self.poolMan = PoolEcellManager(self.param['biochemical_filename'], 
+                                            len(spines),
+                                            self.param.get('bio_workers'))
+            for i, spine in enumerate(spines):
+                spine.setup_bio_sim(self.poolMan.spine_manager(i))
+        elif bio_backend == 'nrn':
+            from neuronControl.bioMechanism import BioMechanismManager, equilibrate
+            steady_state = self.param.get('equilibrium_mode', 'each') == 'steady_state'
+            size_n_a = equilibrate(self.param['biochemical_filename'],
+                                   self.param['t_equilibrium_ecell'],
+                                   steady_state)
+            # E-Cell time at NEURON time zero
+            time_offset = (self.param['t_equilibrium_ecell'] - 
+                           self.param['t_equilibrium_neuron'] / 1e3)
+            for spine in spines:
+                bioMan = BioMechanismManager(spine, size_n_a, time_offset, 
+                                             self.param['neuron_time_recording_interval'])
+                spine.setup_bio_sim(bioMan)
+        elif bio_backend == 'ecell':
+            for spine in spines:
+                spine.setup_bio_sim()
+        else:
+            raise ValueError("bio_backend %s not understood" %bio_backend)
+    
     def create_vectors(self):
         "Vectors to store the resutls"
         for sec in h.allsec():
@@ -153,102 +299,202 @@ class Runner():
                 else:
                     self.vecs[sec_name] = [vec]
     
-    def get_calcium_flux(self, spine):
-        """
-        Retrieving the calcium in the interval. end is always -1 because is
-        the last timepoint available, start is when the interval has begun
+    def get_calcium_flux(self, spine, delta_calcium_sampling=None):
         """
-        delta_calcium_sampling = self.param['delta_calcium_sampling']
+        Calcium flux [mM/ms] in the head of the spine over the interval 
+        since its last sync point, when the calcium was marked (see 
+        mark_calcium). The calcium is read from the head, so it does not 
+        depend on the recorded vectors.
         
-        ## We use the recorded interval instead of the dt, 'cause we are 
-        ## working directly with the time recording 
-#        start_index = -int(delta_calcium_sampling/ self.param['dtNeuron'])
-        start_index = -int(delta_calcium_sampling/ self.param['neuron_time_recording_interval'])
-        # Getting the calcium value
-        vec_spine_head_cai = self.manager.get_vector(spine.head, 'cai')
-        vec_spine_head_cali = self.manager.get_vector(spine.head, 'cali')
-        
-        head_cai = vec_spine_head_cai.x[start_index]
-        head_cali = vec_spine_head_cali.x[start_index]
-        electrical_ca_start = head_cai + head_cali
-        
-        head_cai = vec_spine_head_cai.x[-1]
-        head_cali = vec_spine_head_cali.x[-1]
-        electrical_ca_end = head_cai + head_cali
-        electrical_diff = electrical_ca_end - electrical_ca_start
-#        logger.debug( "Len vecs: %s start_idx: %s" %(len(vec_spine_head_cali), start_index))
-#        logger.debug( "Electrical calcium start: %s end: %s difference: %s" %(electrical_ca_start,
-#                                                                      electrical_ca_end,
-#                                                                      electrical_diff))
+        The interval [ms] is `delta_calcium_sampling` from the param if not 
+        given.
+        """
+        if delta_calcium_sampling is None:
+            delta_calcium_sampling = self.param['delta_calcium_sampling']
+        electrical_diff = spine.get_calcium() - spine.calcium_mark
         # Calculating the flux
         k_calcium_flux = electrical_diff / delta_calcium_sampling
         
         return k_calcium_flux
+    
+    def mark_calcium(self, spines):
+        """Mark the calcium of the spines at the current sync point"""
+        for spine in spines:
+            spine.mark_calcium()
 
     def equilibrium(self, nrnManager):
-        """Brings both NEURON and Ecell to equilibrium"""  
+        """Brings both NEURON and Ecell to equilibrium
+
+        With the `equilibrium_mode` param 'clone' and the 'ecell' backend
+        only the first stimulated spine is integrated from the initial
+        values. The spines have no input during the equilibrium, so the
+        values of the first spine are copied in the others, which are not 
+        integrated: their time courses are shifted to the same time (see 
+        EcellManager.set_equilibrium).
+        
+        If the `equilibrium_cache` param is a directory, the equilibrium 
+        is saved there and restored by the following runs with the same 
+        model (see helpers.equilibrium_cache). The E-Cell values are set 
+        in all the spines as in the clone mode, without integrating.
+        
+        With the `equilibrium_mode` 'steady_state' the resting steady state 
+        is solved from the reaction network (see ecellControl.steadyState) 
+        and set in the spines at t_equilibrium_ecell as the cached values, 
+        without integrating. If the steady state is not stable the spines 
+        are integrated as in the 'each' mode."""
         logger.info ("#--#")
         logger.info ("Equilibrium started.")
-        nrnManager.run(self.param['t_equilibrium_neuron'])
+        bio_backend = self.param.get('bio_backend', 'ecell')
+        steady_state = (self.param.get('equilibrium_mode', 'each') == 'steady_state' 
+                        and bio_backend != 'nrn') # solved in setup_bio_sim
+        cache = None
+        if self.param.get('equilibrium_cache'):
+            from helpers.equilibrium_cache import EquilibriumCache
+            cache = EquilibriumCache(self.param['equilibrium_cache'], self.param,
+                                     self.param['stimulated_spines'])
+        if cache is not None and cache.exists():
+            equilibrium_values = cache.restore(self.get_input_spines(nrnManager))
+            if equilibrium_values is None and bio_backend != 'nrn':
+                logger.warning("No biochemical values in the cache, integrating the equilibrium")
+        else:
+            nrnManager.run(self.param['t_equilibrium_neuron'])
+            equilibrium_values = None
+            if steady_state:
+                from ecellControl.steadyState import solve_steady_state
+                equilibrium_values = solve_steady_state(self.param['biochemical_filename'])
+        restored = equilibrium_values is not None
+        t_equilibrium_ecell = self.param['t_equilibrium_ecell']
+        if restored:
+            # The values are the equilibrium at t_equilibrium_ecell: the 
+            # sessions are set there without integrating them
+            for spine_id in self.param['stimulated_spines']:
+                spine = nrnManager.spines[spine_id]
+                spine.ecellMan.set_equilibrium(equilibrium_values, t_equilibrium_ecell)
+        clone = (self.param.get('equilibrium_mode', 'each') == 'clone' and
+                 bio_backend == 'ecell')
+        first_values = None
+        cloned_values = None
         for spine_id in self.param['stimulated_spines']:
             spine = nrnManager.spines[spine_id]
-            runner.advance_ecell(spine, self.param['t_equilibrium_ecell'])
+            if cloned_values is not None:
+                spine.ecellMan.set_equilibrium(cloned_values, t_equilibrium_ecell)
+            elif not restored:
+                self.advance_ecell(spine, t_equilibrium_ecell)
+            # The nrn backend keeps the biochemical state in NEURON (SaveState)
+            if first_values is None and not restored and bio_backend != 'nrn':
+                first_values = spine.ecellMan.ses.getVariableValues()
+                if clone and not restored:
+                    cloned_values = first_values
+                    logger.info("Equilibrium of %s cloned in the other spines" %spine_id)
             spine.set_ampa_equilibrium_baseline()
+            if bio_backend == 'nrn':
+                spine.ecellMan.drive_ampa(spine)
+        if cache is not None and not cache.exists():
+            cache.save(first_values)
         logger.info ("Equilibrium run finished. Starting normal simulation.")
         logger.info ("#--#")
     
     def main(self):
         logger.info ("#--#")
         logger.info ("Equilibrium run for the two simulators")
+        nrnManager, timeline = self.build_model()
+        
+        if self.param['bio_on']:
+            self.equilibrium(nrnManager)
+            self.run_simulation(nrnManager, timeline)
+        else:
+            # Only Electrical
+            tstop = self.param['t_equilibrium_neuron'] + self.param['tStop']
+            self.test_electrical_weight_change()
+        # Save the Results ------------------------------------
+        saving_dir = self.manager.create_new_dir(root='Data')
+        self.save_results(nrnManager, saving_dir)
+        self.plot_results(nrnManager, saving_dir)
+        if self.profiler is not None:
+            self.profiler.save(os.path.join(saving_dir, 'profile.json'))
+    
+    def build_model(self):
+        """Create the neuron with the spines, the inputs and the recordings 
+        and initialize NEURON. Return the NeuronManager and the 
+        StimulusTimeline of the inputs."""
         # Neuron Setup -----------------------------------------------------------
         nrnManager = NeuronManager(self.param['biochemical_filename'],
                                    self.param['big_spine'],
                                    self.param['dtNeuron'],
                                    spines_dist=self.param['spines_dist'],
                                    mod_path='mod', 
-                                   hoc_path='hoc')
+                                   hoc_path='hoc',
+                                   explicit_spines=self.get_explicit_spines(),
+                                   neighbour_distance=self.param.get('reduced_spines_neighbours', 0),
+                                   d_lambda=self.param.get('d_lambda'),
+                                   lambda_freq=self.param.get('d_lambda_freq', 100),
+                                   stimulated_spines=self.param['stimulated_spines'])
         # Easier to debug. 
         self.nrnManager = nrnManager
+        if self.profiler is not None:
+            self.profiler.instrument_neuron(nrnManager)
         
         nrnManager.set_kir_gkbar(self.param['kir_gkbar'])
 
-        excitatory_stims = self.create_excitatory_inputs(nrnManager)
+        timeline = self.create_excitatory_inputs(nrnManager)
         
-        logger.info ("This are the time of the stims: %s" %excitatory_stims)
+        logger.info ("This are the time of the stims: %s" %timeline.times)
     
         # Recording -----------------------------------------------
         # - Recording and stimul
         # - Set the stimuls to the synapses
         # - Initialize Ecell in each spine
         
-        # Threading it!
-        nrnManager.enable_threads(self.param['nthreads'], multisplit_on=False)
+        # Threading it! The cell is one tree: without multisplit all the 
+        # sections end up in the same thread.
+        nrnManager.enable_threads(self.param['nthreads'], 
+                                  multisplit_on=self.param.get('multisplit', False))
+        if self.param.get('integrator', 'fixed') == 'cvode':
+            self.enable_cvode(nrnManager)
         
         self.record_vectors(nrnManager)
         
         # Experiment ----------------------------------------------- 
         nrnManager.init() # Initializing neuron
+        return nrnManager, timeline
         
-        if self.param['bio_on']:
-            self.equilibrium(nrnManager)
-            self.run_simulation(nrnManager, excitatory_stims)
-        else:
-            # Only Electrical
-            tstop = self.param['t_equilibrium_neuron'] + self.param['tStop']
-            self.test_electrical_weight_change()
-        # Save the Results ------------------------------------
-        saving_dir = self.manager.create_new_dir(root='Data')
-        self.save_results(nrnManager, saving_dir)
-        self.plot_results(nrnManager, saving_dir)
-        
+    def enable_cvode(self, nrnManager):
+        """Integrate NEURON with CVode. The sync points have to be events: 
+        the 'while' sync_mode counts fixed steps. Not with the nrn backend: 
+        its mechanism divides the calcium entered in a step by dt, which 
+        is not the step taken under CVode."""
+        if self.param['bio_on'] and self.param.get('bio_backend', 'ecell') == 'nrn':
+            raise ValueError("The cvode integrator can't be used with the nrn bio_backend")
+        syncs_while = (self.param['bio_on'] and 
+                       self.param.get('sync_mode', 'while') == 'while' and
+                       self.param.get('sync_policy', 'fixed') == 'fixed')
+        if syncs_while:
+            raise ValueError("The cvode integrator needs the sync points as events: use the events or pipelined sync_mode")
+        local_dt = self.param.get('cvode_local_dt', False)
+        if local_dt and self.param.get('multisplit', False):
+            raise ValueError("cvode_local_dt can't be used with multisplit")
+        nrnManager.enable_cvode(self.param.get('cvode_atol', 1e-4), local_dt)
+    
+    def get_explicit_spines(self):
+        """With `reduced_spines` only the stimulated spines are created 
+        explicitly, the others are folded in the dendrites"""
+        if self.param.get('reduced_spines', False):
+            return self.param['stimulated_spines']
+        return None
+    
     def plot_results(self, nrnManager, saving_dir):
         for i, var in enumerate(self.param['var_to_plot']):
             secs = self.param['section_to_plot']
-            vecs_to_plot = self.build_vecs_to_plot(var, 
-                                                   secs, 
-                                                   self.manager.refs['VecRef'])
-            
-            self.manager.plot_vecs(vecs_to_plot, figure_num=i)
+            if self.recorder is None:
+                vecs_to_plot = self.build_vecs_to_plot(var, 
+                                                       secs, 
+                                                       self.manager.refs['VecRef'])
+                
+                self.manager.plot_vecs(vecs_to_plot, figure_num=i)
+            else:
+                # The vectors have been streamed to the file
+                vecs_to_plot, x = self.recorder.load('VecRef', secs, var)
+                self.manager.plot_vecs(vecs_to_plot, x=x, figure_num=i)
             
             if var == 'v':
                 plt.ylabel("Voltage [mV]")
@@ -311,15 +557,29 @@ class Runner():
                 self.manager.add_synVecRef(syn)    
 
 
-    def run_simulation(self, nrnManager, excitatory_stims):
+    def run_simulation(self, nrnManager, timeline):
 
         """
         Run the simulation. If input synchronizes the two simulators, 
         otherwise run each on its own and advance quickly
-            
+        
+        timeline - StimulusTimeline of the inputs. With `selective_sync` 
+        only the spines with an input in the window are synced, the others 
+        are advanced quickly.
         """
         # Processing the options
         tStop_final = self.param['tStop'] + self.param['t_equilibrium_neuron']        
+        selective_sync = self.param.get('selective_sync', False)
+        if selective_sync and self.param.get('sync_mode', 'while') == 'pipelined':
+            raise ValueError("selective_sync can't be used with the pipelined sync_mode")
+        
+        dt_coarse = self.param.get('dt_coarse')
+        if dt_coarse:
+            self.check_dt_coarse()
+        t_start = h.t
+        
+        if self.param.get('recording_flush_interval'):
+            self.start_streaming()
         
         # Getting the calcium before the stims
         for spine_id in self.param['stimulated_spines']:
@@ -328,27 +588,58 @@ class Runner():
             
         while h.t < tStop_final:
             
-            if excitatory_stims:
-                t_stim = excitatory_stims.pop(0)
+            window = timeline.next_window(h.t)
+            if window is not None:
+                t_stim, tmp_tstop, active_spine_ids = window
                 s_log = "Current Neuron time: %s. \
                 Current t_stim: %s, remaining input: %s" %(h.t, 
                                                            t_stim,
-                                                           len(excitatory_stims))
+                                                           len(timeline))
                 logger.debug( s_log)
                 
-                if h.t < t_stim:
-                    self.advance_quickly(t_stim, nrnManager)
-                    tmp_tstop = t_stim + self.param['t_buffer']
-                    self.synch_simulators(tmp_tstop, nrnManager)
+                self.advance_quickly(t_stim, nrnManager)
+                if selective_sync:
+                    self.active_spine_ids = active_spine_ids
+                self.synch_simulators(tmp_tstop, nrnManager)
+                self.advance_idle_spines(t_stim, nrnManager)
+                self.active_spine_ids = None
+                if self.recorder is not None:
+                    self.recorder.flush()
             else:
                 logger.debug( "No excitatory input remaining. Quickly to the end")
-                self.advance_quickly(tStop_final, nrnManager)
+                self.advance_quickly(tStop_final, nrnManager, 
+                                     before_input=False)
                 h.fadvance() # This is to force the latest step and avoid the infinite loop.
         
         # Recording last 
         for spine_id in self.param['stimulated_spines']:
             spine = nrnManager.spines[spine_id]
             self.update_synape_weight(spine)
+        if self.param.get('sync_policy', 'fixed') == 'adaptive':
+            logger.info("Calcium syncs: %d, %d saved compared with the fixed interval" 
+                        %(self.n_syncs, self.n_syncs_fixed - self.n_syncs))
+        t_total = h.t - t_start
+        self.t_fine = t_total - self.t_coarse
+        if dt_coarse and t_total > 0:
+            logger.info("Simulated time at dt_coarse %s: %.1f ms (%.1f%%), at dtNeuron: %.1f ms (%.1f%%)" 
+                        %(dt_coarse, self.t_coarse, 
+                          100. * self.t_coarse / t_total,
+                          self.t_fine, 100. * self.t_fine / t_total))
+    
+    def start_streaming(self):
+        """Stream the NEURON recordings to the HDF5 file during the run. 
+        The calcium flux is read from the spine heads, so the vectors are 
+        emptied at each flush."""
+        from helpers.streaming_recorder import StreamingRecorder
+        from helpers.storage import get_storage_options
+        recording_interval = self.param['neuron_time_recording_interval']
+        keep = 0
+        expectedrows = int((self.param['t_equilibrium_neuron'] + 
+                            self.param['tStop']) / recording_interval)
+        self.recorder = StreamingRecorder(self.manager, keep, expectedrows,
+                                          storage_options=get_storage_options(self.param))
+        if self.profiler is not None:
+            self.profiler.instrument_recorder(self.recorder)
     
     def save_results(self, nrnManager, saving_dir):
         """Saving both results"""
@@ -373,7 +664,14 @@ class Runner():
         filename = os.path.join(saving_dir, hdf_name)
         logger.info( "Results will be saved in %s" %filename)
         # Saving everything
-        self.manager.save_to_hdf(filename)
+        from helpers.storage import get_storage_options, is_default, save_to_hdf
+        storage_options = get_storage_options(self.param)
+        if self.recorder is not None:
+            self.recorder.close(filename)
+        elif is_default(storage_options):
+            self.manager.save_to_hdf(filename)
+        else:
+            save_to_hdf(self.manager, filename, storage_options)
         
     def synch_simulators(self, tmp_tstop, nrnManager):
         """
@@ -385,10 +683,31 @@ class Runner():
         NEURON and set this value in ecell.
         2. Advance ecell for the specified_delta
         3. Update the electric weight of the synapses in NEURON
+        
+        The `sync_mode` param selects how NEURON is advanced between two 
+        sync points: 'while' (default) steps NEURON from python, 'events' 
+        delivers the sync points as NEURON events, 'pipelined' overlaps 
+        NEURON and E-Cell. With `bio_backend` 'nrn' there is nothing to 
+        sync: NEURON runs with the spines coupled. The `sync_policy` 
+        'adaptive' syncs each spine at its own pace (as events).
         """
         logger.info ("Current time: %f Synchronizing sims till [ms] %s" %(h.t, tmp_tstop))
-        
-        stimulated_spines = self.param['stimulated_spines']
+        sync_mode = self.param.get('sync_mode', 'while')
+        self.mark_calcium(self.get_synced_spines(nrnManager))
+        if self.param.get('bio_backend', 'ecell') == 'nrn':
+            self.synch_simulators_nrn(tmp_tstop, nrnManager)
+        elif self.param.get('sync_policy', 'fixed') == 'adaptive':
+            self.synch_simulators_adaptive(tmp_tstop, nrnManager)
+        elif sync_mode == 'events':
+            self.synch_simulators_events(tmp_tstop, nrnManager)
+        elif sync_mode == 'pipelined':
+            self.synch_simulators_pipelined(tmp_tstop, nrnManager)
+        else:
+            self.synch_simulators_while(tmp_tstop, nrnManager)
+    
+    def synch_simulators_while(self, tmp_tstop, nrnManager):
+        """Synch the simulators advancing NEURON one dt at the time from 
+        python and checking at each step if a sync is due."""
         t_sync_start = h.t
         while h.t < tmp_tstop:
             h.fadvance() # run Neuron for step
@@ -405,18 +724,224 @@ class Runner():
 #                                                            h.t, 
 #                                                            upper_time))
             if lower_time <= h.t <= upper_time: 
-                for spine_id in stimulated_spines :
-                    spine = nrnManager.spines[spine_id]
-                    self.sync_calcium(spine)
-                    self.advance_ecell(spine, (h.t - t_sync_start) / 1e3)
-                    # Stopping flux from the input.
-                    spine.ecellMan.ca_in['k'] = 0
-                    # Re-enabling pump and leak. 
-                    spine.ecellMan.ca_leak['vmax'] = self.param['ca_leak_vmax']
-                    spine.ecellMan.ca_pump['vmax'] = self.param['ca_pump_vmax']
-                    self.update_synape_weight(spine)
+                self.sync_spines(t_sync_start, nrnManager)
                 t_sync_start = h.t # Resetting the t_start to the new NEURON time.
     
+    def synch_simulators_events(self, tmp_tstop, nrnManager):
+        """Synch the simulators registering every sync point as a NEURON 
+        event. NEURON integrates natively till tmp_tstop and python runs 
+        only in the event callback."""
+        delta_calcium_sampling = self.param['delta_calcium_sampling']
+        self.t_sync_start = h.t
+        scheduler = SyncScheduler(self.sync_event, nrnManager.dt)
+        scheduler.schedule(h.t, tmp_tstop, delta_calcium_sampling)
+        nrnManager.solve(tmp_tstop)
+        if h.t - self.t_sync_start >= delta_calcium_sampling - nrnManager.dt / 2.:
+            # The sync point on tmp_tstop is not delivered as event.  
+            self.sync_event()
+        logger.debug("Sync events delivered: %s" %scheduler.n_events)
+    
+    def synch_simulators_pipelined(self, tmp_tstop, nrnManager):
+        """Synch the simulators as in the events mode, overlapping them. 
+        At each sync point the workers of the pool backend start to 
+        integrate E-Cell over the interval just measured. With 
+        `pipeline_lag` 1 NEURON goes on over the next interval with the 
+        weight of the previous sync point, so the weight lags one 
+        `delta_calcium_sampling` behind the other modes and E-Cell catches 
+        up at tmp_tstop. With `pipeline_lag` 0 NEURON waits for the new 
+        weight: only the spines run in parallel, as in the events mode."""
+        if self.param.get('bio_backend', 'ecell') != 'pool':
+            raise ValueError("The pipelined sync_mode needs the pool bio_backend")
+        if self.param.get('pipeline_lag', 1) not in (0, 1):
+            raise ValueError("pipeline_lag must be 0 or 1 sync interval")
+        delta_calcium_sampling = self.param['delta_calcium_sampling']
+        self.t_sync_start = h.t
+        scheduler = SyncScheduler(self.pipelined_sync_event, nrnManager.dt)
+        scheduler.schedule(h.t, tmp_tstop, delta_calcium_sampling)
+        nrnManager.solve(tmp_tstop)
+        if h.t - self.t_sync_start >= delta_calcium_sampling - nrnManager.dt / 2.:
+            # The sync point on tmp_tstop is not delivered as event.  
+            self.pipelined_sync_event()
+        if self.param.get('pipeline_lag', 1):
+            self.collect_spines(nrnManager)
+        logger.debug("Sync events delivered: %s" %scheduler.n_events)
+    
+    def synch_simulators_adaptive(self, tmp_tstop, nrnManager):
+        """Synch each spine at its own pace, with the sync points delivered 
+        as NEURON events. After a sync the next one of the spine is set by 
+        next_sync_interval from its calcium flux, so the quiet spines are 
+        synced rarely and the active ones every `sync_interval_min`. All 
+        the spines are synced at tmp_tstop.
+        
+        Only the ecell backend: the other ones advance all the spines 
+        together."""
+        if self.param.get('bio_backend', 'ecell') != 'ecell':
+            raise ValueError("The adaptive sync_policy needs the ecell bio_backend")
+        t_min = self.param.get('sync_interval_min', 
+                               self.param['delta_calcium_sampling'])
+        self.sync_tstop = tmp_tstop
+        self.spines_sync = {}
+        for spine in self.get_synced_spines(nrnManager):
+            self.spines_sync[spine.id] = {'t_start' : h.t, 
+                                          't_next' : h.t + t_min, 
+                                          'k' : None}
+        self.sync_scheduler = SyncScheduler(self.adaptive_sync_event, nrnManager.dt)
+        self.sync_times = set()
+        self.schedule_sync(h.t + t_min)
+        n_fixed = int((tmp_tstop - h.t) / self.param['delta_calcium_sampling'] + 0.5)
+        self.n_syncs_fixed += n_fixed * len(self.spines_sync)
+        nrnManager.solve(tmp_tstop)
+        for spine_id, state in self.spines_sync.iteritems():
+            if h.t - state['t_start'] > nrnManager.dt / 2.:
+                self.sync_spine(nrnManager.spines[spine_id], state)
+    
+    def schedule_sync(self, t_sync):
+        """Register a sync event at t_sync, if there is not one already and 
+        it falls before the end of the window"""
+        dt = self.nrnManager.dt
+        key = round(t_sync / dt)
+        if t_sync <= self.sync_tstop - dt / 2. and key not in self.sync_times:
+            self.sync_times.add(key)
+            self.sync_scheduler.schedule_at(t_sync)
+    
+    def adaptive_sync_event(self):
+        """Callback of the adaptive sync events: sync the spines which are 
+        due and schedule their next sync."""
+        for spine_id, state in self.spines_sync.iteritems():
+            if state['t_next'] <= h.t + self.nrnManager.dt / 2.:
+                self.sync_spine(self.nrnManager.spines[spine_id], state)
+                self.schedule_sync(state['t_next'])
+    
+    def sync_spine(self, spine, state):
+        """Sync one spine over the interval since its last sync and set the 
+        time of the next one"""
+        interval = h.t - state['t_start']
+        k_ca_flux = self.get_calcium_flux(spine, interval)
+        spine.update_calcium(k_ca_flux)
+        self.advance_ecell(spine, interval / 1e3)
+        spine.mark_calcium()
+        self.stop_calcium_input(spine)
+        self.update_synape_weight(spine)
+        next_interval = self.next_sync_interval(k_ca_flux, state['k'], interval)
+        state['t_start'] = h.t
+        state['t_next'] = h.t + next_interval
+        state['k'] = k_ca_flux
+        self.n_syncs += 1
+    
+    def next_sync_interval(self, k_ca_flux, k_previous, interval):
+        """Interval [ms] to the next sync of a spine with flux `k_ca_flux` 
+        [mM/ms], which was `k_previous` one `interval` [ms] before.
+        
+        The calcium entering in the interval (k * dt) and the one misplaced 
+        in time by the change of the flux (dk/dt * dt^2 / 2) are kept 
+        within `sync_tolerance` [mM]. The interval is rounded to a multiple 
+        of dtNeuron, then clamped to the multiples within 
+        `sync_interval_min` and `sync_interval_max`. The flux is read from 
+        the heads, so the syncs don't depend on the recording interval."""
+        t_min = self.param.get('sync_interval_min', 
+                               self.param['delta_calcium_sampling'])
+        t_max = self.param.get('sync_interval_max', self.param['t_buffer'])
+        tolerance = self.param.get('sync_tolerance', 1e-5)
+        candidates = [t_max]
+        if k_ca_flux != 0:
+            candidates.append(tolerance / abs(k_ca_flux))
+        if k_previous is not None and k_ca_flux != k_previous:
+            rate = abs(k_ca_flux - k_previous) / interval
+            candidates.append(math.sqrt(2 * tolerance / rate))
+        dt = self.nrnManager.dt
+        # int(x / dt) would floor 0.3 / 0.1 = 2.99... to 2
+        n_steps = int(round(min(candidates) / dt))
+        n_min = max(1, int(math.ceil(t_min / dt - 1e-6)))
+        n_max = max(n_min, int(math.floor(t_max / dt + 1e-6)))
+        return max(n_min, min(n_steps, n_max)) * dt
+    
+    def pipelined_sync_event(self):
+        """Callback of the pipelined sync events: measure the calcium, 
+        collect the interval E-Cell was integrating and start the next one 
+        in background. Without lag the interval just started is collected 
+        at once."""
+        nrnManager = self.nrnManager
+        lag = self.param.get('pipeline_lag', 1)
+        spines = self.get_synced_spines(nrnManager)
+        k_ca_fluxes = [self.get_calcium_flux(spine) for spine in spines]
+        self.mark_calcium(spines)
+        if lag:
+            self.collect_spines(nrnManager)
+        for spine, k_ca_flux in zip(spines, k_ca_fluxes):
+            spine.update_calcium(k_ca_flux)
+        self.poolMan.start_run((h.t - self.t_sync_start) / 1e3)
+        self.t_sync_start = h.t
+        if not lag:
+            self.collect_spines(nrnManager)
+    
+    def collect_spines(self, nrnManager):
+        """Wait for the interval E-Cell is integrating, stop the flux from 
+        the input and update the weights"""
+        self.poolMan.wait()
+        for spine in self.get_synced_spines(nrnManager):
+            self.stop_calcium_input(spine)
+            self.update_synape_weight(spine)
+    
+    def synch_simulators_nrn(self, tmp_tstop, nrnManager):
+        """With the nrn backend the calcium enters the biochemical mechanism 
+        at every step and the AMPA reads the weight from it: NEURON runs 
+        till tmp_tstop with the spines coupled."""
+        spines = self.get_synced_spines(nrnManager)
+        for spine in spines:
+            spine.ecellMan.set_coupled(True)
+        nrnManager.solve(tmp_tstop)
+        for spine in spines:
+            spine.ecellMan.set_coupled(False)
+            self.update_synape_weight(spine)
+    
+    def get_synced_spines(self, nrnManager):
+        """The stimulated spines synced in the current window: all of them, 
+        or with `selective_sync` only the ones with an input in the window"""
+        spine_ids = self.param['stimulated_spines']
+        if self.active_spine_ids is not None:
+            spine_ids = [spine_id for spine_id in spine_ids 
+                         if spine_id in self.active_spine_ids]
+        return [nrnManager.spines[spine_id] for spine_id in spine_ids]
+    
+    def advance_idle_spines(self, t_window_start, nrnManager):
+        """Advance E-Cell in one go over the window, from `t_window_start` 
+        to the current NEURON time, in the stimulated spines left out of the 
+        sync, as advance_quickly does."""
+        synced_ids = [spine.id for spine in self.get_synced_spines(nrnManager)]
+        for spine_id in self.param['stimulated_spines']:
+            if spine_id not in synced_ids:
+                spine = nrnManager.spines[spine_id]
+                self.advance_ecell(spine, (h.t - t_window_start) / 1e3)
+                self.update_synape_weight(spine)
+    
+    def sync_event(self):
+        """Callback of the sync events."""
+        self.sync_spines(self.t_sync_start, self.nrnManager)
+        self.t_sync_start = h.t
+    
+    def sync_spines(self, t_sync_start, nrnManager):
+        """Sync the calcium of all the stimulated spines, advance ecell from 
+        `t_sync_start` to the current NEURON time and update the weights."""
+        spines = self.get_synced_spines(nrnManager)
+        # All the fluxes are set before advancing, so a batched backend 
+        # advances all the spines with the new calcium.
+        for spine in spines:
+            self.sync_calcium(spine)
+        self.mark_calcium(spines)
+        for spine in spines:
+            self.advance_ecell(spine, (h.t - t_sync_start) / 1e3)
+        for spine in spines:
+            self.stop_calcium_input(spine)
+            self.update_synape_weight(spine)
+    
+    def stop_calcium_input(self, spine):
+        """Stop the flux from the input and re-enable pump and leak"""
+        # Stopping flux from the input.
+        spine.ecellMan.ca_in['k'] = 0
+        # Re-enabling pump and leak. 
+        spine.ecellMan.ca_leak['vmax'] = self.param['ca_leak_vmax']
+        spine.ecellMan.ca_pump['vmax'] = self.param['ca_pump_vmax']
+    
     def sync_calcium(self, spine):
         """"
         Calculate the flux of the calcium in the spine_head and synch 
@@ -443,7 +968,9 @@ class Runner():
             if syn.chan_type == 'ampa':                       
             # Retrieve the value of the weight.
                 weight = spine.ecellMan.ampar_P['Value']/spine.ampa_equilibrium_conc
-                syn.netCon.weight[0] = weight
+                if self.param.get('bio_backend', 'ecell') != 'nrn':
+                    # The nrn backend sets the weight in the AMPA directly
+                    syn.netCon.weight[0] = weight
                 # The weight of the ampa is a double list
                 # Check the specs in synapse weight for more info. 
                 syn.weight[0].append(h.t)